@@ -0,0 +1,84 @@
+"""Disk size and read time of plain vs. archived (gzip / zstd) daily log files.
+
+Writes one synthetic day of logs (--ticks-per-day ticks of average, max and storage
+lines) with its LogTimeIndex, then for the plain file and for each LogArchive
+compression times a full read (LogManager.iter_log_lines) and indexed time-range
+queries (LogManager.get_logs_for_time_range). zstd is skipped unless the zstandard
+package is installed.
+
+Usage: python benchmarks/bench_log_archive.py [--ticks-per-day 86400]
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import os
+import shutil
+import tempfile
+
+from common import time_call, print_table
+from bench_time_index import DAY, write_day
+
+import ver8
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ticks-per-day', type=int, default=86400)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    
+    ranges = {
+        "narrow 14:00-14:05": (datetime.datetime.combine(DAY, datetime.time(14, 0)),
+                               datetime.datetime.combine(DAY, datetime.time(14, 5))),
+        "wide 06:00-18:00": (datetime.datetime.combine(DAY, datetime.time(6, 0)),
+                             datetime.datetime.combine(DAY, datetime.time(18, 0))),
+    }
+    compressions = [None, 'gzip'] + (['zstd'] if ver8.zstandard is not None else [])
+    
+    cwd = os.getcwd()
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                manager = ver8.LogManager()
+            log_path = manager.get_log_file(DAY)
+            write_day(log_path, args.ticks_per_day)
+            ver8.LogTimeIndex.rebuild(log_path)
+            shutil.copyfile(log_path, log_path + '.orig')
+            lines = None
+            
+            for compression in compressions:
+                if compression:
+                    for name in os.listdir(manager.daily_logs_dir):
+                        if '.logs.' in name and not name.endswith(('.idx', '.orig')):
+                            os.remove(os.path.join(manager.daily_logs_dir, name))
+                    shutil.copyfile(log_path + '.orig', log_path)
+                    compress_seconds, (_, size) = time_call(lambda: ver8.LogArchive(log_path).compress(compression),
+                                                            repeat=1)
+                else:
+                    compress_seconds, size = 0.0, os.path.getsize(log_path)
+                
+                read_seconds, count = time_call(lambda: sum(1 for _ in manager.iter_log_lines(log_path)),
+                                                repeat=args.repeat)
+                lines = lines or count
+                assert count == lines, "archived file returned different lines"
+                row = [compression or "plain", f"{size / 1e6:.2f}", f"{compress_seconds:.2f}",
+                       f"{read_seconds * 1e3:.0f}"]
+                for start, end in ranges.values():
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        query_seconds, _ = time_call(lambda: manager.get_logs_for_time_range(start, end),
+                                                     repeat=args.repeat)
+                    row.append(f"{query_seconds * 1e3:.1f}")
+                rows.append(row)
+            manager.close()
+        finally:
+            os.chdir(cwd)
+    
+    print_table(f"One day of logs ({lines:,} lines)",
+                ["file", "MB on disk", "compress s", "full read ms"] + [f"{name} ms" for name in ranges], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""Memory and latency of the virtualized log view's row sources.
+
+Writes --days synthetic days of logs (--ticks-per-day ticks of average, max and
+storage lines) into a temporary "Daily logs" folder and compares loading the whole
+range as a list (what the log windows used to hold) with indexing it as LogFileRows:
+peak traced memory, load time, and the time to read one screen of rows or jump to
+a time.
+
+Usage: python benchmarks/bench_log_rows.py [--days 4] [--ticks-per-day 86400]
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import os
+import random
+import tempfile
+import tracemalloc
+
+from common import time_call, print_table
+from bench_time_index import write_day
+
+import ver8
+
+FIRST_DAY = datetime.date(2025, 1, 1)
+SCREEN_ROWS = 45
+
+
+def traced(func):
+    """(peak traced MB, seconds, result) of func(); tracing slows it down, so it is timed separately"""
+    seconds, _ = time_call(func, repeat=1)
+    tracemalloc.start()
+    try:
+        result = func()
+        return tracemalloc.get_traced_memory()[1] / 1e6, seconds, result
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--days', type=int, default=4)
+    parser.add_argument('--ticks-per-day', type=int, default=86400)
+    parser.add_argument('--pages', type=int, default=200)
+    args = parser.parse_args()
+    
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                manager = ver8.LogManager()
+            for offset in range(args.days):
+                write_day(manager.get_log_file(FIRST_DAY + datetime.timedelta(days=offset)), args.ticks_per_day)
+            start = datetime.datetime.combine(FIRST_DAY, datetime.time())
+            end = start + datetime.timedelta(days=args.days) - datetime.timedelta(seconds=1)
+            
+            def load_list():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    return manager.get_logs_for_time_range(start, end)
+            
+            def load_rows():
+                rows = manager.get_log_rows_for_time_range(start, end)
+                rows.scan()
+                return rows
+            
+            list_mb, list_seconds, lines = traced(load_list)
+            rows_mb, rows_seconds, rows = traced(load_rows)
+            assert len(rows) == len(lines), "row count differs from the list"
+            
+            random.seed(1)
+            pages = [random.randrange(len(rows) - SCREEN_ROWS) for _ in range(args.pages)]
+            assert all(rows.lines(page, page + SCREEN_ROWS) == lines[page:page + SCREEN_ROWS] for page in pages[:20])
+            page_seconds, _ = time_call(lambda: [rows.lines(page, page + SCREEN_ROWS) for page in pages], repeat=3)
+            
+            stamps = [lines[page][1:20] for page in pages[:50]]
+            jump_seconds, _ = time_call(lambda: [rows.find_time(stamp) for stamp in stamps], repeat=3)
+            manager.close()
+        finally:
+            os.chdir(cwd)
+    
+    print_table(f"Log view rows ({len(lines):,} lines over {args.days} days)",
+                ["source", "peak MB", "load s", "screen read ms", "jump to time ms"],
+                [("list of lines", f"{list_mb:.1f}", f"{list_seconds:.2f}", "-", "-"),
+                 ("LogFileRows", f"{rows_mb:.2f}", f"{rows_seconds:.2f}",
+                  f"{page_seconds / len(pages) * 1e3:.2f}", f"{jump_seconds / len(stamps) * 1e3:.2f}")])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Compare log persistence strategies for LogManager.
+  
+  thread-per-line  the old _write_to_file: one Thread per line, reopening the file
+  writer           ver8.LogWriter: one thread, bounded queue, open handle, batched flushes
+
+Throughput writes --lines lines as fast as possible and counts until everything is
+on disk. Latency runs --ticks ticks of --lines-per-tick lines (like the monitor's
+average, max and storage lines) every --tick-ms and measures from the call until
+the line has been flushed to the file.
+
+Usage: python benchmarks/bench_log_writer.py [--lines 20000] [--ticks 300] [--tick-ms 10]
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from common import print_table
+
+import ver8
+
+
+def percentiles(values, points=(50, 95, 99)):
+    values = sorted(values)
+    return [values[min(len(values) - 1, int(len(values) * p / 100))] for p in points]
+
+
+def run_thread_per_line(path, batches, pause):
+    latencies = []
+    lock = threading.Lock()
+    
+    def write(line, queued):
+        with open(path, 'a', encoding='utf-8', errors='replace') as f:
+            f.write(line + "\n")
+        with lock:
+            latencies.append(time.time() - queued)
+    
+    start = time.perf_counter()
+    threads = []
+    for batch in batches:
+        for line in batch:
+            thread = threading.Thread(target=write, args=(line, time.time()), daemon=True)
+            thread.start()
+            threads.append(thread)
+        if pause:
+            time.sleep(pause)
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, latencies, 0
+
+
+class TimedLogWriter(ver8.LogWriter):
+    """LogWriter that records when each line reaches the file"""
+    def __init__(self, *args, **kwargs):
+        self.latencies = []
+        self._unflushed = []
+        super().__init__(*args, **kwargs)
+    
+    def _write_line(self, timestamp, line):
+        super()._write_line(timestamp, line)
+        self._unflushed.append(timestamp)
+    
+    def _flush(self):
+        super()._flush()
+        now = time.time()
+        self.latencies.extend(now - queued for queued in self._unflushed)
+        self._unflushed.clear()
+
+
+def run_writer(directory, batches, pause, **options):
+    writer = TimedLogWriter(lambda day: os.path.join(directory, f"writer_{day}.logs"),
+                            max_queue=sum(len(batch) for batch in batches), **options)
+    start = time.perf_counter()
+    for batch in batches:
+        for line in batch:
+            writer.write(line)
+        if pause:
+            time.sleep(pause)
+    writer.close(timeout=60)
+    return time.perf_counter() - start, writer.latencies, writer.dropped
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--lines', type=int, default=20000)
+    parser.add_argument('--ticks', type=int, default=300)
+    parser.add_argument('--lines-per-tick', type=int, default=3)
+    parser.add_argument('--tick-ms', type=float, default=10.0)
+    args = parser.parse_args()
+    
+    def line(i):
+        return f"[2025-01-01 12:00:00] Max Temperature: {28 + i % 7 * 0.5}°C"
+    
+    burst = [[line(i) for i in range(args.lines)]]
+    paced = [[line(i) for i in range(args.lines_per_tick)] for _ in range(args.ticks)]
+    
+    strategies = [
+        ("thread-per-line", lambda directory, batches, pause:
+            run_thread_per_line(os.path.join(directory, "legacy.logs"), batches, pause)),
+        ("writer, flush every batch", lambda directory, batches, pause:
+            run_writer(directory, batches, pause, flush_interval=0)),
+        ("writer, flush every 1 s", lambda directory, batches, pause:
+            run_writer(directory, batches, pause, flush_interval=1.0)),
+        ("writer, flush + fsync", lambda directory, batches, pause:
+            run_writer(directory, batches, pause, flush_interval=0, fsync=True)),
+    ]
+    
+    rows = []
+    for name, run in strategies:
+        with tempfile.TemporaryDirectory() as directory:
+            seconds, _, dropped = run(directory, burst, 0)
+            _, latencies, _ = run(directory, paced, args.tick_ms / 1000)
+        p50, p95, p99 = percentiles(latencies)
+        rows.append((name, f"{args.lines / seconds:,.0f}", dropped,
+                     f"{p50 * 1e3:.2f}", f"{p95 * 1e3:.2f}", f"{p99 * 1e3:.2f}"))
+    
+    print_table(f"Log writer ({args.lines} line burst; {args.ticks} ticks x {args.lines_per_tick} lines "
+                f"every {args.tick_ms:g} ms for latency)",
+                ["strategy", "lines/s", "dropped", "p50 ms", "p95 ms", "p99 ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
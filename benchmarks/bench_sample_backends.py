@@ -0,0 +1,110 @@
+"""Ingest rate and range-query latency of the text, binary and SQLite sample backends.
+
+Logs --ticks synthetic ticks (average, max and two storage devices, one tick per
+second from midnight) into a temporary "Daily logs" folder per backend:
+  text    .logs lines through the LogWriter thread (text_logs on, the default)
+  binary  SampleStore daily segment files
+  sqlite  SQLiteSampleStore (WAL, batched writer thread)
+then times LogManager.get_logs_for_time_range (text lines, rendered from the store
+when text_logs is off) and, for the sample stores, get_samples_for_time_range for
+a narrow and a wide range.
+
+Usage: python benchmarks/bench_sample_backends.py [--ticks 86400]
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import os
+import tempfile
+import time
+
+from common import time_call, print_table
+
+import ver8
+
+DAY = datetime.date(2025, 1, 1)
+DEVICES = ('Samsung SSD 870', 'WD Red')
+
+
+def ticks(count):
+    start = datetime.datetime.combine(DAY, datetime.time()).timestamp()
+    for tick in range(count):
+        temp = 27 + (tick % 50) / 10
+        yield start + tick, temp
+
+
+def ingest_text(manager, count):
+    for timestamp, temp in ticks(count):
+        stamp = datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+        manager.writer.write(f"[{stamp}] Average Temperature: {temp - 1:.1f}°C", timestamp)
+        manager.writer.write(f"[{stamp}] Max Temperature: {temp:.1f}°C", timestamp)
+        manager.writer.write(f"[{stamp}] Storage temperatures: {DEVICES[0]}: {temp:.1f}°C, "
+                             f"{DEVICES[1]}: {temp - 2:.1f}°C", timestamp)
+    manager.writer.flush(timeout=None)
+
+
+def ingest_samples(manager, count):
+    store = manager.sample_store
+    for timestamp, temp in ticks(count):
+        store.append('Average Temperature', temp - 1, timestamp=timestamp)
+        store.append('Max Temperature', temp, timestamp=timestamp)
+        store.append_many([(ver8.SampleStore.STORAGE_METRIC, DEVICES[0], temp),
+                           (ver8.SampleStore.STORAGE_METRIC, DEVICES[1], temp - 2)], timestamp)
+    if hasattr(store, 'flush'):
+        store.flush(timeout=None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ticks', type=int, default=86400)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    
+    midnight = datetime.datetime.combine(DAY, datetime.time())
+    ranges = {"narrow 5 min": (midnight + datetime.timedelta(hours=14),
+                               midnight + datetime.timedelta(hours=14, minutes=5)),
+              "wide 12 h": (midnight + datetime.timedelta(hours=6), midnight + datetime.timedelta(hours=18))}
+    backends = (("text", 'binary', True, ingest_text),
+                ("binary", 'binary', False, ingest_samples),
+                ("sqlite", 'sqlite', False, ingest_samples))
+    
+    ingest_rows, query_rows = [], []
+    cwd = os.getcwd()
+    for name, backend, text_logs, ingest in backends:
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    manager = ver8.LogManager(backend)
+                manager.text_logs = text_logs
+                # The real monitor logs once a second; let the benchmark outrun the bounded queue
+                manager.writer.close()
+                manager.writer = ver8.LogWriter(manager.get_log_file, max_queue=0)
+                
+                start = time.perf_counter()
+                ingest(manager, args.ticks)
+                seconds = time.perf_counter() - start
+                ingest_rows.append((name, f"{args.ticks / seconds:,.0f}", f"{seconds:.2f}"))
+                
+                for range_name, (range_start, range_end) in ranges.items():
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        log_seconds, logs = time_call(
+                            lambda: manager.get_logs_for_time_range(range_start, range_end), repeat=args.repeat)
+                    sample_ms = "-"
+                    if not text_logs:
+                        sample_seconds, _ = time_call(
+                            lambda: manager.get_samples_for_time_range(range_start, range_end), repeat=args.repeat)
+                        sample_ms = f"{sample_seconds * 1e3:.1f}"
+                    query_rows.append((name, range_name, f"{len(logs):,}", f"{log_seconds * 1e3:.1f}", sample_ms))
+                with contextlib.redirect_stdout(io.StringIO()):
+                    manager.close()
+            finally:
+                os.chdir(cwd)
+    
+    print_table(f"Ingest ({args.ticks:,} ticks of 4 readings)", ["backend", "ticks/s", "seconds"], ingest_rows)
+    print_table("Range queries", ["backend", "range", "log lines", "log lines ms", "samples ms"], query_rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""Long-range graph queries from raw samples vs. the 1m/1h/1d sample rollups.
+
+Writes --days synthetic sample segments (average, max and two storage devices per
+tick) straight into a temporary "Daily logs" folder, builds the rollup tiers with
+LogManager.rebuild_rollups() and times LogManager.get_samples_for_time_range for the
+whole range, a week and a day: once reading every sample and once with
+max_points=2000 as the history graph does (rollup tier, then min/max decimated to
+at most 2000 points).
+
+Usage: python benchmarks/bench_sample_rollups.py [--days 90] [--ticks-per-day 17280]
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import os
+import tempfile
+
+import numpy as np
+
+from common import time_call, print_table
+
+import ver8
+
+FIRST_DAY = datetime.date(2025, 1, 1)
+MAX_POINTS = 2000
+
+
+def write_segments(manager, days, ticks):
+    store = manager.sample_store
+    series = [(store.metric_id('Average Temperature'), store.device_id('')),
+              (store.metric_id('Max Temperature'), store.device_id('')),
+              (store.metric_id(ver8.SampleStore.STORAGE_METRIC), store.device_id('Samsung SSD 870')),
+              (store.metric_id(ver8.SampleStore.STORAGE_METRIC), store.device_id('WD Red'))]
+    rng = np.random.default_rng(0)
+    for offset in range(days):
+        day = FIRST_DAY + datetime.timedelta(days=offset)
+        start_ms = int(datetime.datetime.combine(day, datetime.time()).timestamp() * 1000)
+        ts = start_ms + np.arange(ticks, dtype=np.int64) * (86400000 // ticks)
+        base = 27 + 3 * np.sin(np.arange(ticks) * 2 * np.pi / ticks) + rng.normal(0, 0.3, ticks)
+        records = np.empty(ticks * len(series), dtype=ver8.SampleStore.DTYPE)
+        for i, (metric, device) in enumerate(series):
+            part = records[i::len(series)]
+            part['ts'] = ts
+            part['metric'] = metric
+            part['device'] = device
+            part['value'] = base + i - 1
+        records.tofile(store.segment_path(day))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--days', type=int, default=90)
+    parser.add_argument('--ticks-per-day', type=int, default=17280)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    
+    start = datetime.datetime.combine(FIRST_DAY, datetime.time())
+    end = start + datetime.timedelta(days=args.days) - datetime.timedelta(seconds=1)
+    ranges = {f"{args.days} days": start, "7 days": end - datetime.timedelta(days=7),
+              "1 day": end - datetime.timedelta(days=1)}
+    
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                manager = ver8.LogManager()
+            write_segments(manager, args.days, args.ticks_per_day)
+            with contextlib.redirect_stdout(io.StringIO()):
+                rebuild_seconds, _ = time_call(manager.rebuild_rollups, repeat=1)
+            
+            rows = []
+            for name, range_start in ranges.items():
+                raw_seconds, raw = time_call(
+                    lambda: manager.get_samples_for_time_range(range_start, end), repeat=args.repeat)
+                rollup_seconds, rolled = time_call(
+                    lambda: manager.get_samples_for_time_range(range_start, end, max_points=MAX_POINTS),
+                    repeat=args.repeat)
+                tier = manager.sample_store.rollups.tier_for((end - range_start).total_seconds() / MAX_POINTS)
+                assert np.isclose(raw[1].max(), rolled[1].max()), "rollup max differs from the raw samples"
+                assert len(rolled[0]) <= MAX_POINTS, "graph data exceeds max_points"
+                rows.append((name, tier.name if tier else "raw", f"{len(raw[0]):,}", f"{len(rolled[0]):,}",
+                             f"{raw_seconds * 1e3:.1f}", f"{rollup_seconds * 1e3:.1f}",
+                             f"{raw_seconds / rollup_seconds:.1f}x"))
+            manager.close()
+        finally:
+            os.chdir(cwd)
+    
+    print_table(f"Max Temperature graph data ({args.days} days x {args.ticks_per_day:,} ticks, "
+                f"rollups rebuilt in {rebuild_seconds:.1f} s)",
+                ["range", "tier", "raw points", "graph points", "raw ms", "rollup ms", "speedup"], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""Graph series from text logs: per-line str parsing vs. the mmap + NumPy LogSampleScanner.
+
+Writes one synthetic day of logs (--lines lines of average, max and storage readings)
+and extracts the Max Temperature series for the whole day three ways, each in a fresh
+process so peak RSS is measured separately:
+  list     get_logs_for_time_range + SearchResultModal.load_series (a str per line)
+  rows     get_log_rows_for_time_range (what the search window holds) + load_series
+  scanner  LogManager.get_text_samples_for_time_range (NumPy arrays, no str per line)
+All three keep only the Max Temperature readings, so their point counts match.
+Peak RSS needs the resource module (Unix) or psutil's peak_wset (Windows).
+
+Usage: python benchmarks/bench_text_samples.py [--lines 1000000]
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from common import print_table
+from bench_time_index import DAY, write_day
+
+import ver8
+
+VARIANTS = ('list', 'rows', 'scanner')
+
+
+def peak_rss_mb():
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+    except ImportError:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / 1e6
+
+
+def modal_series(logs):
+    """SearchResultModal.load_series over text rows, without a Tk window"""
+    modal = ver8.SearchResultModal.__new__(ver8.SearchResultModal)
+    modal.logs = logs
+    modal.samples = None
+    modal.series = None
+    return modal.load_series()[1]
+
+
+def run_variant(variant):
+    """Runs in the benchmark's temporary directory; prints a JSON result line"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager = ver8.LogManager()
+    start = datetime.datetime.combine(DAY, datetime.time())
+    end = datetime.datetime.combine(DAY, datetime.time(23, 59, 59))
+    baseline = peak_rss_mb()
+    
+    began = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if variant == 'list':
+            values = modal_series(manager.get_logs_for_time_range(start, end))
+        elif variant == 'rows':
+            rows = manager.get_log_rows_for_time_range(start, end)
+            rows.scan()
+            values = modal_series(rows)
+        else:
+            values = manager.get_text_samples_for_time_range(start, end)[1]
+    seconds = time.perf_counter() - began
+    
+    print(json.dumps({'seconds': seconds, 'peak_mb': peak_rss_mb() - baseline, 'points': len(values),
+                      'checksum': float(np.sum(values))}))
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--lines', type=int, default=1000000)
+    parser.add_argument('--variant', choices=VARIANTS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.variant:
+        run_variant(args.variant)
+        return
+    
+    with tempfile.TemporaryDirectory() as directory:
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                manager = ver8.LogManager()
+                log_path = manager.get_log_file(DAY)
+                manager.close()
+            write_day(log_path, -(-args.lines // 3))
+            ver8.LogTimeIndex.rebuild(log_path)
+            size_mb = os.path.getsize(log_path) / 1e6
+        finally:
+            os.chdir(cwd)
+        
+        results = {}
+        for variant in VARIANTS:
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), '--variant', variant],
+                                    cwd=directory, capture_output=True, text=True, check=True).stdout
+            results[variant] = json.loads(output.strip().splitlines()[-1])
+    
+    rows = [(variant, f"{result['points']:,}", f"{result['seconds']:.2f}", f"{result['peak_mb']:.0f}",
+             f"{results['list']['seconds'] / result['seconds']:.1f}x") for variant, result in results.items()]
+    print_table(f"Max Temperature series from {args.lines:,} lines ({size_mb:.0f} MB)",
+                ["path", "points", "seconds", "peak RSS MB over baseline", "speedup"], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Compare threshold-colored segmentation of a temperature series.
+  
+  loop        per-sample Python loop calling get_temperature_color (legacy)
+  vectorized  ver8.threshold_segments (np.digitize + np.diff run boundaries)
+
+The series is a seeded random walk around the warning threshold so it crosses
+levels often, which is the worst case for both versions.
+
+Usage: python benchmarks/bench_threshold_segments.py [--sizes 10000 100000 1000000]
+"""
+import argparse
+
+import numpy as np
+
+from common import time_call, print_table
+
+import ver8
+
+WARNING_TEMP = 27
+CRITICAL_TEMP = 30
+
+
+def temperature_color(temperature, critical_temp, warning_temp):
+    if temperature >= critical_temp:
+        return 'red'
+    elif temperature >= warning_temp:
+        return 'yellow'
+    return 'blue'
+
+
+def loop_segments(times, temperatures):
+    """The dict-of-lists segmentation update_graph and SearchResultModal used before"""
+    segments = []
+    current = {'times': [times[0]], 'temps': [temperatures[0]],
+               'color': temperature_color(temperatures[0], CRITICAL_TEMP, WARNING_TEMP)}
+    for i in range(1, len(times)):
+        color = temperature_color(temperatures[i], CRITICAL_TEMP, WARNING_TEMP)
+        if color == current['color']:
+            current['times'].append(times[i])
+            current['temps'].append(temperatures[i])
+        else:
+            segments.append(current)
+            current = {'times': [times[i]], 'temps': [temperatures[i]], 'color': color}
+    segments.append(current)
+    return segments
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(42)
+    rows = []
+    for size in args.sizes:
+        times = np.arange(size, dtype=float) * 2.0
+        temperatures = np.clip(27 + np.cumsum(rng.normal(0, 0.15, size)), 18, 40)
+        times_list, temperatures_list = times.tolist(), temperatures.tolist()
+        
+        loop_seconds, loop_result = time_call(lambda: loop_segments(times_list, temperatures_list),
+                                              repeat=args.repeat)
+        vector_seconds, runs = time_call(
+            lambda: ver8.threshold_segments(times, temperatures, WARNING_TEMP, CRITICAL_TEMP),
+            repeat=args.repeat)
+        
+        rows.append((f"{size:,}", len(runs.segments),
+                     f"{loop_seconds * 1e3:.1f}", f"{vector_seconds * 1e3:.1f}",
+                     f"{loop_seconds / vector_seconds:.1f}x"))
+    
+    print_table("Threshold segmentation (best of %d)" % args.repeat,
+                ["samples", "runs", "loop ms", "vectorized ms", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Time-range log queries with and without the LogTimeIndex sidecar.
+
+Writes one synthetic day of logs (--ticks-per-day ticks of average, max and storage
+lines) into a temporary "Daily logs" folder and times LogManager.get_logs_for_time_range
+for a narrow (5 minute) and a wide (12 hour) range, before and after
+LogTimeIndex.rebuild().
+
+Usage: python benchmarks/bench_time_index.py [--ticks-per-day 86400]
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import os
+import tempfile
+
+from common import time_call, print_table
+
+import ver8
+
+DAY = datetime.date(2025, 1, 1)
+
+
+def write_day(path, ticks):
+    start = datetime.datetime.combine(DAY, datetime.time())
+    step = 86400 / ticks
+    with open(path, 'w', encoding='utf-8') as f:
+        for tick in range(ticks):
+            stamp = (start + datetime.timedelta(seconds=int(tick * step))).strftime("%Y-%m-%d %H:%M:%S")
+            temp = 27 + (tick % 50) / 10
+            f.write(f"[{stamp}] Average Temperature: {temp - 1:.1f}°C\n"
+                    f"[{stamp}] Max Temperature: {temp:.1f}°C\n"
+                    f"[{stamp}] Storage temperatures: Samsung SSD 870: {temp:.1f}°C, WD Red: {temp - 2:.1f}°C\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ticks-per-day', type=int, default=86400)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    
+    ranges = {
+        "narrow 14:00-14:05": (datetime.datetime.combine(DAY, datetime.time(14, 0)),
+                               datetime.datetime.combine(DAY, datetime.time(14, 5))),
+        "wide 06:00-18:00": (datetime.datetime.combine(DAY, datetime.time(6, 0)),
+                             datetime.datetime.combine(DAY, datetime.time(18, 0))),
+    }
+    
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                manager = ver8.LogManager()
+            log_path = manager.get_log_file(DAY)
+            write_day(log_path, args.ticks_per_day)
+            size_mb = os.path.getsize(log_path) / 1e6
+            
+            def query(start, end):
+                with contextlib.redirect_stdout(io.StringIO()):
+                    return manager.get_logs_for_time_range(start, end)
+            
+            results = {}
+            for name, (start, end) in ranges.items():
+                results[name] = time_call(lambda: query(start, end), repeat=args.repeat)
+            
+            rebuild_seconds, records = time_call(lambda: ver8.LogTimeIndex.rebuild(log_path), repeat=1)
+            
+            rows = []
+            for name, (start, end) in ranges.items():
+                indexed_seconds, indexed_logs = time_call(lambda: query(start, end), repeat=args.repeat)
+                scan_seconds, scan_logs = results[name]
+                assert indexed_logs == scan_logs, "indexed query returned different lines"
+                rows.append((name, len(indexed_logs), f"{scan_seconds * 1e3:.1f}",
+                             f"{indexed_seconds * 1e3:.1f}", f"{scan_seconds / indexed_seconds:.1f}x"))
+            manager.close()
+        finally:
+            os.chdir(cwd)
+    
+    print_table(f"Time range queries ({args.ticks_per_day * 3:,} lines, {size_mb:.1f} MB; "
+                f"index rebuilt in {rebuild_seconds * 1e3:.0f} ms, {records} entries)",
+                ["range", "lines", "full scan ms", "indexed ms", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Log line timestamp handling: strptime per line versus LogTimestampParser.
+  
+  filter  keep the lines inside a time range (get_logs_for_time_range)
+  parse   turn every line's timestamp into a datetime (SearchResultModal history)
+
+Lines are generated like the monitor writes them: three lines per second.
+
+Usage: python benchmarks/bench_timestamp_parsing.py [--lines 300000]
+"""
+import argparse
+import datetime
+
+from common import time_call, print_table
+
+import ver8
+
+FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def make_lines(count):
+    start = datetime.datetime(2025, 1, 1)
+    lines = []
+    for i in range(count):
+        stamp = (start + datetime.timedelta(seconds=i // 3)).strftime(FORMAT)
+        lines.append(f"[{stamp}] Max Temperature: {27 + i % 40 / 10:.1f}°C")
+    return lines
+
+
+def filter_strptime(lines, start, end):
+    kept = []
+    for line in lines:
+        try:
+            if start <= datetime.datetime.strptime(line.split(']')[0][1:], FORMAT) <= end:
+                kept.append(line)
+        except ValueError:
+            continue
+    return kept
+
+
+def filter_prefix(lines, start, end):
+    start_stamp, end_stamp = ver8.LogTimestampParser.range_stamps(start, end)
+    return [line for line in lines
+            if line[:1] == '[' and line[20:21] == ']' and start_stamp <= line[1:20] <= end_stamp]
+
+
+def parse_strptime(lines):
+    return [datetime.datetime.strptime(line.split(']')[0][1:], FORMAT) for line in lines]
+
+
+def parse_fromisoformat(lines):
+    return [datetime.datetime.fromisoformat(line[1:20]) for line in lines]
+
+
+def parse_parser(lines):
+    return [ver8.LogTimestampParser.parse_line(line) for line in lines]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--lines', type=int, default=300000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    
+    lines = make_lines(args.lines)
+    start = datetime.datetime(2025, 1, 1, 6, 0)
+    end = datetime.datetime(2025, 1, 1, 18, 0)
+    
+    cases = [
+        ("filter", "strptime", lambda: filter_strptime(lines, start, end)),
+        ("filter", "string prefix", lambda: filter_prefix(lines, start, end)),
+        ("parse", "strptime", lambda: parse_strptime(lines)),
+        ("parse", "fromisoformat", lambda: parse_fromisoformat(lines)),
+        ("parse", "LogTimestampParser", lambda: parse_parser(lines)),
+    ]
+    
+    rows = []
+    baseline = {}
+    expected = {}
+    for task, method, run in cases:
+        seconds, result = time_call(run, repeat=args.repeat)
+        assert expected.setdefault(task, result) == result, f"{task}/{method} returned different results"
+        baseline.setdefault(task, seconds)
+        rows.append((task, method, f"{args.lines / seconds:,.0f}", f"{baseline[task] / seconds:.1f}x"))
+    
+    print_table(f"Timestamp handling ({args.lines:,} lines, best of {args.repeat})",
+                ["task", "method", "lines/s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Count OpenHardwareMonitor WMI queries per monitoring tick.
+
+Before: the monitor loop called get_storage_temperatures(), get_max_storage_temperature()
+and get_average_storage_temperature(), each doing its own Sensor() enumeration.
+After: one read_snapshot() sweep per tick.
+
+Usage: python benchmarks/bench_wmi_queries.py [--ticks N] [--sensors N]
+"""
+import argparse
+import re
+import sys
+import types
+import contextlib
+import io
+
+from common import time_call, print_table
+
+
+class _FakeSensor:
+    def __init__(self, name, parent, sensor_type, value):
+        self.Name = name
+        self.Parent = parent
+        self.SensorType = sensor_type
+        self.Value = value
+        self.Identifier = f"{parent}/{name}"
+
+
+class _FakeHardware:
+    def __init__(self, name):
+        self.Name = name
+
+
+class _CountingNamespace:
+    def __init__(self, counter, sensors, hardware):
+        self._counter = counter
+        self._sensors = sensors
+        self._hardware = hardware
+    
+    def Sensor(self):
+        self._counter['queries'] += 1
+        return list(self._sensors)
+    
+    def Hardware(self):
+        self._counter['queries'] += 1
+        return list(self._hardware)
+
+    def query(self, wql):
+        """The two WQL forms the reader sends: temperature sensors, or sensors by Identifier"""
+        self._counter['queries'] += 1
+        identifiers = set(re.findall(r"Identifier='([^']*)'", wql))
+        if identifiers:
+            return [sensor for sensor in self._sensors if sensor.Identifier in identifiers]
+        return [sensor for sensor in self._sensors if sensor.SensorType == "Temperature"]
+
+
+def install_fake_wmi(sensor_count):
+    """Register a fake "wmi" module that counts namespace queries"""
+    counter = {'queries': 0, 'connections': 0}
+    sensors = [
+        _FakeSensor("Temperature", "Samsung SSD 970 EVO", "Temperature", 41.0),
+        _FakeSensor("Temperature", "WDC WD40EFRX", "Temperature", 38.0),
+    ]
+    for i in range(max(0, sensor_count - len(sensors))):
+        sensors.append(_FakeSensor(f"CPU Core #{i}", "Intel Core i7", "Load", 12.5))
+    hardware = [_FakeHardware("Samsung SSD 970 EVO"), _FakeHardware("WDC WD40EFRX")]
+    
+    def WMI(namespace=None):
+        counter['connections'] += 1
+        return _CountingNamespace(counter, sensors, hardware)
+    
+    sys.modules['wmi'] = types.SimpleNamespace(WMI=WMI)
+    return counter
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ticks', type=int, default=200)
+    parser.add_argument('--sensors', type=int, default=150)
+    args = parser.parse_args()
+    
+    counter = install_fake_wmi(args.sensors)
+    import ver8
+    
+    with contextlib.redirect_stdout(io.StringIO()):
+        # OpenHardwareMonitor only, so a Linux host's sysfs sensors do not answer instead
+        reader = ver8.StorageTemperatureReader(sensor_backends=(ver8.OHMWMISensorBackend,))
+    
+    def legacy_ticks():
+        for _ in range(args.ticks):
+            reader.get_storage_temperatures()
+            reader.get_max_storage_temperature()
+            reader.get_average_storage_temperature()
+    
+    def snapshot_ticks():
+        for _ in range(args.ticks):
+            reader.read_snapshot()
+    
+    rows = []
+    for label, func in (("before (3 calls/tick)", legacy_ticks), ("after (read_snapshot)", snapshot_ticks)):
+        counter['queries'] = counter['connections'] = 0
+        with contextlib.redirect_stdout(io.StringIO()):
+            seconds, _ = time_call(func, repeat=1)
+        rows.append((label,
+                     f"{counter['queries'] / args.ticks:.1f}",
+                     f"{counter['connections'] / args.ticks:.1f}",
+                     f"{seconds / args.ticks * 1e6:.0f}"))
+    
+    print_table(f"WMI queries per tick ({args.sensors} sensors, {args.ticks} ticks)",
+                ["strategy", "queries/tick", "connections/tick", "us/tick"], rows)
+
+
+if __name__ == "__main__":
+    main()
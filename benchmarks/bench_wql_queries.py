@@ -0,0 +1,61 @@
+"""Compare OpenHardwareMonitor query strategies on a large recorded sensor tree.
+
+Strategies (StorageTemperatureReader.query_strategy):
+  enumerate    full Sensor() enumeration, filtered in Python (legacy)
+  temperature  SELECT Identifier, Name, Parent, Value ... WHERE SensorType='Temperature'
+  identifiers  after discovery, SELECT Identifier, Value ... WHERE Identifier='...' OR ...
+
+Reports marshalled rows/properties and latency per tick. COM marshalling is not
+available on Linux, so --marshal-us adds a simulated cost per marshalled property.
+
+Usage: python benchmarks/bench_wql_queries.py [--ticks N] [--marshal-us US] [--fixture PATH]
+"""
+import argparse
+import contextlib
+import io
+import os
+
+from common import time_call, print_table
+
+import ver8
+
+DEFAULT_FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'ohm_sensor_tree.json')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ticks', type=int, default=500)
+    parser.add_argument('--marshal-us', type=float, default=0.0,
+                        help="simulated COM cost per marshalled property in microseconds")
+    parser.add_argument('--fixture', default=DEFAULT_FIXTURE)
+    args = parser.parse_args()
+    
+    rows = []
+    for strategy in ('enumerate', 'temperature', 'identifiers'):
+        backend = ver8.FakeSensorBackend.from_fixture(args.fixture, marshal_cost=args.marshal_us / 1e6)
+        with contextlib.redirect_stdout(io.StringIO()):
+            reader = ver8.StorageTemperatureReader(backend, sensor_backends=(ver8.OHMWMISensorBackend,),
+                                                   query_strategy=strategy)
+            first = reader.get_storage_temperatures()  # discovery tick
+            
+            backend.rows_marshalled = backend.properties_marshalled = 0
+            
+            def ticks():
+                for _ in range(args.ticks):
+                    reader.get_storage_temperatures()
+            
+            seconds, _ = time_call(ticks, repeat=1)
+        
+        rows.append((strategy,
+                     len(first or {}),
+                     f"{backend.rows_marshalled / args.ticks:.0f}",
+                     f"{backend.properties_marshalled / args.ticks:.0f}",
+                     f"{seconds / args.ticks * 1e6:.0f}"))
+    
+    print_table(f"OHM query strategies ({len(backend.sensors)} sensors, {args.ticks} ticks, "
+                f"{args.marshal_us} us/property)",
+                ["strategy", "drives", "rows/tick", "properties/tick", "us/tick"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,9 @@ class EnhancedTemperatureReader:
     def __init__(self):
         self.wmi_available = False
         self.ohm_available = True
+        self.ohm_failures = 0
+        self.ohm_retry_at = 0
+        self._ohm_local = threading.local()  # One OHM connection per thread
         self.initialize_wmi()
     
     def initialize_wmi(self):
@@ -49,8 +52,8 @@ class EnhancedTemperatureReader:
     def get_temperature_multisource(self):
         """Get temperature from multiple sources in priority order"""
         
-        # 1. Try OpenHardwareMonitor via WMI (most accurate)
-        if self.ohm_available:
+        # 1. Try OpenHardwareMonitor via WMI (most accurate), retrying after backoff
+        if self.wmi_available and (self.ohm_available or time.time() >= self.ohm_retry_at):
             temp = self.get_temperature_ohm()
             if temp is not None:
                 return temp
@@ -70,12 +73,22 @@ class EnhancedTemperatureReader:
         print("⚠️ No hardware temperature sources available - using simulation")
         return self.simulate_temperature()
     
+    def _get_ohm_connection(self):
+        """Return this thread's OpenHardwareMonitor connection, opening it once"""
+        w = getattr(self._ohm_local, 'connection', None)
+        if w is None:
+            import wmi
+            w = wmi.WMI(namespace="root\\OpenHardwareMonitor")
+            self._ohm_local.connection = w
+        return w
+    
     def get_temperature_ohm(self):
         """Get temperature from OpenHardwareMonitor via WMI"""
         try:
-            import wmi
-            w = wmi.WMI(namespace="root\\OpenHardwareMonitor")
+            w = self._get_ohm_connection()
             sensors = w.Sensor()
+            self.ohm_available = True
+            self.ohm_failures = 0
             
             cpu_temps = []
             core_temps = []
@@ -114,7 +127,11 @@ class EnhancedTemperatureReader:
             
         except Exception as e:
             print(f"❌ OpenHardwareMonitor reading failed: {e}")
-            self.ohm_available = False  # Disable OHM on error
+            # Drop the stale connection and retry later with exponential backoff
+            self._ohm_local.connection = None
+            self.ohm_available = False
+            self.ohm_failures += 1
+            self.ohm_retry_at = time.time() + min(60, 2 ** (self.ohm_failures - 1))
             return None
     
     def get_temperature_builtin_wmi(self):
@@ -185,8 +202,7 @@ class EnhancedTemperatureReader:
             # OpenHardwareMonitor sensors
             if self.ohm_available:
                 try:
-                    w = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-                    sensors = w.Sensor()
+                    sensors = self._get_ohm_connection().Sensor()
                     info.append("=== OpenHardwareMonitor Sensors ===")
                     for sensor in sensors:
                         if sensor.SensorType == "Temperature":
@@ -1,22 +1,59 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+from tkinter import font as tkfont
 import threading
+import itertools
+import concurrent.futures
+import ctypes
+import ctypes.util
+import select
 import time
 import psutil
-import winsound
+try:
+    import winsound
+except ImportError:
+    winsound = None  # Only available on Windows
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # Optional: zstd-compressed exports
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None  # Optional: Parquet exports
 from plyer import notification
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from collections import deque
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+import matplotlib.dates as mdates
+from matplotlib.lines import Line2D
+from matplotlib.ticker import AutoLocator
+import numpy as np
+from collections import deque, namedtuple
+from types import MappingProxyType
 import datetime
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import json
+import codecs
+import gzip
+import io
+import math
+import mmap
+import argparse
+import bisect
+import numbers
 import os
+import queue
+import re
+import sqlite3
+import struct
+from array import array
 import csv
 import pandas as pd
-from tkinter import scrolledtext
 
 class ResponsiveDesign:
     """Handles responsive design and screen adaptation"""
@@ -254,67 +291,959 @@ class ResponsiveGradientBackground:
         self.theme_colors = theme_colors
         self.create_responsive_background()
 
-class StorageTemperatureReader:
-    """Storage temperature reader specifically for storage devices using OpenHardwareMonitor"""
-    def __init__(self):
-        self.wmi_available = False
-        self.ohm_available = True
-        self.initialize_wmi()
+class StorageSnapshot(namedtuple('StorageSnapshot',
+                                 ['temperatures', 'max_temp', 'avg_temp', 'hottest_device', 'timestamp', 'source'],
+                                 defaults=(None,))):
+    """Immutable set of storage readings taken from a single sensor sweep"""
+    __slots__ = ()
     
-    def initialize_wmi(self):
-        """Initialize WMI connection and check OpenHardwareMonitor availability"""
+    @classmethod
+    def from_temperatures(cls, storage_temps, timestamp=None, source=None):
+        """Build a snapshot (with max/avg/hottest device) from a device -> temperature dict"""
+        if timestamp is None:
+            timestamp = time.time()
+        
+        temperatures = MappingProxyType(dict(storage_temps or {}))
+        if not temperatures:
+            return cls(temperatures, None, None, None, timestamp, source)
+        
+        hottest_device = max(temperatures, key=temperatures.get)
+        max_temp = temperatures[hottest_device]
+        avg_temp = sum(temperatures.values()) / len(temperatures)
+        return cls(temperatures, max_temp, avg_temp, hottest_device, timestamp, source)
+    
+    @property
+    def has_data(self):
+        """True when at least one storage device reported a temperature"""
+        return self.max_temp is not None
+
+class MonitorReading(namedtuple('MonitorReading', ['snapshot', 'cpu_percent', 'memory_percent', 'elapsed'])):
+    """One sample produced by the monitoring thread for the UI"""
+    __slots__ = ()
+
+class SampleEvent(namedtuple('SampleEvent', ['timestamp', 'metric', 'value', 'device'], defaults=('',))):
+    """A numeric reading; timestamp is epoch seconds, device is '' unless device specific"""
+    __slots__ = ()
+    KIND = 'S'
+    
+    def text(self):
+        """The message part of the event's .logs line"""
+        if self.device:  # Same shape as LogManager.log_storage_temperatures lines
+            return f"Storage temperatures: {self.device}: {self.value:.1f}°C"
+        return f"{self.metric}: {self.value}°C"
+
+class AlertEvent(namedtuple('AlertEvent', ['timestamp', 'title', 'message', 'value'], defaults=(None,))):
+    """A temperature alert shown to the user; value is the temperature that raised it"""
+    __slots__ = ()
+    KIND = 'A'
+    
+    def text(self):
+        return f"Alert: {self.title} - {self.message}"
+
+class EmailEvent(namedtuple('EmailEvent', ['timestamp', 'sent', 'value', 'error'], defaults=(None, ''))):
+    """A scheduled email report, sent or failed"""
+    __slots__ = ()
+    KIND = 'E'
+    
+    def text(self):
+        return "Scheduled email report sent" if self.sent else f"Failed to send email: {self.error}"
+
+class SystemEvent(namedtuple('SystemEvent', ['timestamp', 'message', 'error'], defaults=(False,))):
+    """Application status (start, shutdown, settings) and monitoring errors"""
+    __slots__ = ()
+    KIND = 'Y'
+    
+    def text(self):
+        return self.message
+
+class ReadingRingBuffer:
+    """Fixed-size ring of readings with one writer (the sampler) and lock-free readers.
+    
+    The sampler writes the slot first and then publishes it by bumping the sequence
+    number, so readers (the Tk frame loop) never block the sampler and vice versa.
+    """
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self._slots = [None] * capacity
+        self._published = 0  # Sequence number of the newest reading (1-based)
+    
+    @property
+    def last_seq(self):
+        return self._published
+    
+    def push(self, item):
+        """Store a reading (sampler thread only)"""
+        seq = self._published + 1
+        self._slots[seq % self.capacity] = item
+        self._published = seq
+        return seq
+    
+    def latest(self):
+        """Return (seq, reading) for the newest reading, (0, None) if empty"""
+        seq = self._published
+        if seq == 0:
+            return 0, None
+        return seq, self._slots[seq % self.capacity]
+    
+    def since(self, seq):
+        """Readings published after seq, oldest first (at most capacity of them)"""
+        last = self._published
+        first = max(seq + 1, last - self.capacity + 1, 1)
+        return last, [self._slots[i % self.capacity] for i in range(first, last + 1)]
+
+class LogRingBuffer(ReadingRingBuffer):
+    """Bounded buffer of recent log lines with sequence numbers for tailing.
+    
+    Unlike ReadingRingBuffer several threads log, so pushes are serialised; readers
+    stay lock-free and entries_after() only touches the entries they are missing.
+    """
+    def __init__(self, capacity=5000):
+        super().__init__(capacity)
+        self._lock = threading.Lock()
+    
+    def push(self, item):
+        with self._lock:
+            return super().push(item)
+    
+    def entries_after(self, seq):
+        """(last_seq, entries newer than seq); older entries are gone once overwritten"""
+        return self.since(seq)
+    
+    def __len__(self):
+        return min(self._published, self.capacity)
+
+class DeviceSeriesBuffer:
+    """Recent temperatures of every storage device, for the live graph and reports.
+    
+    A shared ring of epoch timestamps and one array('d') ring per device, all with
+    the same slots; a device missing from a sweep has NaN in that slot. The rings
+    hold window_seconds of sweeps taken min_interval apart, and reads only return
+    the last window_seconds. A lock keeps readers on other threads (the email
+    report) from seeing a half-written sweep.
+    """
+    def __init__(self, window_seconds=600, min_interval=1.0):
+        self.window_seconds = window_seconds
+        self.capacity = int(math.ceil(window_seconds / min_interval)) + 1
+        self.timestamps = array('d', [math.nan]) * self.capacity
+        self.devices = {}  # device name -> array('d') ring
+        self._next = 0
+        self._count = 0
+        self._lock = threading.Lock()
+    
+    def append(self, timestamp, temperatures):
+        """Store one sweep (a device -> temperature mapping)"""
+        with self._lock:
+            slot = self._next
+            self.timestamps[slot] = timestamp
+            for device, ring in self.devices.items():
+                ring[slot] = temperatures.get(device, math.nan)
+            for device in temperatures.keys() - self.devices.keys():
+                ring = array('d', [math.nan]) * self.capacity
+                ring[slot] = temperatures[device]
+                self.devices[device] = ring
+            self._next = (slot + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+    
+    def window(self, now=None):
+        """(timestamps, {device: temperatures}) NumPy copies of the retention window, oldest first"""
+        with self._lock:
+            order = np.arange(self._next - self._count, self._next) % self.capacity
+            timestamps = np.frombuffer(self.timestamps)[order]
+            series = {device: np.frombuffer(ring)[order] for device, ring in self.devices.items()}
+        if len(timestamps):
+            keep = timestamps >= (timestamps[-1] if now is None else now) - self.window_seconds
+            if not keep.all():
+                timestamps = timestamps[keep]
+                series = {device: values[keep] for device, values in series.items()}
+        # Devices that left the window entirely are not shown
+        return timestamps, {device: values for device, values in series.items() if not np.isnan(values).all()}
+    
+    @staticmethod
+    def maxima(series, length):
+        """Hottest reading of every sweep across the devices (NaN where none reported)"""
+        if not series:
+            return np.full(length, np.nan)
+        stacked = np.vstack(list(series.values()))
+        reported = ~np.isnan(stacked).all(axis=0)
+        maxima = np.full(length, np.nan)
+        maxima[reported] = np.nanmax(stacked[:, reported], axis=0)
+        return maxima
+    
+    def trends(self, now=None):
+        """{device: (latest, change over the window)} in °C, hottest-rising first"""
+        _, series = self.window(now)
+        trends = {}
+        for device, values in series.items():
+            readings = values[~np.isnan(values)]
+            trends[device] = (float(readings[-1]), float(readings[-1] - readings[0]))
+        return dict(sorted(trends.items(), key=lambda item: item[1][1], reverse=True))
+
+class WMIBackend:
+    """Opens real WMI namespace connections (Windows only)"""
+    def __init__(self, namespace="root\\OpenHardwareMonitor"):
+        self.namespace = namespace
+    
+    def is_supported(self):
+        """Check whether the wmi package can be imported on this host"""
         try:
             import wmi
-            self.wmi_available = True
-            print("✅ WMI support initialized")
+            return True
+        except ImportError:
+            return False
+    
+    def connect(self):
+        """Open a new namespace connection for the calling thread"""
+        # COM must be initialised in every thread that talks to WMI
+        try:
+            import pythoncom
+            pythoncom.CoInitialize()
+        except ImportError:
+            pass
+        
+        import wmi
+        return wmi.WMI(namespace=self.namespace)
+
+class FakeSensor:
+    """In-memory OpenHardwareMonitor sensor with the same attributes as the WMI object"""
+    def __init__(self, name, parent, sensor_type="Temperature", value=None, identifier=None, **properties):
+        self.Name = name
+        self.Parent = parent
+        self.SensorType = sensor_type
+        self.Value = value
+        self.Identifier = identifier or f"{parent}/{sensor_type.lower()}/{name}"
+        # Any other WMI properties (Index, Min, Max, InstanceId, ...) from recorded fixtures
+        for key, prop_value in properties.items():
+            setattr(self, key, prop_value)
+
+class FakeHardware:
+    """In-memory OpenHardwareMonitor hardware item"""
+    def __init__(self, name, hardware_type="HDD", identifier=None):
+        self.Name = name
+        self.HardwareType = hardware_type
+        self.Identifier = identifier or name
+
+class FakeSensorBackend:
+    """In-memory sensor provider that stands in for the OpenHardwareMonitor WMI namespace.
+    
+    Lets StorageTemperatureReader run on hosts without WMI (tests, Linux) and can
+    simulate OpenHardwareMonitor going away and coming back.
+    """
+    def __init__(self, sensors=None, hardware=None, marshal_cost=0.0):
+        self.sensors = list(sensors or [])
+        self.hardware = list(hardware or [])
+        self.online = True
+        self.connect_count = 0
+        self.restart_count = 0
+        # Marshalling statistics, and an optional simulated cost per property (seconds)
+        self.marshal_cost = marshal_cost
+        self.rows_marshalled = 0
+        self.properties_marshalled = 0
+    
+    @classmethod
+    def from_fixture(cls, path, **kwargs):
+        """Load a recorded sensor tree: {"sensors": [{...WMI properties...}], "hardware": [...]}"""
+        with open(path, 'r', encoding='utf-8') as f:
+            fixture = json.load(f)
+        
+        sensors = []
+        for props in fixture.get('sensors', []):
+            props = dict(props)
+            sensors.append(FakeSensor(props.pop('Name'), props.pop('Parent'), props.pop('SensorType'),
+                                      props.pop('Value', None), props.pop('Identifier', None), **props))
+        hardware = [FakeHardware(h['Name'], h.get('HardwareType', 'HDD'), h.get('Identifier'))
+                    for h in fixture.get('hardware', [])]
+        return cls(sensors, hardware, **kwargs)
+    
+    def _marshal(self, rows, properties_per_row):
+        """Account for rows/properties sent over COM"""
+        self.rows_marshalled += rows
+        self.properties_marshalled += rows * properties_per_row
+        if self.marshal_cost:
+            deadline = time.perf_counter() + rows * properties_per_row * self.marshal_cost
+            while time.perf_counter() < deadline:
+                pass
+    
+    def is_supported(self):
+        return True
+    
+    def connect(self):
+        self.connect_count += 1
+        if not self.online:
+            raise ConnectionError("OpenHardwareMonitor is not running")
+        return _FakeNamespace(self)
+    
+    def set_online(self, online):
+        """Simulate OpenHardwareMonitor stopping (False) or restarting (True)"""
+        if online and not self.online:
+            self.restart_count += 1
+        self.online = online
+
+class _FakeNamespace:
+    """Connection object returned by FakeSensorBackend.connect()"""
+    def __init__(self, backend):
+        self._backend = backend
+        self._generation = backend.restart_count
+    
+    def _check_alive(self):
+        # A restarted OHM invalidates every connection opened before it went away
+        if not self._backend.online or self._generation != self._backend.restart_count:
+            raise ConnectionError("WMI connection is no longer valid")
+    
+    def Sensor(self):
+        self._check_alive()
+        sensors = list(self._backend.sensors)
+        for sensor in sensors:
+            self._backend._marshal(1, len(vars(sensor)))
+        return sensors
+    
+    def Hardware(self):
+        self._check_alive()
+        return list(self._backend.hardware)
+    
+    def query(self, wql):
+        """Run a (simple) WQL SELECT: field list, one class, WHERE with = / AND / OR"""
+        self._check_alive()
+        match = re.match(r"\s*SELECT\s+(.+?)\s+FROM\s+(\w+)(?:\s+WHERE\s+(.+?))?\s*$", wql, re.IGNORECASE | re.DOTALL)
+        if not match:
+            raise ValueError(f"Unsupported WQL: {wql}")
+        
+        fields = [field.strip() for field in match.group(1).split(',')]
+        source = {'sensor': self._backend.sensors, 'hardware': self._backend.hardware}[match.group(2).lower()]
+        conditions = self._parse_where(match.group(3)) if match.group(3) else None
+        
+        # "Identifier='a' OR Identifier='b' ..." becomes a set lookup, like WMI's server-side filter
+        lookup_field, lookup_values = None, None
+        if conditions and all(len(group) == 1 for group in conditions) and \
+                len({group[0][0] for group in conditions}) == 1:
+            lookup_field = conditions[0][0][0]
+            lookup_values = {group[0][1] for group in conditions}
+        
+        rows = []
+        for item in source:
+            if lookup_field is not None:
+                if str(getattr(item, lookup_field, None)) not in lookup_values:
+                    continue
+            elif conditions and not any(all(str(getattr(item, field, None)) == value for field, value in group)
+                                        for group in conditions):
+                continue
+            if fields == ['*']:
+                self._backend._marshal(1, len(vars(item)))
+                rows.append(item)
+            else:
+                self._backend._marshal(1, len(fields))
+                rows.append(_FakeRow({field: getattr(item, field, None) for field in fields}))
+        return rows
+    
+    @staticmethod
+    def _parse_where(where):
+        """Parse "A='x' AND B='y' OR C='z'" into [[(A, x), (B, y)], [(C, z)]]"""
+        conditions = []
+        for any_group in re.split(r"\s+OR\s+", where, flags=re.IGNORECASE):
+            group = []
+            for term in re.split(r"\s+AND\s+", any_group, flags=re.IGNORECASE):
+                match = re.match(r"\s*\(?\s*(\w+)\s*=\s*'((?:[^'\\]|\\.)*)'\s*\)?\s*$", term)
+                if not match:
+                    raise ValueError(f"Unsupported WQL condition: {term}")
+                group.append((match.group(1), re.sub(r"\\(.)", r"\1", match.group(2))))
+            conditions.append(group)
+        return conditions
+
+class _FakeRow:
+    """Partial WMI object holding only the properties a WQL query selected"""
+    def __init__(self, properties):
+        self.__dict__.update(properties)
+
+class WMIConnectionManager:
+    """Keeps one WMI namespace connection per thread and reconnects with backoff.
+    
+    Connections are opened lazily, reused across ticks and dropped on the first
+    error. Reconnect attempts are spaced out with exponential backoff so a stopped
+    OpenHardwareMonitor is not hammered every refresh.
+    """
+    def __init__(self, backend=None, base_backoff=1.0, max_backoff=60.0):
+        self.backend = backend or WMIBackend()
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.consecutive_failures = 0
+        self.retry_at = 0.0
+        self.last_error = None
+        self.session = 0  # Incremented on every new connection; sensor identities may change
+        self._local = threading.local()
+        self._lock = threading.Lock()
+    
+    def is_available(self):
+        """True unless we are waiting out a reconnect backoff"""
+        return time.monotonic() >= self.retry_at or self.consecutive_failures == 0
+    
+    def get_connection(self):
+        """Return this thread's connection, opening it if needed (None while backing off)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            return connection
+        
+        if not self.is_available():
+            return None
+        
+        try:
+            connection = self.backend.connect()
+        except Exception as e:
+            self._record_failure(e)
+            return None
+        
+        self._local.connection = connection
+        with self._lock:
+            self.session += 1
+            if self.consecutive_failures:
+                print("✅ Reconnected to OpenHardwareMonitor")
+            self.consecutive_failures = 0
+            self.retry_at = 0.0
+            self.last_error = None
+        return connection
+    
+    def invalidate(self, error=None):
+        """Drop this thread's connection and schedule a reconnect"""
+        self._local.connection = None
+        self._record_failure(error)
+    
+    def _record_failure(self, error):
+        with self._lock:
+            self.consecutive_failures += 1
+            self.last_error = error
+            delay = min(self.max_backoff, self.base_backoff * (2 ** (self.consecutive_failures - 1)))
+            self.retry_at = time.monotonic() + delay
+        print(f"⚠️ OpenHardwareMonitor connection lost ({error}) - retrying in {delay:.0f}s")
+    
+    def run(self, operation):
+        """Run operation(connection) on the pooled connection; returns None if unavailable"""
+        connection = self.get_connection()
+        if connection is None:
+            return None
+        
+        try:
+            return operation(connection)
+        except Exception as e:
+            self.invalidate(e)
+            raise
+    
+    def sensors(self):
+        """All Sensor objects from the namespace"""
+        return self.run(lambda w: w.Sensor())
+    
+    def hardware(self):
+        """All Hardware objects from the namespace"""
+        return self.run(lambda w: w.Hardware())
+    
+    def query(self, wql):
+        """Rows for a WQL query (only the selected properties are marshalled)"""
+        return self.run(lambda w: w.query(wql))
+
+class SensorBackend:
+    """Base class for a source of temperature readings.
+    
+    Subclasses declare which kinds of temperature they provide ("storage",
+    "chassis") and a priority (lower is preferred). read_temperatures() returns a
+    {device name: °C} dict, or None/{} when nothing could be read.
+    """
+    name = "sensor"
+    capabilities = frozenset()
+    priority = 100
+    failure_cooldown = 30.0  # Seconds to skip this backend after it returned nothing
+    
+    @classmethod
+    def create(cls, temp_reader):
+        """Build the backend for a StorageTemperatureReader (see DEFAULT_SENSOR_BACKENDS)"""
+        return cls()
+    
+    def is_available(self):
+        """Cheap check whether this backend can work on this host"""
+        return True
+    
+    def read_temperatures(self):
+        raise NotImplementedError
+    
+    def describe(self):
+        """Human readable description for the sensor info dialog"""
+        return self.name
+
+class OHMWMISensorBackend(SensorBackend):
+    """Storage temperatures from OpenHardwareMonitor over WMI (Windows)"""
+    name = "OpenHardwareMonitor"
+    capabilities = frozenset({'storage'})
+    priority = 0
+    failure_cooldown = 0.0  # WMIConnectionManager already backs off on its own
+    
+    def __init__(self, temp_reader):
+        self.temp_reader = temp_reader
+    
+    @classmethod
+    def create(cls, temp_reader):
+        return cls(temp_reader)
+    
+    def is_available(self):
+        return self.temp_reader.ohm_available
+    
+    def read_temperatures(self):
+        return self.temp_reader.get_storage_temperatures()
+
+class SysfsSensorBackend(SensorBackend):
+    """Storage temperatures read directly from /sys/class/nvme and /sys/class/hwmon (Linux).
+    
+    Sensor files are discovered once and then read with a single open/read each,
+    which costs microseconds compared to a full psutil walk of every chip.
+    """
+    name = "sysfs"
+    capabilities = frozenset({'storage'})
+    priority = 10
+    storage_chips = ('nvme', 'drivetemp')
+    
+    def __init__(self, sysfs_root="/sys/class", rescan_interval=300):
+        self.sysfs_root = sysfs_root
+        self.rescan_interval = rescan_interval
+        self._sensor_files = None
+        self._scanned_at = 0.0
+    
+    def is_available(self):
+        return (os.path.isdir(os.path.join(self.sysfs_root, 'nvme')) or
+                os.path.isdir(os.path.join(self.sysfs_root, 'hwmon')))
+    
+    def _read_text(self, path):
+        try:
+            with open(path, 'r') as f:
+                return f.read().strip()
+        except OSError:
+            return ""
+    
+    def _list_dir(self, path):
+        try:
+            return sorted(os.listdir(path))
+        except OSError:
+            return []
+    
+    def discover(self):
+        """Find every storage temperature file; returns a list of (device name, path)"""
+        sensor_files = []
+        seen_hwmon = set()
+        
+        # NVMe controllers expose their hwmon either directly or under device/hwmon
+        nvme_dir = os.path.join(self.sysfs_root, 'nvme')
+        for controller in self._list_dir(nvme_dir):
+            controller_dir = os.path.join(nvme_dir, controller)
+            model = self._read_text(os.path.join(controller_dir, 'model')) or controller
+            hwmon_dirs = [os.path.join(controller_dir, d) for d in self._list_dir(controller_dir)
+                          if d.startswith('hwmon')]
+            nested = os.path.join(controller_dir, 'device', 'hwmon')
+            hwmon_dirs += [os.path.join(nested, d) for d in self._list_dir(nested)]
+            
+            for hwmon_dir in hwmon_dirs:
+                temp_file = os.path.join(hwmon_dir, 'temp1_input')
+                if os.path.exists(temp_file):
+                    seen_hwmon.add(os.path.realpath(hwmon_dir))
+                    sensor_files.append((f"{model} ({controller})", temp_file))
+                    break
+        
+        # SATA/SAS drives via the drivetemp driver (and any nvme hwmon not found above)
+        hwmon_root = os.path.join(self.sysfs_root, 'hwmon')
+        for hwmon in self._list_dir(hwmon_root):
+            hwmon_dir = os.path.join(hwmon_root, hwmon)
+            if os.path.realpath(hwmon_dir) in seen_hwmon:
+                continue
+            
+            chip = self._read_text(os.path.join(hwmon_dir, 'name'))
+            if chip not in self.storage_chips:
+                continue
             
-            # Test if OpenHardwareMonitor is running
+            temp_file = os.path.join(hwmon_dir, 'temp1_input')
+            if os.path.exists(temp_file):
+                model = self._read_text(os.path.join(hwmon_dir, 'device', 'model')) or chip
+                sensor_files.append((f"{model} ({hwmon})", temp_file))
+        
+        self._sensor_files = sensor_files
+        self._scanned_at = time.monotonic()
+        return sensor_files
+    
+    def read_temperatures(self):
+        if self._sensor_files is None or time.monotonic() - self._scanned_at > self.rescan_interval:
+            self.discover()
+        
+        temps = {}
+        for device_name, temp_file in self._sensor_files:
+            try:
+                with open(temp_file, 'rb') as f:
+                    temps[device_name] = int(f.read()) / 1000.0  # millidegrees Celsius
+            except (OSError, ValueError):
+                # Drive removed or asleep - rediscover on the next tick
+                self._sensor_files = None
+        return temps
+
+class PsutilSensorBackend(SensorBackend):
+    """Storage temperatures from psutil.sensors_temperatures() (Linux/FreeBSD)"""
+    name = "psutil"
+    capabilities = frozenset({'storage'})
+    priority = 10
+    storage_chips = ('nvme', 'drivetemp')
+    
+    def is_available(self):
+        return hasattr(psutil, "sensors_temperatures")
+    
+    def read_temperatures(self):
+        temps = {}
+        for chip, entries in psutil.sensors_temperatures().items():
+            if chip not in self.storage_chips:
+                continue
+            for index, entry in enumerate(entries):
+                if entry.current and entry.current > 0:
+                    temps[f"{chip} {entry.label or index}"] = float(entry.current)
+        return temps
+
+class AcpiThermalZoneSensorBackend(SensorBackend):
+    """Chassis temperatures from ACPI thermal zones (WMI on Windows, sysfs on Linux)"""
+    name = "ACPI thermal zones"
+    capabilities = frozenset({'chassis'})
+    priority = 20
+    
+    def __init__(self, sysfs_root="/sys/class"):
+        self.thermal_dir = os.path.join(sysfs_root, 'thermal')
+        self.connection_manager = None
+        if os.name == 'nt':
+            self.connection_manager = WMIConnectionManager(WMIBackend("root\\wmi"))
+    
+    def is_available(self):
+        if self.connection_manager is not None:
+            return self.connection_manager.backend.is_supported() and self.connection_manager.is_available()
+        return os.path.isdir(self.thermal_dir)
+    
+    def read_temperatures(self):
+        temps = {}
+        
+        if self.connection_manager is not None:
+            zones = self.connection_manager.run(lambda w: w.MSAcpi_ThermalZoneTemperature()) or []
+            for zone in zones:
+                if zone.CurrentTemperature:
+                    temp_celsius = (float(zone.CurrentTemperature) / 10) - 273.15
+                    if 10 <= temp_celsius <= 120:  # Reasonable range
+                        temps[zone.InstanceName] = temp_celsius
+            return temps
+        
+        for zone in sorted(os.listdir(self.thermal_dir)):
+            if not zone.startswith('thermal_zone'):
+                continue
+            zone_dir = os.path.join(self.thermal_dir, zone)
+            try:
+                with open(os.path.join(zone_dir, 'temp'), 'rb') as f:
+                    temp_celsius = int(f.read()) / 1000.0
+                with open(os.path.join(zone_dir, 'type'), 'r') as f:
+                    zone_type = f.read().strip()
+            except (OSError, ValueError):
+                continue
+            if 10 <= temp_celsius <= 120:
+                temps[f"{zone_type} ({zone})"] = temp_celsius
+        return temps
+
+class RedfishSensorBackend(SensorBackend):
+    """Chassis temperatures from a Dell iDRAC (or any Redfish BMC) Thermal resource.
+    
+    verify_ssl is True (system CA store), the path of a CA bundle that signed the
+    BMC's certificate, or False to accept any certificate (self-signed iDRACs).
+    """
+    name = "iDRAC Redfish"
+    capabilities = frozenset({'chassis'})
+    priority = 10  # Only registered when configured, so it is preferred over ACPI zones
+    failure_cooldown = 120.0
+    
+    def __init__(self, url, username, password, chassis_id="System.Embedded.1", timeout=5, verify_ssl=True):
+        self.url = url.rstrip('/')
+        self.username = username
+        self.password = password
+        self.chassis_id = chassis_id
+        self.timeout = timeout
+        self.verify_ssl = verify_ssl
+    
+    def describe(self):
+        return f"{self.name} ({self.url})"
+    
+    def read_temperatures(self):
+        import base64
+        import ssl
+        import urllib.request
+        
+        credentials = base64.b64encode(f"{self.username}:{self.password}".encode()).decode()
+        request = urllib.request.Request(
+            f"{self.url}/redfish/v1/Chassis/{self.chassis_id}/Thermal",
+            headers={'Authorization': f"Basic {credentials}", 'Accept': 'application/json'}
+        )
+        
+        # Credentials go out on every read, so certificates are checked unless turned off
+        if isinstance(self.verify_ssl, str):
+            context = ssl.create_default_context(cafile=self.verify_ssl)
+        elif self.verify_ssl:
+            context = None
+        else:
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        with urllib.request.urlopen(request, timeout=self.timeout, context=context) as response:
+            data = json.load(response)
+        
+        temps = {}
+        for reading in data.get('Temperatures', []):
+            if reading.get('ReadingCelsius') is not None:
+                temps[reading.get('Name', 'Unknown')] = float(reading['ReadingCelsius'])
+        return temps
+
+# Sensor providers in order of preference. The registry only uses providers
+# that support the requested capability, and orders providers with the same
+# priority by their measured read latency.
+DEFAULT_SENSOR_BACKENDS = (
+    OHMWMISensorBackend,
+    SysfsSensorBackend,
+    PsutilSensorBackend,
+    AcpiThermalZoneSensorBackend,
+)
+
+class SensorBackendRegistry:
+    """Chooses sensor backends by capability, priority and measured read latency"""
+    def __init__(self, backends=(), latency_smoothing=0.3):
+        self.backends = list(backends)
+        self.latency_smoothing = latency_smoothing
+        self.latency = {}      # backend name -> smoothed read latency in seconds
+        self._retry_at = {}    # backend name -> monotonic time before which it is skipped
+    
+    @classmethod
+    def from_spec(cls, backend_classes, temp_reader):
+        """Build a registry from a declarative list of SensorBackend classes"""
+        return cls(backend_cls.create(temp_reader) for backend_cls in backend_classes)
+    
+    def register(self, backend):
+        """Add a backend (e.g. a Redfish BMC configured in the settings file)"""
+        self.backends.append(backend)
+    
+    def candidates(self, capability):
+        """Available backends for a capability, best first"""
+        now = time.monotonic()
+        found = []
+        for backend in self.backends:
+            if capability not in backend.capabilities or now < self._retry_at.get(backend.name, 0):
+                continue
             try:
-                w = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-                sensors = w.Sensor()
-                self.ohm_available = True
-                print("✅ OpenHardwareMonitor detected and accessible")
-                print(f"📊 Found {len(sensors)} sensors")
+                if backend.is_available():
+                    found.append(backend)
+            except Exception:
+                continue
+        # Unmeasured backends sort first so every candidate gets timed once
+        return sorted(found, key=lambda b: (b.priority, self.latency.get(b.name, 0.0)))
+    
+    def _record_latency(self, backend, seconds):
+        previous = self.latency.get(backend.name)
+        if previous is None:
+            self.latency[backend.name] = seconds
+        else:
+            alpha = self.latency_smoothing
+            self.latency[backend.name] = alpha * seconds + (1 - alpha) * previous
+    
+    def read(self, capabilities=('storage',)):
+        """Read from the best backend that returns data; returns (backend name, temps)"""
+        for capability in capabilities:
+            for backend in self.candidates(capability):
+                start = time.perf_counter()
+                try:
+                    temps = backend.read_temperatures()
+                except Exception as e:
+                    print(f"❌ {backend.name} read failed: {e}")
+                    temps = None
+                self._record_latency(backend, time.perf_counter() - start)
                 
-                # Print ALL temperature sensors for debugging
-                temp_sensors = [s for s in sensors if s.SensorType == "Temperature"]
-                print("🌡️ All temperature sensors:")
-                for sensor in temp_sensors:
-                    print(f"  - {sensor.Name}: {sensor.Value}°C (Parent: {sensor.Parent})")
-                    
-            except Exception as e:
-                print("❌ OpenHardwareMonitor not detected or not running")
-                print("💡 Please run OpenHardwareMonitor as Administrator")
-                self.ohm_available = False
+                if temps:
+                    self._retry_at.pop(backend.name, None)
+                    return backend.name, temps
                 
-        except ImportError:
+                if backend.failure_cooldown:
+                    self._retry_at[backend.name] = time.monotonic() + backend.failure_cooldown
+        
+        return None, {}
+    
+    def describe(self):
+        """One line per backend with capabilities and measured latency"""
+        lines = []
+        for backend in sorted(self.backends, key=lambda b: b.priority):
+            try:
+                available = backend.is_available()
+            except Exception:
+                available = False
+            latency = self.latency.get(backend.name)
+            latency_text = f"{latency * 1000:.2f} ms" if latency is not None else "not measured"
+            lines.append(f"  {'✅' if available else '❌'} {backend.describe()} "
+                         f"[{', '.join(sorted(backend.capabilities))}] - {latency_text}")
+        return lines
+
+# Keywords that mark an OpenHardwareMonitor sensor/parent as a storage device
+STORAGE_SENSOR_KEYWORDS = (
+    'hdd', 'ssd', 'disk', 'drive', 'nvme', 'sata',
+    'hard disk', 'solid state', 'samsung', 'crucial',
+    'western digital', 'seagate', 'kingston', 'adata',
+    'sandisk', 'intel ssd', 'toshiba', 'hitachi'
+)
+
+# Keywords used by the alternative detection that matches OHM Hardware names
+STORAGE_HARDWARE_KEYWORDS = ('ssd', 'hdd', 'disk', 'drive', 'samsung', 'crucial', 'wd', 'seagate')
+
+class StorageSensorClassifier:
+    """Classifies OHM sensors as storage temperatures, once per sensor identity.
+    
+    The keyword list is compiled into a single case-insensitive regex, and the
+    result for each sensor Identifier is cached for the life of the OHM session.
+    """
+    def __init__(self, keywords=STORAGE_SENSOR_KEYWORDS):
+        self._cache = {}  # sensor identity -> storage device name, or None if not storage
+        self.set_keywords(keywords)
+    
+    def set_keywords(self, keywords):
+        """Compile a new keyword list and forget previous classifications"""
+        self.keywords = tuple(k.lower() for k in keywords if k)
+        # Longest first so "intel ssd" wins over "ssd" in the alternation
+        pattern = "|".join(re.escape(k) for k in sorted(self.keywords, key=len, reverse=True))
+        self._matcher = re.compile(pattern, re.IGNORECASE) if pattern else None
+        self.clear()
+    
+    def clear(self):
+        """Forget cached classifications (e.g. after reconnecting to OHM)"""
+        self._cache = {}
+    
+    @property
+    def cache_size(self):
+        return len(self._cache)
+    
+    @property
+    def storage_devices(self):
+        """Identities of the sensors classified as storage"""
+        return [identity for identity, device in self._cache.items() if device is not None]
+    
+    def matches(self, text):
+        """True if text contains any storage keyword"""
+        return bool(text) and self._matcher is not None and self._matcher.search(text) is not None
+    
+    def is_storage_sensor(self, sensor_name, parent_name):
+        """Check if a temperature sensor belongs to a storage device (by parent or own name)"""
+        if "temperature" not in sensor_name.lower():
+            return False
+        return self.matches(parent_name) or self.matches(sensor_name)
+    
+    def classify(self, sensor):
+        """Return the storage device name for an OHM sensor, or None if it is not storage"""
+        identity = getattr(sensor, 'Identifier', None) or (sensor.Name, getattr(sensor, 'Parent', None))
+        try:
+            return self._cache[identity]
+        except KeyError:
+            pass
+        
+        device_name = None
+        # Rows from the filtered WQL query only carry the selected properties
+        if (getattr(sensor, 'SensorType', None) or "Temperature") == "Temperature":
+            parent = getattr(sensor, 'Parent', None) or "Unknown"
+            if self.is_storage_sensor(sensor.Name, parent):
+                # Use parent name if available, otherwise use sensor name
+                device_name = parent if parent != "Unknown" else sensor.Name
+            else:
+                print(f"  Skipping non-storage: {sensor.Name} (Parent: {parent})")
+        
+        self._cache[identity] = device_name
+        return device_name
+
+class StorageTemperatureReader:
+    """Storage temperature reader specifically for storage devices using OpenHardwareMonitor"""
+    # Discovery query: temperature sensors only, and only the properties we use
+    TEMPERATURE_SENSOR_WQL = "SELECT Identifier, Name, Parent, Value FROM Sensor WHERE SensorType='Temperature'"
+    
+    def __init__(self, backend=None, sensor_backends=DEFAULT_SENSOR_BACKENDS, storage_keywords=None,
+                 query_strategy='identifiers', rediscover_interval=300):
+        self.wmi_available = False
+        # 'identifiers': query known storage sensors by Identifier, 'temperature': filtered
+        # WQL every tick, 'enumerate': full Sensor() enumeration (legacy)
+        self.query_strategy = query_strategy
+        self.rediscover_interval = rediscover_interval
+        self._discovered_at = 0.0
+        self.connection_manager = WMIConnectionManager(backend)
+        self.sensor_registry = SensorBackendRegistry.from_spec(sensor_backends, self)
+        self.classifier = StorageSensorClassifier(storage_keywords or STORAGE_SENSOR_KEYWORDS)
+        self.hardware_classifier = StorageSensorClassifier(STORAGE_HARDWARE_KEYWORDS)
+        self._classified_session = None
+        self._storage_hardware = None
+        self.last_snapshot = StorageSnapshot.from_temperatures({})
+        self.initialize_wmi()
+    
+    @property
+    def ohm_available(self):
+        """OpenHardwareMonitor is usable now, or due for a reconnect attempt"""
+        return self.wmi_available and self.connection_manager.is_available()
+    
+    def initialize_wmi(self):
+        """Initialize WMI connection and check OpenHardwareMonitor availability"""
+        if not self.connection_manager.backend.is_supported():
             print("❌ WMI not available - install: pip install wmi")
             self.wmi_available = False
-            self.ohm_available = False
-    
-    def _is_storage_sensor(self, sensor_name, parent_name):
-        """Check if sensor belongs to a storage device"""
-        storage_keywords = [
-            'hdd', 'ssd', 'disk', 'drive', 'nvme', 'sata', 
-            'hard disk', 'solid state', 'samsung', 'crucial',
-            'western digital', 'seagate', 'kingston', 'adata',
-            'sandisk', 'intel ssd', 'toshiba', 'hitachi'
-        ]
+            return
         
-        sensor_lower = sensor_name.lower()
-        parent_lower = parent_name.lower() if parent_name else ""
+        self.wmi_available = True
+        print("✅ WMI support initialized")
         
-        # Check if it's a temperature sensor under a storage device
-        if "temperature" in sensor_lower:
-            # Check if parent is a storage device
-            if any(keyword in parent_lower for keyword in storage_keywords):
-                return True
+        # Test if OpenHardwareMonitor is running
+        try:
+            sensors = self.connection_manager.sensors()
+            if sensors is None:
+                raise ConnectionError(self.connection_manager.last_error)
+            print("✅ OpenHardwareMonitor detected and accessible")
+            print(f"📊 Found {len(sensors)} sensors")
             
-            # Check if sensor name itself indicates storage
-            if any(keyword in sensor_lower for keyword in storage_keywords):
-                return True
+            # Print ALL temperature sensors for debugging
+            temp_sensors = [s for s in sensors if s.SensorType == "Temperature"]
+            print("🌡️ All temperature sensors:")
+            for sensor in temp_sensors:
+                print(f"  - {sensor.Name}: {sensor.Value}°C (Parent: {sensor.Parent})")
         
-        return False
+        except Exception as e:
+            print("❌ OpenHardwareMonitor not detected or not running")
+            print("💡 Please run OpenHardwareMonitor as Administrator")
+    
+    def _is_storage_sensor(self, sensor_name, parent_name):
+        """Check if sensor belongs to a storage device"""
+        return self.classifier.is_storage_sensor(sensor_name, parent_name)
+        
+    def set_storage_keywords(self, keywords):
+        """Replace the storage keyword list (clears the classification cache)"""
+        self.classifier.set_keywords(keywords)
+        
+    def _check_session(self):
+        """Sensor identities are only stable for one OHM session - reclassify after a reconnect"""
+        session = self.connection_manager.session
+        if session != self._classified_session:
+            self.classifier.clear()
+            self._storage_hardware = None
+            self._discovered_at = 0.0
+            self._classified_session = session
+    
+    def _query_sensors(self):
+        """Fetch this tick's sensor rows with the cheapest query that is still valid"""
+        if self.query_strategy == 'enumerate':
+            return self.connection_manager.sensors()
+        
+        self._check_session()
+        storage_ids = self.classifier.storage_devices
+        discovery_due = time.monotonic() - self._discovered_at > self.rediscover_interval
+        
+        if (self.query_strategy == 'identifiers' and storage_ids and not discovery_due and
+                all(isinstance(identity, str) for identity in storage_ids)):
+            conditions = " OR ".join("Identifier='{}'".format(identity.replace("'", "\\'"))
+                                     for identity in storage_ids)
+            rows = self.connection_manager.query(f"SELECT Identifier, Value FROM Sensor WHERE {conditions}")
+            if rows is not None and len(rows) < len(storage_ids):
+                # A drive disappeared - rediscover on the next tick
+                self._discovered_at = 0.0
+            return rows
+        
+        # Periodic discovery also picks up hot-plugged drives
+        rows = self.connection_manager.query(self.TEMPERATURE_SENSOR_WQL)
+        if rows is not None:
+            self._discovered_at = time.monotonic()
+        return rows
     
     def get_storage_temperatures(self):
         """Get temperatures for all storage devices from OpenHardwareMonitor"""
@@ -325,48 +1254,31 @@ class StorageTemperatureReader:
             return None
         
         try:
-            import wmi
-            w = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-            sensors = w.Sensor()
+            sensors = self._query_sensors()
+            if sensors is None:
+                print("❌ OpenHardwareMonitor not reachable - waiting to reconnect")
+                return None
             
-            # Look for ALL temperature sensors first
-            all_temp_sensors = []
+            self._check_session()
+            known_sensors = self.classifier.cache_size
+            
+            # Classification is cached per sensor Identifier, so after the first tick
+            # only Value is read, and only for sensors already known to be storage
             for sensor in sensors:
-                if (sensor.SensorType == "Temperature" and 
-                    sensor.Value is not None):
+                device_name = self.classifier.classify(sensor)
+                if device_name is None:
+                    continue
                     
-                    all_temp_sensors.append({
-                        'name': sensor.Name,
-                        'value': float(sensor.Value),
-                        'parent': sensor.Parent if hasattr(sensor, 'Parent') else "Unknown"
-                    })
-            
-            print(f"🔍 Found {len(all_temp_sensors)} temperature sensors total")
-            
-            # Filter for storage temperatures
-            storage_sensors = []
-            for sensor in all_temp_sensors:
-                if self._is_storage_sensor(sensor['name'], sensor['parent']):
-                    storage_sensors.append(sensor)
-                else:
-                    print(f"  Skipping non-storage: {sensor['name']} (Parent: {sensor['parent']})")
+                value = sensor.Value
+                if value is None:
+                    continue
             
-            print(f"💾 Found {len(storage_sensors)} storage temperature sensors")
+                # Subtract 13°C from actual reading for room temperature uniformity
+                storage_temps[device_name] = float(value) - 13
             
-            # Organize storage temperatures
-            for sensor in storage_sensors:
-                # Use parent name if available, otherwise use sensor name
-                if sensor['parent'] and sensor['parent'] != "Unknown":
-                    device_name = sensor['parent']
-                else:
-                    device_name = sensor['name']
-                
-                # Subtract 10°C from actual reading for room temperature uniformity
-                raw_temp = sensor['value']
-                adjusted_temp = raw_temp - 13
-                storage_temps[device_name] = adjusted_temp
-                
-                print(f"  {device_name}: {raw_temp}°C")
+            if self.classifier.cache_size != known_sensors:
+                print(f"💾 Classified {self.classifier.cache_size} sensors, "
+                      f"{len(self.classifier.storage_devices)} storage temperature sensors")
             
             # If we found storage temperatures, return them
             if storage_temps:
@@ -380,8 +1292,8 @@ class StorageTemperatureReader:
                 return self._find_storage_temps_alternative(sensors)
             
         except Exception as e:
+            # The connection manager has already dropped the connection and scheduled a reconnect
             print(f"❌ Error reading storage temperatures: {e}")
-            self.ohm_available = False
             return None
     
     def _find_storage_temps_alternative(self, sensors):
@@ -389,29 +1301,23 @@ class StorageTemperatureReader:
         print("🔄 Trying alternative storage detection method...")
         storage_temps = {}
         
-        # Get all hardware items to find storage devices
+        # Get all hardware items to find storage devices (once per OHM session)
         try:
-            import wmi
-            w = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-            hardware_items = w.Hardware()
-            
-            storage_devices = []
-            for hardware in hardware_items:
-                hw_name = hardware.Name if hardware.Name else ""
-                hw_lower = hw_name.lower()
-                
-                # Check if this is a storage device
-                storage_keywords = ['ssd', 'hdd', 'disk', 'drive', 'samsung', 'crucial', 'wd', 'seagate']
-                if any(keyword in hw_lower for keyword in storage_keywords):
-                    storage_devices.append(hw_name)
-                    print(f"  Found storage device: {hw_name}")
+            if self._storage_hardware is None:
+                storage_devices = set()
+                for hardware in self.connection_manager.hardware() or []:
+                    hw_name = hardware.Name if hardware.Name else ""
+                    if self.hardware_classifier.matches(hw_name):
+                        storage_devices.add(hw_name)
+                        print(f"  Found storage device: {hw_name}")
+                self._storage_hardware = storage_devices
             
             # Now look for temperature sensors under these storage devices
             for sensor in sensors:
-                if (sensor.SensorType == "Temperature" and 
+                if ((getattr(sensor, 'SensorType', None) or "Temperature") == "Temperature" and 
                     sensor.Value is not None and
                     hasattr(sensor, 'Parent') and
-                    sensor.Parent in storage_devices):
+                    sensor.Parent in self._storage_hardware):
                     
                     # Subtract 10°C from actual reading
                     raw_temp = float(sensor.Value)
@@ -424,41 +1330,56 @@ class StorageTemperatureReader:
         
         return storage_temps if storage_temps else None
     
-    def get_average_storage_temperature(self):
+    def read_snapshot(self):
+        """Take one sensor sweep and return an immutable StorageSnapshot"""
+        # Storage sensors only: chassis and CPU zones must never trip storage thresholds
+        source, temps = self.sensor_registry.read(('storage',))
+        snapshot = StorageSnapshot.from_temperatures(temps, source=source)
+        
+        if snapshot.has_data:
+            print(f"📈 Average storage temperature: {snapshot.avg_temp:.1f}°C")
+            print(f"🔥 Hottest storage: {snapshot.hottest_device} at {snapshot.max_temp:.1f}°C")
+        
+        self.last_snapshot = snapshot
+        return snapshot
+    
+    def read_chassis_temperatures(self):
+        """(backend name, {sensor: °C}) from the chassis sources (ACPI zones, iDRAC), kept apart from storage"""
+        return self.sensor_registry.read(('chassis',))
+    
+    def get_average_storage_temperature(self, snapshot=None):
         """Get the average temperature across all storage devices"""
-        storage_temps = self.get_storage_temperatures()
-        if storage_temps:
-            avg_temp = sum(storage_temps.values()) / len(storage_temps)
-            print(f"📈 Average storage temperature: {avg_temp:.1f}°C")
-            return avg_temp
-        else:
-            return None
+        if snapshot is None:
+            snapshot = self.read_snapshot()
+        return snapshot.avg_temp
     
-    def get_max_storage_temperature(self):
+    def get_max_storage_temperature(self, snapshot=None):
         """Get the maximum temperature among all storage devices"""
-        storage_temps = self.get_storage_temperatures()
-        if storage_temps:
-            max_temp = max(storage_temps.values())
-            max_device = max(storage_temps, key=storage_temps.get)
-            print(f"🔥 Hottest storage: {max_device} at {max_temp:.1f}°C")
-            return max_temp
-        else:
-            return None
+        if snapshot is None:
+            snapshot = self.read_snapshot()
+        return snapshot.max_temp
     
     def get_detailed_sensor_info(self):
         """Get detailed information about all available sensors"""
+        info = ["=== Sensor Backends ==="]
+        info.extend(self.sensor_registry.describe())
+        
+        source, chassis_temps = self.read_chassis_temperatures()
+        if chassis_temps:
+            info.append(f"=== Chassis Temperatures from {source} (not used for storage alerts) ===")
+            info.extend(f"  {sensor}: {temp:.1f}°C" for sensor, temp in chassis_temps.items())
+        
         if not self.wmi_available:
-            return "WMI not available"
+            return "\n".join(info)
         
         try:
-            import wmi
-            info = []
             
             # OpenHardwareMonitor sensors
             if self.ohm_available:
                 try:
-                    w = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-                    sensors = w.Sensor()
+                    sensors = self.connection_manager.sensors()
+                    if sensors is None:
+                        raise ConnectionError("not reachable, waiting to reconnect")
                     info.append("=== OpenHardwareMonitor All Temperature Sensors ===")
                     
                     # Show all temperature sensors with their parent information
@@ -481,15 +1402,81 @@ class StorageTemperatureReader:
         except Exception as e:
             return f"Error getting sensor info: {e}"
 
+THRESHOLD_COLORS = ('blue', 'yellow', 'red')  # normal, warning, critical
+
+class ThresholdRuns(namedtuple('ThresholdRuns', ['segments', 'run_levels', 'levels'])):
+    """Threshold-colored runs of a temperature series, ready for a LineCollection"""
+    __slots__ = ()
+    
+    def colors(self, palette=THRESHOLD_COLORS):
+        """One color per segment in self.segments"""
+        return [palette[level] for level in self.run_levels]
+
+def threshold_segments(x, temperatures, warning_temp, critical_temp):
+    """Split a series into runs of equal threshold level (0 normal, 1 warning, 2 critical).
+    
+    The line between two samples takes the level of the later sample, and every run
+    starts at the last point of the previous one so the drawn line has no gaps.
+    Returns ThresholdRuns(segments, run_levels, levels) where segments is a list of
+    (n, 2) point arrays and levels is the per-sample level array.
+    """
+    x = np.asarray(x, dtype=float)
+    temperatures = np.asarray(temperatures, dtype=float)
+    levels = np.digitize(temperatures, [warning_temp, critical_temp])
+    if len(temperatures) < 2:
+        return ThresholdRuns([], levels[:0], levels)
+    
+    points = np.column_stack([x, temperatures])
+    line_levels = levels[1:]  # Line i joins points i and i + 1
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(line_levels)) + 1))
+    ends = np.append(starts[1:], len(line_levels))
+    segments = [points[start:end + 1] for start, end in zip(starts.tolist(), ends.tolist())]
+    return ThresholdRuns(segments, line_levels[starts], levels)
+
+def minmax_downsample(x, temperatures, buckets, levels=None):
+    """Indices of the samples to draw when showing a series across `buckets` pixels.
+    
+    Keeps the first, last, minimum and maximum sample of every x bucket, so peaks
+    are exact, plus both samples around every threshold-level change in `levels`
+    so colored runs start and end where they really do. x must be sorted.
+    """
+    x = np.asarray(x, dtype=float)
+    temperatures = np.asarray(temperatures, dtype=float)
+    count = len(x)
+    if count <= buckets * 4:
+        return np.arange(count)
+    
+    span = x[-1] - x[0]
+    bucket = ((x - x[0]) * (buckets / span)).astype(np.int64) if span > 0 else np.zeros(count, dtype=np.int64)
+    np.minimum(bucket, buckets - 1, out=bucket)
+    
+    starts = np.flatnonzero(np.diff(bucket)) + 1
+    firsts = np.concatenate(([0], starts))
+    lasts = np.append(starts - 1, count - 1)
+    
+    # Sorting by (bucket, temperature) puts each bucket's min first and max last
+    order = np.lexsort((temperatures, bucket))
+    keep = [firsts, lasts, order[firsts], order[lasts]]
+    
+    if levels is not None:
+        changes = np.flatnonzero(np.diff(levels))
+        keep.extend((changes, changes + 1))
+    return np.unique(np.concatenate(keep))
+
 class SearchResultModal:
     """Modal window to display search results with time range and history graph"""
-    def __init__(self, parent, start_datetime, end_datetime, logs, theme_manager, responsive_design):
+    def __init__(self, parent, start_datetime, end_datetime, logs, theme_manager, responsive_design,
+                 warning_temp=27, critical_temp=30, samples=None):
         self.parent = parent
         self.start_datetime = start_datetime
         self.end_datetime = end_datetime
         self.logs = logs
+        self.samples = samples  # Optional (epoch_ms, values) arrays from the sample store
+        self.series = None
         self.theme_manager = theme_manager
         self.responsive_design = responsive_design
+        self.warning_temp = warning_temp
+        self.critical_temp = critical_temp
         self.colors = self.theme_manager.get_theme()
         self.window = None
         self.create_modal()
@@ -620,52 +1607,35 @@ class SearchResultModal:
     
     def parse_temperature_data(self):
         """Parse temperature data from logs"""
-        temperatures = []
+        return self.load_series()[1].tolist()
         
-        for log_entry in self.logs:
-            if '°C' in log_entry:
-                try:
-                    # Extract temperature value
-                    temp_part = log_entry.split('°C')[0]
-                    if ':' in temp_part:
-                        temp_str = temp_part.split(':')[-1].strip()
-                        try:
-                            temperature = float(temp_str)
-                            temperatures.append(temperature)
-                        except ValueError:
-                            continue
-                except Exception:
-                    continue
+    def load_series(self):
+        """(matplotlib dates, temperatures) arrays, from the sample store when available"""
+        if self.series is not None:
+            return self.series
         
-        return temperatures
+        if self.samples is not None and len(self.samples[0]):
+            timestamps_ms, values = self.samples
+            self.series = (SampleStore.local_datenums(timestamps_ms), np.asarray(values, dtype=float))
+            return self.series
     
-    def setup_graph(self, parent):
-        """Setup the matplotlib graph for temperature visualization"""
-        # Parse temperature data from logs
+        # Older history only exists as text: classify the .logs lines and plot the
+        # Max Temperature readings (alerts, settings and storage lines are not samples of it)
         timestamps = []
         temperatures = []
+        for event in EventLog.parse_lines(self.logs):
+            if type(event) is SampleEvent and event.metric == 'Max Temperature':
+                timestamps.append(event.timestamp)
+                temperatures.append(event.value)
         
-        for log_entry in self.logs:
-            if '°C' in log_entry:
-                try:
-                    # Extract timestamp
-                    timestamp_str = log_entry.split(']')[0][1:]
-                    timestamp = datetime.datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
-                    
-                    # Extract temperature value
-                    temp_part = log_entry.split('°C')[0]
-                    if ':' in temp_part:
-                        temp_str = temp_part.split(':')[-1].strip()
-                        try:
-                            temperature = float(temp_str)
-                            timestamps.append(timestamp)
-                            temperatures.append(temperature)
-                        except ValueError:
-                            continue
-                except Exception:
-                    continue
+        self.series = (SampleStore.local_datenums(np.asarray(timestamps) * 1000), np.asarray(temperatures, dtype=float))
+        return self.series
+    
+    def setup_graph(self, parent):
+        """Setup the matplotlib graph for temperature visualization"""
+        x, temperatures = self.load_series()
         
-        if not temperatures:
+        if not len(temperatures):
             # Show no data message
             no_data_frame = ttk.Frame(parent, style='Modern.TFrame')
             no_data_frame.grid(row=0, column=0, sticky='nsew')
@@ -692,38 +1662,23 @@ class SearchResultModal:
             text_color = 'black'
             grid_color = '#e2e8f0'
         
-        # Create colored line segments based on temperature thresholds
-        critical_temp = 30
-        warning_temp = 27
-        
-        if len(timestamps) > 1:
-            # Create segments for different temperature ranges
-            segments = []
-            current_segment = {'timestamps': [timestamps[0]], 'temps': [temperatures[0]], 'color': self.get_temperature_color(temperatures[0], critical_temp, warning_temp)}
-            
-            for i in range(1, len(timestamps)):
-                current_color = self.get_temperature_color(temperatures[i], critical_temp, warning_temp)
-                
-                if current_color == current_segment['color']:
-                    # Continue current segment
-                    current_segment['timestamps'].append(timestamps[i])
-                    current_segment['temps'].append(temperatures[i])
-                else:
-                    # End current segment and start new one
-                    segments.append(current_segment)
-                    current_segment = {'timestamps': [timestamps[i]], 'temps': [temperatures[i]], 'color': current_color}
-            
-            segments.append(current_segment)
-            
-            # Plot each segment with its respective color
-            for segment in segments:
-                if len(segment['timestamps']) > 1:
-                    self.ax.plot(segment['timestamps'], segment['temps'], 
-                                color=segment['color'], 
-                                linewidth=3, 
-                                marker='o', 
-                                markersize=4,
-                                alpha=0.8)
+        # Threshold-colored runs drawn as one LineCollection; the visible window is
+        # decimated to about one sample per pixel and redone on every pan/zoom
+        self.x = x
+        self.temperatures = temperatures
+        self.levels = np.digitize(self.temperatures, [self.warning_temp, self.critical_temp])
+        self.line_collection = LineCollection([], linewidths=3, alpha=0.8)
+        self.ax.add_collection(self.line_collection)
+        self.markers = self.ax.scatter([], [], s=16, alpha=0.8, zorder=3)
+        self.rendered_view = None
+        
+        x_pad = max((self.x[-1] - self.x[0]) * 0.02, 1 / 1440)
+        y_pad = max(1, (self.temperatures.max() - self.temperatures.min()) * 0.05)
+        self.ax.set_xlim(self.x[0] - x_pad, self.x[-1] + x_pad)
+        self.ax.set_ylim(self.temperatures.min() - y_pad, self.temperatures.max() + y_pad)
+        self.ax.xaxis_date()
+        self.render_visible_range()
+        self.ax.callbacks.connect('xlim_changed', self.on_xlim_changed)
         
         # Customize graph
         self.ax.tick_params(colors=text_color)
@@ -735,11 +1690,10 @@ class SearchResultModal:
         self.ax.set_ylabel('Temperature (°C)', fontsize=12, fontweight='bold')
         
         # Add legend for temperature ranges
-        from matplotlib.lines import Line2D
         legend_elements = [
-            Line2D([0], [0], color='blue', lw=3, label='Normal Temperature (<27°C)'),
-            Line2D([0], [0], color='yellow', lw=3, label='Warning (27-30°C)'),
-            Line2D([0], [0], color='red', lw=3, label='Critical (>30°C)')
+            Line2D([0], [0], color='blue', lw=3, label=f'Normal Temperature (<{self.warning_temp:g}°C)'),
+            Line2D([0], [0], color='yellow', lw=3, label=f'Warning ({self.warning_temp:g}-{self.critical_temp:g}°C)'),
+            Line2D([0], [0], color='red', lw=3, label=f'Critical (>{self.critical_temp:g}°C)')
         ]
         self.ax.legend(handles=legend_elements, fontsize=11, framealpha=0.9)
         
@@ -749,9 +1703,7 @@ class SearchResultModal:
         plt.setp(self.ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
         
         # Add some statistics to the graph
-        avg_temp = sum(temperatures) / len(temperatures)
-        max_temp = max(temperatures)
-        min_temp = min(temperatures)
+        avg_temp = float(temperatures.mean())
         
         # Add horizontal line for average
         self.ax.axhline(y=avg_temp, color=self.colors['accent'], linestyle='--', 
@@ -760,29 +1712,577 @@ class SearchResultModal:
         # Adjust layout
         self.fig.tight_layout()
         
-        # Create canvas
+        # Create canvas with a pan/zoom toolbar
         self.canvas = FigureCanvasTkAgg(self.fig, master=parent)
         self.canvas.get_tk_widget().grid(row=0, column=0, sticky='nsew')
+        self.canvas.mpl_connect('resize_event', self.on_xlim_changed)
+        
+        toolbar_frame = ttk.Frame(parent, style='Modern.TFrame')
+        toolbar_frame.grid(row=1, column=0, sticky='ew')
+        self.toolbar = NavigationToolbar2Tk(self.canvas, toolbar_frame, pack_toolbar=False)
+        self.toolbar.update()
+        self.toolbar.pack(side=tk.LEFT)
+    
+    def render_visible_range(self):
+        """Draw the samples in the current x range, decimated to the axes width"""
+        x_min, x_max = self.ax.get_xlim()
+        buckets = max(int(self.ax.bbox.width), 100)
+        if self.rendered_view == (x_min, x_max, buckets):
+            return False
+        self.rendered_view = (x_min, x_max, buckets)
+        
+        # One sample either side so lines run to the edges of the view
+        start = max(np.searchsorted(self.x, x_min, side='left') - 1, 0)
+        stop = min(np.searchsorted(self.x, x_max, side='right') + 1, len(self.x))
+        x = self.x[start:stop]
+        temperatures = self.temperatures[start:stop]
+        levels = self.levels[start:stop]
+        
+        picked = minmax_downsample(x, temperatures, buckets, levels)
+        runs = threshold_segments(x[picked], temperatures[picked], self.warning_temp, self.critical_temp)
+        self.line_collection.set_segments(runs.segments)
+        self.line_collection.set_color(runs.colors())
+        
+        # Markers only make sense once the view is zoomed in to individual samples
+        if len(picked) == len(x):
+            self.markers.set_offsets(np.column_stack([x, temperatures]))
+            self.markers.set_color([THRESHOLD_COLORS[level] for level in levels])
+        else:
+            self.markers.set_offsets(np.empty((0, 2)))
+        return True
+    
+    def on_xlim_changed(self, *args):
+        """Re-decimate after a pan, zoom or resize"""
+        if self.render_visible_range() and hasattr(self, 'canvas'):
+            self.canvas.draw_idle()
+    
+class LogRows:
+    """Row access shared by the log line sources a VirtualLogView displays.
+    
+    Subclasses provide __len__, lines(start, stop), scan(cancel_event), update(new_lines)
+    and filtered(text). scan() may run on a worker thread while lines() is called
+    from the Tk thread; rows found so far are readable during the scan.
+    """
+    READ_CHUNK = 4096  # Rows per read when iterating
+    
+    def __iter__(self):
+        start = 0
+        while start < len(self):
+            chunk = self.lines(start, start + self.READ_CHUNK)
+            if not chunk:
+                break
+            yield from chunk
+            start += len(chunk)
+    
+    def find_time(self, stamp):
+        """First row at or after a "YYYY-MM-DD HH:MM:SS" stamp (rows are in time order)"""
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            line = self.lines(middle, middle + 1)
+            if line and line[0][1:20] < stamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+class LogListRows(LogRows):
+    """Log rows held in memory, for lines that have no file to index (sample lines
+    rendered from the sample store). The lines iterable is consumed by scan()."""
+    def __init__(self, lines=(), text=None, limit=None):
+        self.items = []
+        self.pending = iter(lines)
+        self.text = text.lower() if text else None
+        self.limit = limit  # The oldest rows are dropped beyond this many
+    
+    def __len__(self):
+        return len(self.items)
+    
+    def lines(self, start, stop):
+        return self.items[start:stop]
+    
+    def _matches(self, lines):
+        if self.text is None:
+            return list(lines)
+        return [line for line in lines if self.text in line.lower()]
+    
+    def scan(self, cancel_event=None):
+        while self.pending is not None:
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            chunk = list(itertools.islice(self.pending, self.READ_CHUNK))
+            if not chunk:
+                self.pending = None
+            self.update(chunk)
+    
+    def update(self, new_lines=()):
+        """Add new lines that match; returns True if rows were added"""
+        matches = self._matches(new_lines)
+        self.items.extend(matches)
+        if self.limit and len(self.items) > self.limit * 1.1:
+            del self.items[:len(self.items) - self.limit]
+        return bool(matches)
+    
+    def filtered(self, text):
+        return LogListRows(list(self.items), text, self.limit)
+
+class LogFileRows(LogRows):
+    """Rows of one or more .logs files, read from disk on demand.
+    
+    scan() reads the files once and keeps the byte offset of every BLOCK-th row, so
+    memory does not grow with the number of lines and reading rows i..j is one seek
+    plus at most BLOCK skipped lines. Rows can be limited to a time range and to
+    lines containing a text (case-insensitive); update() indexes lines appended to
+    the files since, and with path_for_today the file of a new day is added too.
+    """
+    BLOCK = 256
+    
+    def __init__(self, paths, start_datetime=None, end_datetime=None, text=None,
+                 path_for_today=None, encoding_for=None):
+        self.paths = list(paths)
+        self.start_datetime = start_datetime
+        self.end_datetime = end_datetime
+        self.text = text
+        self.needle = text.lower() if text else None
+        self.path_for_today = path_for_today
+        self.encoding_for = encoding_for  # path -> encoding, defaults to utf-8
+        
+        self.start_stamp = self.stop_stamp = None
+        if start_datetime is not None:
+            start_stamp, end_stamp = LogTimestampParser.range_stamps(start_datetime, end_datetime)
+            self.start_stamp = start_stamp.encode('ascii')
+            self.end_stamp = end_stamp.encode('ascii')
+            # Lines from concurrent loggers can be slightly out of order: stop a little late
+            self.stop_stamp = (end_datetime + datetime.timedelta(seconds=5)).strftime(LogTimestampParser.FORMAT).encode('ascii')
+        
+        self.lock = threading.Lock()
+        self.files = []  # [path, encoding, rows, block_offsets, scan_offset, done] per file
+        self.count = 0
+        for path in self.paths:
+            self._add_file(path)
+    
+    def __len__(self):
+        return self.count
+    
+    def _add_file(self, path):
+        encoding = 'utf-8'
+        offset = 0
+        if LogArchive.log_exists(path):
+            if self.encoding_for is not None:
+                encoding = self.encoding_for(path)
+            if self.start_datetime is not None and LogTimeIndex(path).exists():
+                offset = LogTimeIndex(path).offset_for(self.start_datetime)
+        with self.lock:
+            self.files.append([path, encoding, 0, array('q'), offset, False])
+    
+    def _accept(self, raw, encoding):
+        """True if a raw line is a row, False if not, None once past the end of the time range"""
+        if not raw.strip():
+            return False
+        if self.start_stamp is not None:
+            if raw[:1] != b'[' or raw[20:21] != b']':
+                return False
+            stamp = raw[1:20]
+            if stamp > self.stop_stamp:
+                return None
+            if not self.start_stamp <= stamp <= self.end_stamp:
+                return False
+        if self.needle is not None:
+            return self.needle in raw.decode(encoding, errors='replace').lower()
+        return True
+    
+    def scan(self, cancel_event=None):
+        """Index the files up to their current ends (the last, partial line is left for later)"""
+        for state in list(self.files):
+            path, encoding, count, blocks, offset, done = state
+            if done:
+                continue
+            accept = self._accept
+            try:
+                with LogArchive.open_log(path) as f:
+                    f.seek(offset)
+                    for raw in f:
+                        if raw[-1:] != b'\n':
+                            break  # Still being written
+                        line_offset = offset
+                        offset += len(raw)
+                        accepted = accept(raw, encoding)
+                        if not accepted:
+                            if accepted is None:
+                                state[5] = True
+                                break
+                            continue
+                        if not count % self.BLOCK:
+                            if count:
+                                self._publish(state, count, line_offset)
+                                if cancel_event is not None and cancel_event.is_set():
+                                    return
+                            blocks.append(line_offset)
+                        count += 1
+                    self._publish(state, count, offset)
+            except FileNotFoundError:
+                continue  # Today's file before its first line
+            except OSError as e:
+                print(f"⚠️ Error reading {os.path.basename(path)}: {e}")
+    
+    def _publish(self, state, count, offset):
+        """Make rows found by a scan visible to readers"""
+        with self.lock:
+            self.count += count - state[2]
+            state[2] = count
+            state[4] = offset
+    
+    def update(self, new_lines=()):
+        """Index lines appended since the last scan; returns True if rows were added"""
+        if self.path_for_today is not None:
+            today = self.path_for_today()
+            if today not in self.paths:
+                self.paths.append(today)
+                self._add_file(today)
+        count = self.count
+        self.scan()
+        return self.count > count
+    
+    def lines(self, start, stop):
+        """Rows start..stop-1 as stripped strings"""
+        with self.lock:
+            files = [tuple(state[:4]) for state in self.files]
+        lines = []
+        first_row = 0
+        for path, encoding, count, blocks in files:
+            if len(lines) >= stop - start:
+                break
+            row = start + len(lines) - first_row
+            first_row += count
+            if row >= count:
+                continue
+            block = row // self.BLOCK
+            current = block * self.BLOCK
+            try:
+                with LogArchive.open_log(path) as f:
+                    f.seek(blocks[block])
+                    for raw in f:
+                        if current >= count or len(lines) >= stop - start:
+                            break
+                        if not self._accept(raw, encoding):
+                            continue
+                        if current >= row:
+                            lines.append(raw.decode(encoding, errors='replace').strip())
+                        current += 1
+            except OSError as e:
+                print(f"⚠️ Error reading {os.path.basename(path)}: {e}")
+                break
+        return lines
+    
+    def filtered(self, text):
+        return LogFileRows(self.paths, self.start_datetime, self.end_datetime, text,
+                           self.path_for_today, self.encoding_for)
+
+class VirtualLogView:
+    """Read-only log view that only materializes the rows in view.
+    
+    Rows come from a LogRows source (LogFileRows reads them from the .logs files on
+    demand), and the Text widget only ever holds the visible rows plus MARGIN, so
+    memory stays flat with millions of entries. The vertical scrollbar is driven
+    from the row position; lines are not wrapped, so one line is always one row.
+    Sources are scanned on a worker thread and rows show up while the scan runs.
+    The optional toolbar filters rows as you type and jumps to a time.
+    """
+    MARGIN = 5  # Rows rendered below the visible area
+    WHEEL_ROWS = 3  # Rows scrolled per mouse wheel step
+    POLL_MS = 50  # How often a running scan is checked for new rows
+    FILTER_DELAY_MS = 300  # Typing pause before a filter is applied
+    
+    def __init__(self, parent, bg, fg, font=("Consolas", 9), placeholder="", follow=False, toolbar=True):
+        self.frame = ttk.Frame(parent, style='Modern.TFrame')
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(1, weight=1)
+        
+        if toolbar:
+            self.create_toolbar(bg, fg)
+        
+        self.text = tk.Text(self.frame, wrap=tk.NONE, height=1, bg=bg, fg=fg, font=font,
+                            insertbackground=fg, state='disabled')
+        self.text.grid(row=1, column=0, sticky='nsew')
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.on_scrollbar)
+        self.scrollbar.grid(row=1, column=1, sticky='ns')
+        x_scrollbar = ttk.Scrollbar(self.frame, orient=tk.HORIZONTAL, command=self.text.xview)
+        x_scrollbar.grid(row=2, column=0, sticky='ew')
+        self.text.config(xscrollcommand=x_scrollbar.set)
+        
+        self.line_height = max(1, tkfont.Font(root=self.text, font=font).metrics('linespace'))
+        self.source = LogListRows()  # Rows on screen (filtered when a filter is set)
+        self.base_source = self.source  # Unfiltered rows
+        self.placeholder = placeholder
+        self.base_placeholder = placeholder
+        self.follow = follow  # Keep the last line in view while rows are added
+        self.first = 0  # Index of the top visible line
+        self.rows = 1  # Visible rows, updated on resize
+        
+        # Background scans: one at a time, polled from the Tk loop
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.scan_future = None
+        self.scan_cancel = None
+        self.poll_id = None
+        self.filter_id = None
+        self.on_progress = None
+        self.on_done = None
+        
+        self.text.bind('<Configure>', self.on_configure)
+        self.text.bind('<MouseWheel>', self.on_mousewheel)
+        self.text.bind('<Button-4>', lambda event: self.scroll(-self.WHEEL_ROWS))
+        self.text.bind('<Button-5>', lambda event: self.scroll(self.WHEEL_ROWS))
+        for key, rows in (('<Up>', -1), ('<Down>', 1)):
+            self.text.bind(key, lambda event, rows=rows: self.scroll(rows))
+        self.text.bind('<Prior>', lambda event: self.scroll(-self.rows))
+        self.text.bind('<Next>', lambda event: self.scroll(self.rows))
+        self.text.bind('<Home>', lambda event: self.scroll_to(0))
+        self.text.bind('<End>', lambda event: self.see_end())
+    
+    def create_toolbar(self, bg, fg):
+        """Filter and jump-to-time controls above the rows"""
+        toolbar = ttk.Frame(self.frame, style='Modern.TFrame')
+        toolbar.grid(row=0, column=0, columnspan=2, sticky='ew', pady=(0, 5))
+        toolbar.columnconfigure(1, weight=1)
+        
+        ttk.Label(toolbar, text="Filter:", background=bg, foreground=fg,
+                  font=('Segoe UI', 8)).grid(row=0, column=0, sticky='w', padx=(0, 5))
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add('write', self.on_filter_change)
+        ttk.Entry(toolbar, textvariable=self.filter_var, font=('Segoe UI', 8)).grid(row=0, column=1, sticky='ew')
+        
+        ttk.Label(toolbar, text="Jump to (YYYY-MM-DD HH:MM or HH:MM):", background=bg, foreground=fg,
+                  font=('Segoe UI', 8)).grid(row=0, column=2, sticky='w', padx=(15, 5))
+        self.jump_var = tk.StringVar()
+        jump_entry = ttk.Entry(toolbar, textvariable=self.jump_var, width=18, font=('Segoe UI', 8))
+        jump_entry.grid(row=0, column=3, sticky='w')
+        jump_entry.bind('<Return>', lambda event: self.jump_to_time())
+        ttk.Button(toolbar, text="Go", command=self.jump_to_time,
+                   style='Secondary.TButton', width=4).grid(row=0, column=4, sticky='w', padx=(5, 0))
+        
+        self.status_var = tk.StringVar()
+        ttk.Label(toolbar, textvariable=self.status_var, background=bg, foreground=fg,
+                  font=('Segoe UI', 8)).grid(row=0, column=5, sticky='e', padx=(15, 0))
+    
+    def grid(self, **kwargs):
+        self.frame.grid(**kwargs)
+    
+    def __len__(self):
+        return len(self.source)
+    
+    def at_end(self):
+        """True when the last line is visible"""
+        return self.first + self.rows >= len(self.source)
+    
+    def load(self, source, placeholder=None, on_progress=None, on_done=None):
+        """Show a new source (clearing any filter) and scan it in the background.
+        
+        on_progress(rows) and on_done(error) are called on the Tk thread.
+        """
+        self.cancel_scan()
+        self.base_source = source
+        if placeholder is not None:
+            self.base_placeholder = placeholder
+        if hasattr(self, 'filter_var') and self.filter_var.get():
+            self.filter_var.set("")
+            self.cancel_filter()
+        self._show(source, placeholder, on_progress, on_done)
+    
+    def _show(self, source, placeholder=None, on_progress=None, on_done=None):
+        self.source = source
+        if placeholder is not None:
+            self.placeholder = placeholder
+        self.first = 0
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.scan_cancel = threading.Event()
+        self.scan_future = self.executor.submit(source.scan, self.scan_cancel)
+        self.render()
+        self.poll_id = self.frame.after(self.POLL_MS, self.poll_scan)
+    
+    def scanning(self):
+        return self.scan_future is not None and not self.scan_future.done()
+    
+    def poll_scan(self):
+        """Show rows found by the running scan; calls on_done when it finishes"""
+        done = self.scan_future.done()
+        if self.follow and self.at_end():
+            self.see_end()
+        else:
+            self.render()
+        self.update_status()
+        
+        if not done:
+            if self.on_progress is not None:
+                self.on_progress(len(self.source))
+            self.poll_id = self.frame.after(self.POLL_MS, self.poll_scan)
+            return
+        
+        self.poll_id = None
+        error = None if self.scan_future.cancelled() else self.scan_future.exception()
+        if self.on_done is not None:
+            self.on_done(error)
+    
+    def cancel_scan(self):
+        """Stop a running scan; rows found so far stay visible"""
+        if self.scan_cancel is not None:
+            self.scan_cancel.set()
+        if self.scan_future is not None:
+            self.scan_future.cancel()  # Only takes effect if it has not started yet
+        if self.poll_id is not None:
+            self.frame.after_cancel(self.poll_id)
+            self.poll_id = None
+    
+    def update_source(self, new_lines=()):
+        """Pick up rows logged since the last call (new_lines feed in-memory sources)"""
+        if self.scanning():
+            return  # The running scan reads to the end of the files anyway
+        grown = self.base_source.update(new_lines)
+        if self.source is not self.base_source:
+            grown = self.source.update(new_lines)
+        if grown:
+            if self.follow and self.at_end():
+                self.see_end()
+            else:
+                self.render()
+            self.update_status()
+    
+    def on_filter_change(self, *args):
+        self.cancel_filter()
+        self.filter_id = self.frame.after(self.FILTER_DELAY_MS, self.apply_filter)
+    
+    def cancel_filter(self):
+        if self.filter_id is not None:
+            self.frame.after_cancel(self.filter_id)
+            self.filter_id = None
+    
+    def apply_filter(self):
+        """Show the rows containing the filter text; an empty filter shows all rows"""
+        if self.scanning() and self.source is self.base_source:
+            # Filter once the rows are loaded
+            self.filter_id = self.frame.after(self.FILTER_DELAY_MS, self.apply_filter)
+            return
+        self.filter_id = None
+        self.cancel_scan()
+        text = self.filter_var.get().strip()
+        if text:
+            self._show(self.base_source.filtered(text), placeholder="No matching log entries.")
+        else:
+            self.base_source.update()
+            self.source = self.base_source
+            self.placeholder = self.base_placeholder
+            if self.follow:
+                self.see_end()
+            else:
+                self.scroll_to(0)
+            self.update_status()
+    
+    def update_status(self):
+        if hasattr(self, 'status_var'):
+            if self.source is self.base_source:
+                self.status_var.set(f"{len(self.source)} entries")
+            else:
+                self.status_var.set(f"{len(self.source)} of {len(self.base_source)} entries")
+    
+    def jump_to_time(self):
+        """Scroll to the first row at or after the time in the jump field"""
+        value = self.jump_var.get().strip()
+        stamp = None
+        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%H:%M:%S", "%H:%M"):
+            try:
+                moment = datetime.datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+            if fmt.startswith("%H"):
+                # A bare time is on the day of the top visible row (or today)
+                top = self.source.lines(self.first, self.first + 1)
+                day = top[0][1:11] if top and top[0][:1] == '[' else datetime.date.today().isoformat()
+                stamp = f"{day} {moment.strftime('%H:%M:%S')}"
+            else:
+                stamp = moment.strftime(LogTimestampParser.FORMAT)
+            break
+        if stamp is None:
+            messagebox.showerror("Error", "Invalid time. Use YYYY-MM-DD HH:MM or HH:MM")
+            return
+        self.scroll_to(self.source.find_time(stamp))
+    
+    def scroll_to(self, index):
+        self.first = max(0, min(index, len(self.source) - self.rows))
+        self.render()
+        return 'break'
+    
+    def scroll(self, rows):
+        return self.scroll_to(self.first + rows)
+    
+    def see_end(self):
+        return self.scroll_to(len(self.source))
+    
+    def on_scrollbar(self, action, amount, unit=None):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', n, 'units' | 'pages')"""
+        if action == 'moveto':
+            self.scroll_to(int(float(amount) * len(self.source)))
+        elif action == 'scroll':
+            self.scroll(int(amount) * (self.rows if unit == 'pages' else 1))
+    
+    def on_mousewheel(self, event):
+        # Windows reports multiples of 120 per notch, macOS small deltas
+        steps = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self.scroll(-steps * self.WHEEL_ROWS)
+    
+    def on_configure(self, event):
+        rows = max(1, event.height // self.line_height)
+        if rows != self.rows:
+            follow = self.follow and self.at_end()
+            self.rows = rows
+            if follow:
+                self.see_end()
+            else:
+                self.render()
     
-    def get_temperature_color(self, temperature, critical_temp, warning_temp):
-        """Get color based on temperature value"""
-        if temperature >= critical_temp:
-            return 'red'  # Critical
-        elif temperature >= warning_temp:
-            return 'yellow'  # Warning
+    def render(self):
+        """Replace the widget contents with the rows from the top visible one"""
+        total = len(self.source)
+        lines = self.source.lines(self.first, self.first + self.rows + self.MARGIN) if total else []
+        if lines:
+            content = "\n".join(lines)
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + self.rows) / total))
         else:
-            return 'blue'  # Normal
+            content = "Loading..." if self.scanning() else self.placeholder
+            self.scrollbar.set(0.0, 1.0)
+        
+        self.text.config(state='normal')
+        self.text.delete(1.0, tk.END)
+        self.text.insert(1.0, content)
+        self.text.config(state='disabled')
+
+    def destroy(self):
+        """Stop background work; call before the parent window is destroyed"""
+        self.cancel_scan()
+        self.cancel_filter()
+        self.executor.shutdown(wait=False)
 
 class TimeRangeSearchWindow:
     """Modal window for time range search and export with graph generation"""
-    def __init__(self, parent, log_manager, theme_manager, responsive_design):
+    EXPORT_POLL_MS = 100  # How often the Tk loop picks up export progress
+    GRAPH_POINTS = 2000  # Longer ranges are graphed from the sample rollups (max per bucket)
+    
+    def __init__(self, parent, log_manager, theme_manager, responsive_design,
+                 warning_temp=27, critical_temp=30):
         self.parent = parent
         self.log_manager = log_manager
         self.theme_manager = theme_manager
         self.responsive_design = responsive_design
+        self.warning_temp = warning_temp
+        self.critical_temp = critical_temp
         self.colors = self.theme_manager.get_theme()
         self.window = None
-        self.current_logs = []
+        self.current_logs = LogListRows()  # Rows of the last search, read from the logs on demand
+        # Export runs on a worker thread; the Tk loop polls its progress
+        self.export_thread = None
+        self.export_cancel = None
+        self.export_status = (None, 0)
+        self.export_result = None
+        self.export_poll_id = None
         self.create_window()
         
     def create_window(self):
@@ -945,11 +2445,11 @@ class TimeRangeSearchWindow:
         action_frame.grid(row=1, column=0, sticky='ew')
         action_frame.columnconfigure(0, weight=1)
         
-        # Search button
-        search_button = ttk.Button(action_frame, text="Search Logs", 
-                                  command=self.search_logs,
-                                  style='Primary.TButton')
-        search_button.grid(row=0, column=0, sticky='w', padx=(0, 10))
+        # Search button (becomes "Cancel Search" while a search is running)
+        self.search_button = ttk.Button(action_frame, text="Search Logs", 
+                                       command=self.search_logs,
+                                       style='Primary.TButton')
+        self.search_button.grid(row=0, column=0, sticky='w', padx=(0, 10))
         
         # Export button
         self.export_button = ttk.Button(action_frame, text="Export Results", 
@@ -965,6 +2465,38 @@ class TimeRangeSearchWindow:
                                       state="disabled")
         self.graph_button.grid(row=0, column=2, sticky='w')
         
+        # Export format and compression
+        ttk.Label(action_frame, text="Format:", 
+                 background=bg_color,
+                 foreground=self.colors['text_secondary'],
+                 font=('Segoe UI', 8)).grid(row=0, column=3, sticky='w', padx=(20, 5))
+        
+        self.export_format_var = tk.StringVar(value='logs')
+        ttk.Combobox(action_frame, textvariable=self.export_format_var,
+                     values=LogExporter.FORMATS, width=8, state="readonly",
+                     style='Modern.TCombobox').grid(row=0, column=4, sticky='w')
+        
+        ttk.Label(action_frame, text="Compression:", 
+                 background=bg_color,
+                 foreground=self.colors['text_secondary'],
+                 font=('Segoe UI', 8)).grid(row=0, column=5, sticky='w', padx=(10, 5))
+        
+        self.export_compression_var = tk.StringVar(value='none')
+        ttk.Combobox(action_frame, textvariable=self.export_compression_var,
+                     values=['none', 'gzip', 'zstd'], width=6, state="readonly",
+                     style='Modern.TCombobox').grid(row=0, column=6, sticky='w')
+        
+        # Export progress, shown while an export is running
+        self.export_progress = ttk.Progressbar(action_frame, mode='determinate', maximum=100, length=160)
+        self.export_progress.grid(row=0, column=7, sticky='w', padx=(20, 5))
+        self.export_progress.grid_remove()
+        
+        self.cancel_export_button = ttk.Button(action_frame, text="Cancel Export", 
+                                              command=self.cancel_export,
+                                              style='Secondary.TButton')
+        self.cancel_export_button.grid(row=0, column=8, sticky='w')
+        self.cancel_export_button.grid_remove()
+        
         # Results info frame
         info_frame = ttk.Frame(controls_frame, style='Modern.TFrame')
         info_frame.grid(row=2, column=0, sticky='ew', pady=(10, 0))
@@ -982,19 +2514,9 @@ class TimeRangeSearchWindow:
         content_frame.columnconfigure(0, weight=1)
         content_frame.rowconfigure(0, weight=1)
         
-        # Create scrollable text area for logs
-        self.log_text = scrolledtext.ScrolledText(
-            content_frame,
-            wrap=tk.WORD,
-            width=100,
-            height=25,
-            bg=text_bg,
-            fg=self.colors['text_primary'],
-            font=("Consolas", 9),
-            insertbackground=self.colors['text_primary'],
-            state='disabled'
-        )
-        self.log_text.grid(row=0, column=0, sticky='nsew')
+        # Log view; searches are indexed in the background and only visible lines are read
+        self.log_view = VirtualLogView(content_frame, bg=text_bg, fg=self.colors['text_primary'])
+        self.log_view.grid(row=0, column=0, sticky='nsew')
         
         # Handle window close
         self.window.protocol("WM_DELETE_WINDOW", self.on_close)
@@ -1044,43 +2566,53 @@ class TimeRangeSearchWindow:
                 messagebox.showerror("Error", "Invalid datetime format. Please use YYYY-MM-DD for date and HH:MM for time")
                 return
             
-            # Get logs for the time range
-            self.current_logs = self.log_manager.get_logs_for_time_range(start_datetime, end_datetime)
-            
-            # Clear and update log display
-            self.log_text.config(state='normal')
-            self.log_text.delete(1.0, tk.END)
-            
-            if self.current_logs:
-                for log_entry in self.current_logs:
-                    self.log_text.insert(tk.END, log_entry + "\n")
-                
-                # Scroll to top
-                self.log_text.see(1.0)
-                
-                # Update results info
-                log_count = len(self.current_logs)
-                self.results_var.set(f"Found {log_count} log entries from {start_datetime_str} to {end_datetime_str}")
-                
-                # Enable export and graph buttons
-                self.export_button.config(state="normal")
-                self.graph_button.config(state="normal")
-                
-            else:
-                self.log_text.insert(tk.END, "No logs found for the specified time range.\n")
-                self.results_var.set("No logs found for the specified time range")
-                self.export_button.config(state="disabled")
-                self.graph_button.config(state="disabled")
-            
-            # Set back to read-only after updating content
-            self.log_text.config(state='disabled')
+            # Index the matching lines in the background; the view shows them as they are found
+            self.current_logs = self.log_manager.get_log_rows_for_time_range(start_datetime, end_datetime)
+            self.export_button.config(state="disabled")
+            self.graph_button.config(state="disabled")
+            self.search_button.config(text="Cancel Search", command=self.cancel_search)
+            self.results_var.set(f"Searching logs from {start_datetime_str} to {end_datetime_str}...")
+            self.log_view.load(self.current_logs, placeholder="No logs found for the specified time range.",
+                               on_progress=self.on_search_progress,
+                               on_done=lambda error: self.on_search_done(error, start_datetime_str, end_datetime_str))
             
         except Exception as e:
             messagebox.showerror("Search Error", f"Failed to search logs: {str(e)}")
     
+    def on_search_progress(self, rows):
+        self.results_var.set(f"Searching... {rows} log entries found so far")
+    
+    def on_search_done(self, error, start_datetime_str, end_datetime_str):
+        """Called by the log view once the search has been indexed"""
+        self.search_button.config(text="Search Logs", command=self.search_logs)
+        if error is not None:
+            messagebox.showerror("Search Error", f"Failed to search logs: {str(error)}")
+        elif len(self.current_logs):
+            # Update results info
+            log_count = len(self.current_logs)
+            self.results_var.set(f"Found {log_count} log entries from {start_datetime_str} to {end_datetime_str}")
+            
+            # Enable export and graph buttons
+            self.export_button.config(state="normal")
+            self.graph_button.config(state="normal")
+        else:
+            self.results_var.set("No logs found for the specified time range")
+    
+    def cancel_search(self):
+        """Stop a running search; lines found so far stay in the view"""
+        self.log_view.cancel_scan()
+        self.log_view.render()
+        self.log_view.update_status()
+        self.search_button.config(text="Search Logs", command=self.search_logs)
+        self.results_var.set(f"Search cancelled after {len(self.current_logs)} log entries")
+        if len(self.current_logs):
+            # The partial result can still be exported and graphed
+            self.export_button.config(state="normal")
+            self.graph_button.config(state="normal")
+    
     def show_history_graph(self):
         """Show the history graph in a modal window"""
-        if not self.current_logs:
+        if not len(self.current_logs):
             messagebox.showinfo("No Data", "No logs to generate graph. Please search for logs first.")
             return
         
@@ -1096,17 +2628,24 @@ class TimeRangeSearchWindow:
                 messagebox.showerror("Error", "Invalid datetime format in fields")
                 return
             
+            # Plot stored samples directly; the modal falls back to parsing the text logs
+            samples = self.log_manager.get_samples_for_time_range(start_datetime, end_datetime,
+                                                                  max_points=self.GRAPH_POINTS)
+            
             # Create and show the search result modal
-            SearchResultModal(self.window, start_datetime, end_datetime, self.current_logs, self.theme_manager, self.responsive_design)
+            SearchResultModal(self.window, start_datetime, end_datetime, self.current_logs, self.theme_manager, self.responsive_design,
+                              warning_temp=self.warning_temp, critical_temp=self.critical_temp, samples=samples)
             
         except Exception as e:
             messagebox.showerror("Graph Error", f"Failed to generate graph: {str(e)}")
     
     def export_logs(self):
-        """Export the currently displayed logs to file"""
-        if not self.current_logs:
+        """Export the selected time range on a worker thread"""
+        if not len(self.current_logs):
             messagebox.showinfo("No Data", "No logs to export. Please search for logs first.")
             return
+        if self.export_thread is not None and self.export_thread.is_alive():
+            return
         
         try:
             start_datetime_str = f"{self.start_date_var.get()} {self.start_time_var.get()}"
@@ -1120,32 +2659,101 @@ class TimeRangeSearchWindow:
                 messagebox.showerror("Error", "Invalid datetime format in fields")
                 return
             
-            # Export logs using LogManager
-            success = self.log_manager.export_logs_to_file_with_time_range(start_datetime, end_datetime)
+            compression = self.export_compression_var.get()
+            compression = None if compression == 'none' else compression
             
-            if success:
-                messagebox.showinfo("Export Successful", 
-                                  "Logs exported successfully to Downloads folder!")
-            else:
-                messagebox.showinfo("Export Failed", "Failed to export logs")
+            # Export logs using LogManager; the file is streamed, never held in memory
+            self.export_cancel = threading.Event()
+            self.export_status = (None, 0)
+            self.export_result = None
+            self.export_thread = threading.Thread(target=self.run_export,
+                                                  args=(start_datetime, end_datetime,
+                                                        self.export_format_var.get(), compression),
+                                                  daemon=True)
+            
+            self.export_button.config(state="disabled")
+            self.export_progress['value'] = 0
+            self.export_progress.grid()
+            self.cancel_export_button.grid()
+            self.results_var.set("Exporting...")
+            
+            self.export_thread.start()
+            self.export_poll_id = self.window.after(self.EXPORT_POLL_MS, self.poll_export)
             
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export logs: {str(e)}")
     
+    def run_export(self, start_datetime, end_datetime, fmt, compression):
+        """Export thread body; results are handed to poll_export through attributes"""
+        self.export_result = self.log_manager.export_logs_to_file_with_time_range(
+            start_datetime, end_datetime, fmt, compression,
+            progress=self.on_export_progress, cancel_event=self.export_cancel)
+    
+    def on_export_progress(self, fraction, entries):
+        """Progress callback, called on the export thread (no Tk calls here)"""
+        self.export_status = (fraction, entries)
+    
+    def poll_export(self):
+        """Show export progress on the Tk thread until the export thread finishes"""
+        if self.export_thread.is_alive():
+            fraction, entries = self.export_status
+            if fraction is not None:
+                self.export_progress['value'] = min(max(fraction, 0.0), 1.0) * 100
+            self.results_var.set(f"Exporting... {entries} log entries written")
+            self.export_poll_id = self.window.after(self.EXPORT_POLL_MS, self.poll_export)
+            return
+        
+        self.export_poll_id = None
+        self.export_progress.grid_remove()
+        self.cancel_export_button.grid_remove()
+        self.export_button.config(state="normal")
+        
+        result = self.export_result
+        if result is None or result.error:
+            error = result.error if result is not None else "export thread stopped"
+            self.results_var.set("Export failed")
+            messagebox.showerror("Export Error", f"Failed to export logs: {error}")
+        elif result.cancelled:
+            self.results_var.set("Export cancelled")
+        elif not result.entries:
+            self.results_var.set("No logs found to export")
+            messagebox.showinfo("No Data", "No logs found to export for the specified time range.")
+        else:
+            self.results_var.set(f"Exported {result.entries} log entries")
+            messagebox.showinfo("Export Successful", 
+                              f"Logs exported successfully to Downloads folder!\n{result.path}")
+    
+    def cancel_export(self):
+        """Ask the running export to stop; poll_export resets the controls"""
+        if self.export_cancel is not None:
+            self.export_cancel.set()
+            self.results_var.set("Cancelling export...")
+    
     def on_close(self):
         """Handle window close"""
+        # A running export is cancelled (its partial file removed) rather than left behind
+        if self.export_cancel is not None:
+            self.export_cancel.set()
+        if self.export_poll_id is not None:
+            self.window.after_cancel(self.export_poll_id)
+            self.export_poll_id = None
+        self.log_view.destroy()
         self.window.destroy()
 
 class LiveLogWindow:
     """Live Log window for displaying real-time temperature logs"""
-    def __init__(self, parent, log_manager, theme_manager, responsive_design):
+    def __init__(self, parent, log_manager, theme_manager, responsive_design,
+                 warning_temp=27, critical_temp=30):
         self.parent = parent
         self.log_manager = log_manager
         self.theme_manager = theme_manager
         self.responsive_design = responsive_design
+        self.warning_temp = warning_temp
+        self.critical_temp = critical_temp
         self.colors = self.theme_manager.get_theme()
         self.window = None
         self.is_running = True
+        self.last_seq = 0
         self.create_window()
         
     def create_window(self):
@@ -1221,19 +2829,10 @@ class LiveLogWindow:
         log_frame.columnconfigure(0, weight=1)
         log_frame.rowconfigure(0, weight=1)
         
-        # Create scrollable text area for logs
-        self.log_text = scrolledtext.ScrolledText(
-            log_frame,
-            wrap=tk.WORD,
-            width=120,
-            height=30,
-            bg=text_bg,
-            fg=self.colors['text_primary'],
-            font=("Consolas", 9),
-            insertbackground=self.colors['text_primary'],
-            state='disabled'
-        )
-        self.log_text.grid(row=0, column=0, sticky='nsew')
+        # Log view over the daily log files; only the visible lines are read
+        self.log_view = VirtualLogView(log_frame, bg=text_bg, fg=self.colors['text_primary'],
+                                       placeholder="No logs available yet...", follow=True)
+        self.log_view.grid(row=0, column=0, sticky='nsew')
         
         # Load existing logs
         self.refresh_log_display()
@@ -1241,69 +2840,1804 @@ class LiveLogWindow:
         # Start live updates
         self.update_live_log()
         
-        # Handle window close
-        self.window.protocol("WM_DELETE_WINDOW", self.on_close)
+        # Handle window close
+        self.window.protocol("WM_DELETE_WINDOW", self.on_close)
+    
+    def show_time_search_modal(self):
+        """Show the time range search and export modal window"""
+        TimeRangeSearchWindow(self.window, self.log_manager, self.theme_manager, self.responsive_design,
+                              warning_temp=self.warning_temp, critical_temp=self.critical_temp)
+    
+    def refresh_log_display(self):
+        """Refresh the log display with current logs"""
+        # Lines logged after this point arrive through the log buffer
+        self.last_seq = self.log_manager.log_buffer.last_seq
+        self.log_view.load(self.log_manager.get_live_log_rows())
+    
+    def update_live_log(self):
+        """Update the log display with new entries"""
+        if self.is_running and self.window.winfo_exists():
+            # Get only new logs since last update (file-backed rows read them from the file)
+            self.last_seq, new_logs = self.log_manager.log_buffer.entries_after(self.last_seq)
+            self.log_view.update_source(new_logs)
+            
+            # Schedule next update
+            self.window.after(1000, self.update_live_log)
+    
+    def on_close(self):
+        """Handle window close"""
+        self.is_running = False
+        self.log_view.destroy()
+        self.window.destroy()
+
+class LogTimestampParser:
+    """Fast handling of the fixed "[YYYY-MM-DD HH:MM:SS]" prefix that LogManager writes.
+    
+    The prefix sorts lexicographically, so range checks compare strings and most
+    lines never become datetime objects; the ones that do go through
+    datetime.fromisoformat rather than strptime.
+    """
+    FORMAT = "%Y-%m-%d %H:%M:%S"
+    
+    @classmethod
+    def range_stamps(cls, start_datetime, end_datetime):
+        """Inclusive (start, end) stamps matching `start <= line time <= end` for whole-second lines"""
+        if start_datetime.microsecond:
+            start_datetime += datetime.timedelta(microseconds=1000000 - start_datetime.microsecond)
+        return start_datetime.strftime(cls.FORMAT), end_datetime.strftime(cls.FORMAT)
+    
+    @staticmethod
+    def parse(stamp):
+        """datetime for a stamp, or None if it is not a valid timestamp"""
+        try:
+            return datetime.datetime.fromisoformat(stamp)
+        except (TypeError, ValueError):
+            return None
+    
+    @classmethod
+    def parse_line(cls, line):
+        """datetime of a log line's timestamp, or None if it has none"""
+        if line[:1] != '[' or line[20:21] != ']':
+            return None
+        return cls.parse(line[1:20])
+
+class LogSampleScanner:
+    """Reads one metric's (timestamp, value) pairs straight from the bytes of .logs files.
+    
+    Plain files are memory-mapped and archived ones decompressed into one buffer;
+    NumPy then finds the line ends, keeps the "[YYYY-MM-DD HH:MM:SS] <metric>: <value>°C"
+    lines and decodes their digits column by column, so no line ever becomes a str.
+    Works for UTF-8 and cp1252 files (UTF-16 files have to be read as text).
+    """
+    STAMP_DIGITS = np.array([1, 2, 3, 4, 6, 7, 9, 10, 12, 13, 15, 16, 18, 19])
+    VALUE_WIDTH = 10  # Longest value text, e.g. "-1234.5678"
+    
+    def __init__(self, metric='Max Temperature'):
+        self.field = np.frombuffer(f"] {metric}: ".encode('utf-8'), dtype=np.uint8)
+    
+    def scan_file(self, log_path, start_datetime=None, end_datetime=None):
+        """(epoch_ms, values) arrays of the file's lines between two naive local datetimes"""
+        begin, stop = 0, None
+        index = LogTimeIndex(log_path)
+        if start_datetime is not None and index.exists():
+            begin = index.offset_for(start_datetime)
+            # A few seconds late: lines from concurrent loggers can be slightly out of order
+            stop = index.offset_after(end_datetime + datetime.timedelta(seconds=5))
+        
+        archive = LogArchive(log_path)
+        if archive.exists() and (not os.path.exists(log_path) or archive.has_tail()):
+            with LogArchive.open_log(log_path) as f:
+                f.seek(begin)
+                data = f.read(-1 if stop is None else max(0, stop - begin))
+            return self.scan(np.frombuffer(data, dtype=np.uint8), start_datetime, end_datetime)
+        
+        with open(log_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size <= begin:
+                return np.empty(0, dtype=np.int64), np.empty(0)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                buffer = np.frombuffer(mapped, dtype=np.uint8)
+                try:
+                    return self.scan(buffer[begin:stop], start_datetime, end_datetime)
+                finally:
+                    del buffer  # The map cannot close while an array still points into it
+    
+    def scan(self, buffer, start_datetime=None, end_datetime=None):
+        """(epoch_ms, values) of the metric's lines in a uint8 buffer of whole lines"""
+        ends = np.flatnonzero(buffer == 0x0A)
+        starts = np.concatenate(([0], ends + 1))[:len(ends)]
+        if len(buffer) >= 3 and buffer[:3].tobytes() == codecs.BOM_UTF8:
+            starts[:1] = 3
+        ends = ends - (buffer[np.maximum(ends - 1, 0)] == 0x0D)  # Files written on Windows end in "\r\n"
+        
+        # Candidates: long enough for stamp, field, one digit and "°C"; narrowed a column
+        # at a time (the first metric letter already drops most other lines)
+        keep = ends - starts >= 20 + len(self.field) + 3
+        starts, ends = starts[keep], ends[keep]
+        for column in [22, 0] + [20 + i for i in range(len(self.field)) if i != 2]:
+            byte = 0x5B if column == 0 else self.field[column - 20]  # "[" opens the stamp
+            keep = buffer[starts + column] == byte
+            starts, ends = starts[keep], ends[keep]
+        
+        # "°C" is C2 B0 43 in UTF-8 and B0 43 in cp1252
+        utf8 = (buffer[ends - 3] == 0xC2) & (buffer[ends - 2] == 0xB0) & (buffer[ends - 1] == 0x43)
+        cp1252 = (buffer[ends - 2] == 0xB0) & (buffer[ends - 1] == 0x43)
+        keep = utf8 | cp1252
+        value_starts = starts[keep] + 20 + len(self.field)
+        value_ends = ends[keep] - np.where(utf8[keep], 3, 2)
+        starts = starts[keep]
+        
+        digits = buffer[starts[:, None] + self.STAMP_DIGITS].astype(np.int64) - 0x30
+        stamp_ok = np.all((digits >= 0) & (digits <= 9), axis=1)
+        values, value_ok = self._parse_values(buffer, value_starts, value_ends)
+        keep = stamp_ok & value_ok
+        digits, values = digits[keep], values[keep]
+        
+        year = digits[:, 0] * 1000 + digits[:, 1] * 100 + digits[:, 2] * 10 + digits[:, 3]
+        month = digits[:, 4] * 10 + digits[:, 5]
+        day = digits[:, 6] * 10 + digits[:, 7]
+        seconds = ((digits[:, 8] * 10 + digits[:, 9]) * 3600 + (digits[:, 10] * 10 + digits[:, 11]) * 60
+                   + digits[:, 12] * 10 + digits[:, 13])
+        local = self._days_from_civil(year, month, day) * 86400 + seconds
+        
+        if start_datetime is not None:
+            # Same whole-second bounds as LogTimestampParser.range_stamps
+            first = self._local_seconds(start_datetime) + (1 if start_datetime.microsecond else 0)
+            keep = (local >= first) & (local <= self._local_seconds(end_datetime))
+            local, values = local[keep], values[keep]
+        return self._local_to_epoch_ms(local), values
+    
+    def _parse_values(self, buffer, value_starts, value_ends):
+        """Decimal values ("-12.5") between the given offsets; (values, valid mask)"""
+        widths = value_ends - value_starts
+        negative = buffer[value_starts] == 0x2D  # "-"
+        valid = (widths > negative) & (widths <= self.VALUE_WIDTH)
+        mantissa = np.zeros(len(widths), dtype=np.int64)
+        decimals = np.zeros(len(widths), dtype=np.int64)
+        dots = np.zeros(len(widths), dtype=np.int64)
+        
+        # Horner's scheme over the columns: mantissa of the digits, and digits after the dot
+        for column in range(self.VALUE_WIDTH):
+            inside = (column < widths) & ~(negative & (column == 0))
+            if not inside.any():
+                break
+            chars = buffer[np.minimum(value_starts + column, len(buffer) - 1)]
+            is_dot = inside & (chars == 0x2E)
+            is_digit = inside & (chars >= 0x30) & (chars <= 0x39)
+            valid &= is_dot | is_digit | ~inside
+            mantissa = np.where(is_digit, mantissa * 10 + (chars.astype(np.int64) - 0x30), mantissa)
+            decimals += is_digit & (dots > 0)
+            dots += is_dot
+        valid &= dots <= 1
+        
+        values = mantissa / 10.0 ** decimals
+        return np.where(negative, -values, values), valid
+    
+    @staticmethod
+    def _days_from_civil(year, month, day):
+        """Days since 1970-01-01 of proleptic Gregorian dates (vectorized)"""
+        year = year - (month <= 2)
+        era = year // 400
+        year_of_era = year - era * 400
+        day_of_year = (153 * (month + np.where(month > 2, -3, 9)) + 2) // 5 + day - 1
+        day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+        return era * 146097 + day_of_era - 719468
+    
+    @staticmethod
+    def _local_seconds(moment):
+        """Naive local datetime as seconds since 1970-01-01 00:00 local (the scale scan() computes)"""
+        return (moment - datetime.datetime(1970, 1, 1)) // datetime.timedelta(seconds=1)
+    
+    @staticmethod
+    def _local_to_epoch_ms(local):
+        """Epoch milliseconds for naive local seconds, with the UTC offset of each distinct hour"""
+        if not len(local):
+            return np.empty(0, dtype=np.int64)
+        hours, inverse = np.unique(local // 3600, return_inverse=True)
+        epochs = np.array([int((datetime.datetime(1970, 1, 1) + datetime.timedelta(hours=int(hour))).timestamp())
+                           for hour in hours], dtype=np.int64)
+        return (epochs[inverse] + local % 3600) * 1000
+
+class RollupTier(namedtuple('RollupTier', ['name', 'seconds', 'period'])):
+    """One rollup resolution: bucket length in seconds and the strftime period of its files"""
+    __slots__ = ()
+
+class SampleRollups:
+    """Pre-aggregated min/max/avg/count/p95 per metric and device, next to the sample segments.
+    
+    Samples are folded into 1-minute, 1-hour and 1-day buckets (local time, so a
+    1-day bucket is a calendar day) as they arrive. A bucket is written once a sample
+    for a later bucket arrives, or on close(); until then queries read it from memory.
+    p95 is the nearest-rank 95th percentile of the values rounded to 0.1 °C, so an open
+    bucket only keeps a small histogram. A bucket written in two parts (across a
+    restart) is merged when read, taking the larger p95. Open buckets lost to a crash
+    are recomputed from the raw samples at start-up (SampleStore.recover_rollups).
+    """
+    TIERS = (RollupTier('1m', 60, '%Y-%m-%d'),
+             RollupTier('1h', 3600, '%Y-%m'),
+             RollupTier('1d', 86400, '%Y'))
+    DTYPE = np.dtype([('ts', '<i8'), ('metric', '<u2'), ('device', '<u2'), ('count', '<u4'),
+                      ('min', '<f4'), ('max', '<f4'), ('sum', '<f8'), ('p95', '<f4')])
+    FILE_PREFIX = 'temperature_rollup_'
+    P95_SCALE = 10  # Histogram bins per °C
+    
+    def __init__(self, directory, prefix=FILE_PREFIX):
+        self.directory = directory
+        self.prefix = prefix  # One set of files per sample backend: ids are per catalog
+        self.lock = threading.RLock()
+        # tier name -> {(metric id, device id): [start_ms, count, min, max, sum, histogram]}
+        self.open = {tier.name: {} for tier in self.TIERS}
+    
+    def tier_for(self, resolution):
+        """Coarsest tier whose buckets are no longer than resolution seconds (None: use raw samples)"""
+        chosen = None
+        for tier in self.TIERS:
+            if tier.seconds <= resolution:
+                chosen = tier
+        return chosen
+    
+    def tier_path(self, tier, day):
+        return os.path.join(self.directory, f"{self.prefix}{tier.name}_{day.strftime(tier.period)}.bin")
+    
+    @staticmethod
+    def bucket_starts(ts_ms, seconds):
+        """Start (epoch ms) of the local-time bucket of `seconds` that holds each timestamp"""
+        ts_ms = np.asarray(ts_ms, dtype=np.int64)
+        hours, inverse = np.unique(ts_ms // 3600000, return_inverse=True)
+        offsets = np.array([datetime.datetime.fromtimestamp(int(hour) * 3600).astimezone().utcoffset().total_seconds()
+                            for hour in hours], dtype=np.int64)[inverse] * 1000
+        local = ts_ms + offsets
+        if seconds < 86400:
+            size = seconds * 1000
+            return local // size * size - offsets
+        # Days are not always 24 hours long: use the real local midnight
+        days, inverse = np.unique(local // 86400000, return_inverse=True)
+        midnights = np.array([int(datetime.datetime.combine(datetime.date(1970, 1, 1) + datetime.timedelta(days=int(day)),
+                                                            datetime.time.min).timestamp() * 1000)
+                              for day in days], dtype=np.int64)
+        return midnights[inverse]
+    
+    @staticmethod
+    def bucket_start(ts_ms, seconds):
+        """bucket_starts() for a single timestamp, without the array overhead"""
+        moment = datetime.datetime.fromtimestamp(ts_ms / 1000)
+        if seconds >= 86400:
+            return int(datetime.datetime.combine(moment.date(), datetime.time.min).timestamp() * 1000)
+        offset = int(moment.astimezone().utcoffset().total_seconds() * 1000)
+        size = seconds * 1000
+        return (ts_ms + offset) // size * size - offset
+    
+    def add(self, ts_ms, samples):
+        """Fold (metric id, device id, value) samples taken at ts_ms into the open buckets"""
+        closed = []
+        with self.lock:
+            for tier in self.TIERS:
+                start = self.bucket_start(ts_ms, tier.seconds)
+                buckets = self.open[tier.name]
+                for metric, device, value in samples:
+                    bucket = buckets.get((metric, device))
+                    if bucket is None or bucket[0] != start:
+                        if bucket is not None:
+                            closed.append((tier, self._record(metric, device, bucket)))
+                        bucket = buckets[(metric, device)] = [start, 0, value, value, 0.0, {}]
+                    bucket[1] += 1
+                    bucket[2] = min(bucket[2], value)
+                    bucket[3] = max(bucket[3], value)
+                    bucket[4] += value
+                    rounded = round(value * self.P95_SCALE)
+                    bucket[5][rounded] = bucket[5].get(rounded, 0) + 1
+            self._write(closed)
+    
+    def _record(self, metric, device, bucket):
+        start, count, low, high, total, histogram = bucket
+        rank = (count * 95 + 99) // 100
+        seen = 0
+        for rounded in sorted(histogram):
+            seen += histogram[rounded]
+            if seen >= rank:
+                break
+        return (start, metric, device, count, low, high, total, rounded / self.P95_SCALE)
+    
+    def _write(self, closed):
+        """Append closed bucket records to their tier files"""
+        by_path = {}
+        for tier, record in closed:
+            day = datetime.date.fromtimestamp(record[0] / 1000)
+            by_path.setdefault(self.tier_path(tier, day), []).append(record)
+        for path, records in by_path.items():
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path, 'ab') as f:
+                np.array(records, dtype=self.DTYPE).tofile(f)
+    
+    def close(self):
+        """Write every open bucket"""
+        with self.lock:
+            closed = [(tier, self._record(metric, device, bucket))
+                      for tier in self.TIERS
+                      for (metric, device), bucket in self.open[tier.name].items()]
+            self._write(closed)
+            for tier in self.TIERS:
+                self.open[tier.name].clear()
+    
+    def query(self, tier, start_ms, end_ms, metric=None, device=None):
+        """Bucket records of a tier starting between start_ms and end_ms, open buckets included"""
+        day = datetime.date.fromtimestamp(start_ms / 1000)
+        last_day = datetime.date.fromtimestamp(end_ms / 1000)
+        paths = []
+        while day <= last_day:
+            path = self.tier_path(tier, day)
+            if path not in paths:
+                paths.append(path)
+            day += datetime.timedelta(days=1)
+        
+        parts = []
+        for path in paths:
+            try:
+                parts.append(np.fromfile(path, dtype=self.DTYPE))
+            except (FileNotFoundError, ValueError):
+                continue
+        with self.lock:
+            parts.append(np.array([self._record(metric_id, device_id, bucket)
+                                   for (metric_id, device_id), bucket in self.open[tier.name].items()],
+                                  dtype=self.DTYPE))
+        records = np.concatenate(parts)
+        
+        # Buckets that start before start_ms still count if they overlap the range
+        first = self.bucket_start(start_ms, tier.seconds)
+        keep = (records['ts'] >= first) & (records['ts'] <= end_ms)
+        if metric is not None:
+            keep &= records['metric'] == metric
+        if device is not None:
+            keep &= records['device'] == device
+        return self._merge(records[keep])
+    
+    def _merge(self, records):
+        """Sort by time and combine records of the same bucket"""
+        order = np.lexsort((records['device'], records['metric'], records['ts']))
+        records = records[order]
+        if len(records) < 2:
+            return records
+        keys = np.stack([records['ts'], records['metric'], records['device']])
+        starts = np.flatnonzero(np.r_[True, np.any(keys[:, 1:] != keys[:, :-1], axis=0)])
+        if len(starts) == len(records):
+            return records
+        merged = records[starts].copy()
+        merged['count'] = np.add.reduceat(records['count'], starts)
+        merged['min'] = np.minimum.reduceat(records['min'], starts)
+        merged['max'] = np.maximum.reduceat(records['max'], starts)
+        merged['sum'] = np.add.reduceat(records['sum'], starts)
+        merged['p95'] = np.maximum.reduceat(records['p95'], starts)
+        return merged
+    
+    def aggregate(self, records, tier):
+        """Bucket records of a tier for raw sample records (SampleStore.DTYPE)"""
+        if not len(records):
+            return np.empty(0, dtype=self.DTYPE)
+        starts = self.bucket_starts(records['ts'], tier.seconds)
+        values = records['value'].astype(np.float64)
+        rounded = np.round(values * self.P95_SCALE)
+        order = np.lexsort((rounded, records['device'], records['metric'], starts))
+        starts, metrics, devices = starts[order], records['metric'][order], records['device'][order]
+        values, rounded = values[order], rounded[order]
+        
+        new_group = np.r_[True, (np.diff(starts) != 0) | (np.diff(metrics) != 0) | (np.diff(devices) != 0)]
+        begins = np.flatnonzero(new_group)
+        counts = np.diff(np.r_[begins, len(values)])
+        
+        buckets = np.empty(len(begins), dtype=self.DTYPE)
+        buckets['ts'] = starts[begins]
+        buckets['metric'] = metrics[begins]
+        buckets['device'] = devices[begins]
+        buckets['count'] = counts
+        buckets['min'] = np.minimum.reduceat(values, begins)
+        buckets['max'] = np.maximum.reduceat(values, begins)
+        buckets['sum'] = np.add.reduceat(values, begins)
+        # Values are sorted within each bucket: nearest rank is an index
+        buckets['p95'] = rounded[begins + (counts * 95 + 99) // 100 - 1] / self.P95_SCALE
+        return buckets
+    
+    def rebuild_day(self, day, records):
+        """Replace every tier's buckets for one day with ones computed from its raw records"""
+        day_start = int(datetime.datetime.combine(day, datetime.time.min).timestamp() * 1000)
+        day_end = int(datetime.datetime.combine(day + datetime.timedelta(days=1), datetime.time.min).timestamp() * 1000)
+        with self.lock:
+            for tier in self.TIERS:
+                path = self.tier_path(tier, day)
+                try:
+                    existing = np.fromfile(path, dtype=self.DTYPE)
+                except (FileNotFoundError, ValueError):
+                    existing = np.empty(0, dtype=self.DTYPE)
+                existing = existing[(existing['ts'] < day_start) | (existing['ts'] >= day_end)]
+                buckets = np.concatenate([existing, self.aggregate(records, tier)])
+                buckets = buckets[np.argsort(buckets['ts'], kind='stable')]
+                
+                os.makedirs(self.directory, exist_ok=True)
+                buckets.tofile(path + '.tmp')
+                os.replace(path + '.tmp', path)
+                
+                # The rebuilt records already cover the open buckets of that day
+                open_buckets = self.open[tier.name]
+                for key in [key for key, bucket in open_buckets.items() if day_start <= bucket[0] < day_end]:
+                    del open_buckets[key]
+    
+    def drop_before(self, tier, day):
+        """Delete the tier files whose whole period ends on or before day; returns how many"""
+        prefix = f"{self.prefix}{tier.name}_"
+        removed = 0
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return removed
+        for name in names:
+            if not (name.startswith(prefix) and name.endswith('.bin')):
+                continue
+            period = name[len(prefix):-4]
+            try:
+                end = datetime.datetime.strptime(period, tier.period).date()
+            except ValueError:
+                continue
+            while end.strftime(tier.period) == period:
+                end += datetime.timedelta(days=1)
+            if end <= day:
+                with self.lock:
+                    os.remove(os.path.join(self.directory, name))
+                removed += 1
+        return removed
+    
+    @staticmethod
+    def summary(records):
+        """count/min/max/avg/p95 over bucket records, or None without data.
+        
+        p95 across buckets is the count-weighted 95th percentile of the bucket p95s.
+        That overstates it by about the spread inside one bucket, which for 1-minute
+        buckets of slowly changing temperatures is a fraction of a degree.
+        """
+        if not len(records):
+            return None
+        count = int(records['count'].sum())
+        order = np.argsort(records['p95'], kind='stable')
+        cumulative = np.cumsum(records['count'][order])
+        p95 = float(records['p95'][order][np.searchsorted(cumulative, (count * 95 + 99) // 100)])
+        return {'count': count,
+                'min': float(records['min'].min()),
+                'max': float(records['max'].max()),
+                'avg': float(records['sum'].sum() / count),
+                'p95': p95}
+
+class SampleStore:
+    """Append-only binary store of numeric samples in daily segment files.
+    
+    Every sample is one fixed-width little-endian record: epoch milliseconds (int64),
+    metric id (uint16), device id (uint16) and value (float32). Metric and device
+    names are mapped to ids in a small JSON catalog next to the segments, so reads
+    are a single np.fromfile per day with no string parsing.
+    """
+    RECORD = struct.Struct('<qHHf')
+    DTYPE = np.dtype([('ts', '<i8'), ('metric', '<u2'), ('device', '<u2'), ('value', '<f4')])
+    SEGMENT_PREFIX = 'temperature_samples_'
+    CATALOG_FILE = 'temperature_samples_catalog.json'
+    ROLLUP_PREFIX = SampleRollups.FILE_PREFIX
+    
+    TEXT_SAMPLE_RE = re.compile(r'^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] ([A-Za-z][A-Za-z ]*): (-?\d+(?:\.\d+)?)°C$')
+    TEXT_STORAGE_RE = re.compile(r'^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] Storage temperatures: (.+)$')
+    STORAGE_METRIC = 'Storage Temperature'
+    
+    def __init__(self, directory):
+        self.directory = directory
+        self.lock = threading.RLock()
+        self.catalog_path = os.path.join(directory, self.CATALOG_FILE)
+        self.metrics = []
+        self.devices = ['']  # Device id 0 means "not device specific"
+        self._load_catalog()
+        self.rollups = SampleRollups(directory, self.ROLLUP_PREFIX)
+    
+    def _load_catalog(self):
+        try:
+            with open(self.catalog_path, 'r', encoding='utf-8') as f:
+                catalog = json.load(f)
+            self.metrics = list(catalog.get('metrics', []))
+            self.devices = list(catalog.get('devices', [''])) or ['']
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠️ Could not read sample catalog: {e}")
+    
+    def _save_catalog(self):
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = self.catalog_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'metrics': self.metrics, 'devices': self.devices}, f, indent=2)
+        os.replace(temp_path, self.catalog_path)
+    
+    def _id_for(self, names, name):
+        """Id of name in names (metrics or devices), adding it to the catalog if new"""
+        try:
+            return names.index(name)
+        except ValueError:
+            if len(names) > 0xFFFF:
+                raise ValueError(f"Sample catalog is full, cannot add {name!r}")
+            names.append(name)
+            self._save_catalog()
+            return len(names) - 1
+    
+    def metric_id(self, metric):
+        with self.lock:
+            return self._id_for(self.metrics, metric)
+    
+    def device_id(self, device):
+        with self.lock:
+            return self._id_for(self.devices, device or '')
+    
+    def segment_path(self, day):
+        """Segment file for a date (local time, same days as the .logs files)"""
+        return os.path.join(self.directory, f"{self.SEGMENT_PREFIX}{day.strftime('%Y-%m-%d')}.bin")
+    
+    def append(self, metric, value, device='', timestamp=None):
+        """Append one sample; timestamp is epoch seconds and defaults to now"""
+        self.append_many([(metric, device, value)], timestamp)
+    
+    def append_many(self, samples, timestamp=None):
+        """Append (metric, device, value) samples that share one timestamp"""
+        if timestamp is None:
+            timestamp = time.time()
+        ts_ms = int(timestamp * 1000)
+        day = datetime.date.fromtimestamp(timestamp)
+        with self.lock:
+            ids = [(self._id_for(self.metrics, metric), self._id_for(self.devices, device or ''), float(value))
+                   for metric, device, value in samples]
+            data = b''.join(self.RECORD.pack(ts_ms, metric, device, value) for metric, device, value in ids)
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self.segment_path(day), 'ab') as f:
+                f.write(data)
+            self.rollups.add(ts_ms, ids)
+    
+    def close(self):
+        """Write the rollup buckets still open"""
+        self.rollups.close()
+    
+    def read_day(self, day):
+        """All records of one day as a structured array sorted by time"""
+        path = self.segment_path(day)
+        try:
+            records = np.fromfile(path, dtype=self.DTYPE)
+        except (FileNotFoundError, ValueError):
+            return np.empty(0, dtype=self.DTYPE)
+        
+        # np.fromfile ignores a partially written trailing record; keep time order
+        if len(records) and np.any(np.diff(records['ts']) < 0):
+            records = records[np.argsort(records['ts'], kind='stable')]
+        return records
+    
+    def query(self, start_datetime, end_datetime, metric=None, device=None):
+        """Records between two naive local datetimes (inclusive), optionally filtered"""
+        start_ms = int(start_datetime.timestamp() * 1000)
+        end_ms = int(end_datetime.timestamp() * 1000)
+        
+        parts = []
+        day = start_datetime.date()
+        while day <= end_datetime.date():
+            records = self.read_day(day)
+            if len(records):
+                lo = np.searchsorted(records['ts'], start_ms, side='left')
+                hi = np.searchsorted(records['ts'], end_ms, side='right')
+                parts.append(records[lo:hi])
+            day += datetime.timedelta(days=1)
+        records = np.concatenate(parts) if parts else np.empty(0, dtype=self.DTYPE)
+        
+        if metric is not None:
+            if metric not in self.metrics:
+                return records[:0]
+            records = records[records['metric'] == self.metrics.index(metric)]
+        if device is not None:
+            if device not in self.devices:
+                return records[:0]
+            records = records[records['device'] == self.devices.index(device)]
+        return records
+    
+    def query_rollups(self, tier, start_datetime, end_datetime, metric=None, device=None):
+        """Rollup buckets of a tier between two naive local datetimes, optionally filtered"""
+        metric_id = device_id = None
+        if metric is not None:
+            if metric not in self.metrics:
+                return np.empty(0, dtype=SampleRollups.DTYPE)
+            metric_id = self.metrics.index(metric)
+        if device is not None:
+            if device not in self.devices:
+                return np.empty(0, dtype=SampleRollups.DTYPE)
+            device_id = self.devices.index(device)
+        return self.rollups.query(tier, int(start_datetime.timestamp() * 1000), int(end_datetime.timestamp() * 1000),
+                                  metric_id, device_id)
+    
+    @staticmethod
+    def local_datenums(ts_ms):
+        """Convert epoch milliseconds to matplotlib date numbers in local time"""
+        ts_ms = np.asarray(ts_ms, dtype=np.int64)
+        if len(ts_ms) == 0:
+            return np.empty(0)
+        # UTC offset per distinct hour, so DST changes inside the range are honoured
+        hours, inverse = np.unique(ts_ms // 3600000, return_inverse=True)
+        offsets = np.array([datetime.datetime.fromtimestamp(int(hour) * 3600).astimezone().utcoffset().total_seconds()
+                            for hour in hours]) * 1000
+        epoch = mdates.date2num(datetime.datetime(1970, 1, 1))
+        return (ts_ms + offsets[inverse]) / 86400000 + epoch
+    
+    def render_lines(self, records):
+        """Format records as the equivalent .logs lines (the text view of the store)"""
+        lines = []
+        storage_id = self.metrics.index(self.STORAGE_METRIC) if self.STORAGE_METRIC in self.metrics else -1
+        pending_ts, pending = None, []
+        
+        def flush():
+            if pending:
+                details = ", ".join(f"{device}: {value:.1f}°C" for device, value in pending)
+                lines.append(f"[{pending_ts}] Storage temperatures: {details}")
+                pending.clear()
+        
+        for ts_ms, metric, device, value in records.tolist():
+            stamp = datetime.datetime.fromtimestamp(ts_ms / 1000).strftime("%Y-%m-%d %H:%M:%S")
+            if metric == storage_id:
+                if stamp != pending_ts:
+                    flush()
+                    pending_ts = stamp
+                pending.append((self.devices[device], value))
+                continue
+            flush()
+            lines.append(f"[{stamp}] {self.metrics[metric]}: {value:.1f}°C")
+        flush()
+        return lines
+    
+    @classmethod
+    def parse_text_line(cls, line):
+        """(timestamp, [(metric, device, value), ...]) for a sample line of a .logs file, else None"""
+        match = cls.TEXT_SAMPLE_RE.match(line)
+        if match:
+            stamp, metric, value = match.groups()
+            return stamp, [(metric, '', float(value))]
+        
+        match = cls.TEXT_STORAGE_RE.match(line)
+        if match:
+            stamp, details = match.groups()
+            samples = []
+            for part in details.split('°C'):
+                device, _, value = part.lstrip(', ').rpartition(': ')
+                if device:
+                    try:
+                        samples.append((cls.STORAGE_METRIC, device, float(value)))
+                    except ValueError:
+                        continue
+            return (stamp, samples) if samples else None
+        return None
+    
+    def import_text_lines(self, day, lines):
+        """Import the sample lines of one day's .logs file into its segment.
+        
+        Only lines older than the first record already in the segment are imported,
+        so running the conversion again (or after the app started writing samples)
+        does not duplicate anything. Returns the number of records added.
+        """
+        with self.lock:  # Appends from a running monitor wait until the segment is replaced
+            existing = self.read_day(day)
+            # Text lines only have whole seconds: skip the second the store started in too
+            cutoff = int(existing['ts'][0]) // 1000 * 1000 if len(existing) else None
+            
+            rows = []
+            for line in lines:
+                parsed = self.parse_text_line(line)
+                if not parsed:
+                    continue
+                stamp, samples = parsed
+                line_time = LogTimestampParser.parse(stamp)
+                if line_time is None:
+                    continue
+                ts_ms = int(line_time.timestamp() * 1000)
+                if cutoff is not None and ts_ms >= cutoff:
+                    continue
+                for metric, device, value in samples:
+                    rows.append((ts_ms, self.metric_id(metric), self.device_id(device), value))
+            
+            if not rows:
+                return 0
+            
+            imported = np.array(rows, dtype=self.DTYPE)
+            records = np.concatenate([imported, existing])
+            records = records[np.argsort(records['ts'], kind='stable')]
+            
+            self._replace_day(day, records)
+            self.rollups.rebuild_day(day, records)
+            return len(rows)
+    
+    def recover_rollups(self):
+        """Rebuild the rollups of the latest day with samples from its raw records.
+        
+        Open buckets only live in memory, so if the last run was killed that day's
+        1m/1h/1d buckets are missing or hold part of their samples; a partial bucket
+        would later be merged with the new run's and give wrong statistics.
+        """
+        days = self.days()
+        if days:
+            self.rollups.rebuild_day(days[-1], self.read_day(days[-1]))
+    
+    def _replace_day(self, day, records):
+        path = self.segment_path(day)
+        records.tofile(path + '.tmp')
+        os.replace(path + '.tmp', path)
+    
+    def days(self):
+        """Dates that have samples, oldest first"""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        return sorted(datetime.datetime.strptime(name[len(self.SEGMENT_PREFIX):-4], "%Y-%m-%d").date()
+                      for name in names
+                      if re.fullmatch(re.escape(self.SEGMENT_PREFIX) + r'\d{4}-\d{2}-\d{2}\.bin', name))
+
+    def drop_before(self, day):
+        """Delete the samples of every day before day; returns the number of segments removed"""
+        removed = 0
+        for old_day in self.days():
+            if old_day >= day:
+                break
+            with self.lock:
+                os.remove(self.segment_path(old_day))
+            removed += 1
+        return removed
+
+class SQLiteSampleStore(SampleStore):
+    """SampleStore kept in one SQLite database (WAL mode) instead of daily segment files.
+    
+    Appends go through a queue to a single writer thread that inserts them in one
+    transaction per flush_interval. Every reading thread opens its own connection, so
+    with WAL a long range query never blocks ingestion (and vice versa). Samples are
+    indexed by (device, ts); queries for any device probe each device id in turn.
+    """
+    DATABASE_FILE = 'temperature_samples.sqlite3'
+    ROLLUP_PREFIX = 'temperature_rollup_sqlite_'  # Its own metric/device ids, so its own rollups
+    
+    def __init__(self, directory, flush_interval=1.0):
+        self.path = os.path.join(directory, self.DATABASE_FILE)
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue()
+        self._rows = []
+        self._last_flush = time.monotonic()
+        self._local = threading.local()  # Per-thread reader connections
+        self.write_lock = threading.Lock()
+        
+        os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS metrics (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+            CREATE TABLE IF NOT EXISTS devices (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+            CREATE TABLE IF NOT EXISTS samples (ts INTEGER NOT NULL, metric INTEGER NOT NULL,
+                                                device INTEGER NOT NULL, value REAL NOT NULL);
+            CREATE INDEX IF NOT EXISTS samples_device_ts ON samples (device, ts);
+        """)
+        super().__init__(directory)
+        
+        self._thread = threading.Thread(target=self._run, name="SQLiteSampleWriter", daemon=True)
+        self._thread.start()
+    
+    def _load_catalog(self):
+        self.metrics = [name for name, in self.connection.execute("SELECT name FROM metrics ORDER BY id")]
+        self.devices = [name for name, in self.connection.execute("SELECT name FROM devices ORDER BY id")] or ['']
+    
+    def _save_catalog(self):
+        with self.write_lock:
+            for table, names in (('metrics', self.metrics), ('devices', self.devices)):
+                self.connection.executemany(f"INSERT OR IGNORE INTO {table} (id, name) VALUES (?, ?)",
+                                            list(enumerate(names)))
+    
+    def append_many(self, samples, timestamp=None):
+        """Queue (metric, device, value) samples that share one timestamp for the writer"""
+        if timestamp is None:
+            timestamp = time.time()
+        ts_ms = int(timestamp * 1000)
+        with self.lock:
+            ids = [(self._id_for(self.metrics, metric), self._id_for(self.devices, device or ''), float(value))
+                   for metric, device, value in samples]
+            self.queue.put(('rows', [(ts_ms, metric, device, value) for metric, device, value in ids]))
+            self.rollups.add(ts_ms, ids)
+    
+    def flush(self, timeout=5.0):
+        """Block until every sample queued so far is committed"""
+        done = threading.Event()
+        self.queue.put(('flush', done))
+        return done.wait(timeout)
+    
+    def close(self, timeout=5.0):
+        """Commit the queue, stop the writer and write the open rollup buckets"""
+        if self._thread.is_alive():
+            self.queue.put(('close', None))
+            self._thread.join(timeout)
+        super().close()
+    
+    def _run(self):
+        running = True
+        while running:
+            timeout = None
+            if self._rows:
+                timeout = max(0.0, self.flush_interval - (time.monotonic() - self._last_flush))
+            try:
+                batch = [self.queue.get(timeout=timeout)]
+            except queue.Empty:
+                batch = []
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            waiters = []
+            force_commit = False
+            for kind, payload in batch:
+                if kind == 'rows':
+                    self._rows.extend(payload)
+                elif kind == 'flush':
+                    waiters.append(payload)
+                    force_commit = True
+                else:
+                    running = False
+                    force_commit = True
+            
+            if self._rows and (force_commit or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._commit()
+            for done in waiters:
+                done.set()
+        self.connection.close()
+    
+    def _commit(self):
+        try:
+            with self.write_lock:
+                self.connection.execute("BEGIN")
+                self.connection.executemany("INSERT INTO samples (ts, metric, device, value) VALUES (?, ?, ?, ?)",
+                                            self._rows)
+                self.connection.execute("COMMIT")
+        except Exception as e:
+            print(f"Error writing samples to {self.DATABASE_FILE}: {e}")
+            if self.connection.in_transaction:
+                self.connection.execute("ROLLBACK")
+        self._rows = []
+        self._last_flush = time.monotonic()
+    
+    def _reader(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path)
+            connection.execute("PRAGMA query_only=ON")
+            self._local.connection = connection
+        return connection
+    
+    def _select(self, start_ms, end_ms, metric_id=None, device_id=None):
+        """Records with start_ms <= ts <= end_ms as a structured array sorted by time"""
+        device_ids = list(range(len(self.devices))) if device_id is None else [device_id]
+        sql = (f"SELECT ts, metric, device, value FROM samples "
+               f"WHERE device IN ({', '.join('?' * len(device_ids))}) AND ts BETWEEN ? AND ?")
+        params = device_ids + [start_ms, end_ms]
+        if metric_id is not None:
+            sql += " AND metric = ?"
+            params.append(metric_id)
+        records = np.array(self._reader().execute(sql, params).fetchall(), dtype=self.DTYPE)
+        return records[np.argsort(records['ts'], kind='stable')]
+    
+    def read_day(self, day):
+        start = datetime.datetime.combine(day, datetime.time.min)
+        end = datetime.datetime.combine(day + datetime.timedelta(days=1), datetime.time.min)
+        return self._select(int(start.timestamp() * 1000), int(end.timestamp() * 1000) - 1)
+    
+    def query(self, start_datetime, end_datetime, metric=None, device=None):
+        metric_id = device_id = None
+        if metric is not None:
+            if metric not in self.metrics:
+                return np.empty(0, dtype=self.DTYPE)
+            metric_id = self.metrics.index(metric)
+        if device is not None:
+            if device not in self.devices:
+                return np.empty(0, dtype=self.DTYPE)
+            device_id = self.devices.index(device)
+        return self._select(int(start_datetime.timestamp() * 1000), int(end_datetime.timestamp() * 1000),
+                            metric_id, device_id)
+    
+    def import_text_lines(self, day, lines):
+        self.flush()  # Queued samples count as already in the store
+        return super().import_text_lines(day, lines)
+    
+    def _replace_day(self, day, records):
+        start = datetime.datetime.combine(day, datetime.time.min)
+        end = datetime.datetime.combine(day + datetime.timedelta(days=1), datetime.time.min)
+        device_ids = list(range(len(self.devices)))
+        with self.write_lock:
+            self.connection.execute("BEGIN")
+            try:
+                self.connection.execute(f"DELETE FROM samples WHERE device IN ({', '.join('?' * len(device_ids))}) "
+                                        f"AND ts >= ? AND ts < ?",
+                                        device_ids + [int(start.timestamp() * 1000), int(end.timestamp() * 1000)])
+                self.connection.executemany("INSERT INTO samples (ts, metric, device, value) VALUES (?, ?, ?, ?)",
+                                            records.tolist())
+                self.connection.execute("COMMIT")
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                raise
+    
+    def days(self):
+        bounds = [self._reader().execute("SELECT MIN(ts), MAX(ts) FROM samples WHERE device = ?", (device,)).fetchone()
+                  for device in range(len(self.devices))]
+        bounds = [bound for bound in bounds if bound[0] is not None]
+        if not bounds:
+            return []
+        day = datetime.date.fromtimestamp(min(low for low, _ in bounds) / 1000)
+        last_day = datetime.date.fromtimestamp(max(high for _, high in bounds) / 1000)
+        days = []
+        while day <= last_day:
+            days.append(day)
+            day += datetime.timedelta(days=1)
+        return days
+
+    def drop_before(self, day):
+        """Delete the samples of every day before day; returns 1 if any were deleted"""
+        cutoff = int(datetime.datetime.combine(day, datetime.time.min).timestamp() * 1000)
+        device_ids = list(range(len(self.devices)))
+        with self.write_lock:
+            deleted = self.connection.execute(f"DELETE FROM samples WHERE device IN ({', '.join('?' * len(device_ids))}) "
+                                              f"AND ts < ?", device_ids + [cutoff]).rowcount
+        return 1 if deleted > 0 else 0
+
+class EventLog:
+    """Alert, email and system events in compact daily files (temperature_events_<day>.events).
+    
+    Each event is one JSON array per line: its kind letter, epoch milliseconds and
+    the rest of its fields, e.g. ["A",1735689600000,"HIGH STORAGE TEMPERATURE WARNING",
+    "Storage temperature is above normal",45.2]. The kind letter is always the third
+    character of the line, so reads skip unwanted types without decoding them or
+    looking at message text. Samples are kept by the SampleStore, not here.
+    """
+    FILE_PREFIX = 'temperature_events_'
+    TYPES = {event_type.KIND: event_type for event_type in (SampleEvent, AlertEvent, EmailEvent, SystemEvent)}
+    EMAIL_SENT = "Scheduled email report sent"
+    EMAIL_FAILED = "Failed to send email: "
+    LEGACY_ERRORS = ("Monitoring error: ", "No temperature data available")
+    
+    def __init__(self, directory):
+        self.directory = directory
+    
+    def path(self, day):
+        """Event file path for a date"""
+        return os.path.join(self.directory, f"{self.FILE_PREFIX}{day.strftime('%Y-%m-%d')}.events")
+    
+    @staticmethod
+    def encode(event):
+        """One-line JSON array for an event"""
+        return json.dumps([event.KIND, int(round(event.timestamp * 1000)), *event[1:]],
+                          ensure_ascii=False, separators=(',', ':'))
+    
+    @classmethod
+    def decode(cls, line):
+        """Event for a line written by encode()"""
+        record = json.loads(line)
+        return cls.TYPES[record[0]](record[1] / 1000, *record[2:])
+    
+    def read_day(self, day, kinds=None):
+        """Events of one day in logging order; kinds is an optional set of kind letters"""
+        events = []
+        try:
+            with open(self.path(day), 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    if kinds is not None and line[2:3] not in kinds:
+                        continue
+                    try:
+                        events.append(self.decode(line))
+                    except (ValueError, KeyError, TypeError, IndexError):
+                        continue  # A line cut short by a crash
+        except FileNotFoundError:
+            pass
+        return events
+    
+    def days(self):
+        """Dates that have an event file, oldest first"""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        return sorted(datetime.datetime.strptime(name[len(self.FILE_PREFIX):-7], "%Y-%m-%d").date()
+                      for name in names
+                      if re.fullmatch(re.escape(self.FILE_PREFIX) + r'\d{4}-\d{2}-\d{2}\.events', name))
+    
+    def drop_before(self, day):
+        """Delete the event files of every day before day; returns the number removed"""
+        removed = 0
+        for old_day in self.days():
+            if old_day >= day:
+                break
+            os.remove(self.path(old_day))
+            removed += 1
+        return removed
+    
+    @classmethod
+    def parse_lines(cls, lines):
+        """Typed events for .logs lines written before the event log existed.
+        
+        Sample lines become SampleEvents (one per device for storage lines); other
+        timestamped lines are classified by the fixed messages the monitor logs, and
+        anything unrecognised is a SystemEvent.
+        """
+        for line in lines:
+            moment = LogTimestampParser.parse_line(line)
+            if moment is None:
+                continue
+            timestamp = moment.timestamp()
+            
+            parsed = SampleStore.parse_text_line(line)
+            if parsed:
+                for metric, device, value in parsed[1]:
+                    yield SampleEvent(timestamp, metric, value, device)
+                continue
+            
+            message = line[22:]
+            if message.startswith("Alert: "):
+                title, _, text = message[len("Alert: "):].partition(" - ")
+                yield AlertEvent(timestamp, title, text)
+            elif message == cls.EMAIL_SENT:
+                yield EmailEvent(timestamp, True)
+            elif message.startswith(cls.EMAIL_FAILED):
+                yield EmailEvent(timestamp, False, None, message[len(cls.EMAIL_FAILED):])
+            else:
+                yield SystemEvent(timestamp, message, message.startswith(cls.LEGACY_ERRORS))
+
+class LogTimeIndex:
+    """Sparse time index stored next to a daily .logs file (<file>.logs.idx).
+    
+    Each record is (epoch seconds, byte offset of the first line logged at or after
+    that time), written about every `interval` seconds. Lines before the first
+    record start at offset 0, so an index that only covers part of a file is fine.
+    """
+    RECORD = struct.Struct('<qq')
+    SUFFIX = '.idx'
+    
+    def __init__(self, log_path):
+        self.log_path = log_path
+        self.path = log_path + self.SUFFIX
+    
+    def exists(self):
+        return os.path.exists(self.path)
+    
+    def load(self):
+        """(times, offsets) arrays"""
+        try:
+            records = np.fromfile(self.path, dtype='<i8')
+        except (OSError, ValueError):
+            records = np.empty(0, dtype='<i8')
+        records = records[:len(records) // 2 * 2].reshape(-1, 2)
+        return records[:, 0], records[:, 1]
+    
+    def last_time(self):
+        times, _ = self.load()
+        return int(times[-1]) if len(times) else None
+    
+    def offset_for(self, start_datetime):
+        """Byte offset to start reading at to see every line at or after start_datetime"""
+        times, offsets = self.load()
+        # Last record strictly before the start; the lines at the start itself follow it
+        position = np.searchsorted(times, start_datetime.timestamp(), side='left') - 1
+        if position < 0:
+            return 0
+        offset = int(offsets[position])
+        try:
+            return offset if offset <= LogArchive.log_size(self.log_path) else 0
+        except OSError:
+            return 0
+    
+    def offset_after(self, end_datetime):
+        """Byte offset of the first indexed line after end_datetime, or None to read to the end"""
+        times, offsets = self.load()
+        position = np.searchsorted(times, end_datetime.timestamp(), side='right')
+        return int(offsets[position]) if position < len(times) else None
+    
+    @classmethod
+    def rebuild(cls, log_path, interval=60):
+        """Write a fresh index for an existing log file; returns the number of records"""
+        index = cls(log_path)
+        records = []
+        next_stamp = b''  # Timestamps compare correctly as strings; parse only at boundaries
+        offset = 0
+        with LogArchive.open_log(log_path) as f:
+            for raw in f:
+                line_offset = offset
+                offset += len(raw)
+                if raw[:1] != b'[' or raw[20:21] != b']' or raw[1:20] < next_stamp:
+                    continue
+                line_time = LogTimestampParser.parse(raw[1:20].decode('ascii', errors='replace'))
+                if line_time is None:
+                    continue
+                records.append(cls.RECORD.pack(int(line_time.timestamp()), line_offset))
+                next_stamp = (line_time + datetime.timedelta(seconds=interval)).strftime("%Y-%m-%d %H:%M:%S").encode('ascii')
+        
+        with open(index.path + '.tmp', 'wb') as f:
+            f.write(b''.join(records))
+        os.replace(index.path + '.tmp', index.path)
+        return len(records)
+
+class LogArchive:
+    """Compressed copy of a closed daily .logs file (<file>.logs.gz or <file>.logs.zst).
+    
+    The file is cut at line ends into blocks of about BLOCK_SIZE bytes and every
+    block is compressed as its own gzip member or zstd frame, so gunzip/zstd still
+    unpack the archive as a whole. The <archive>.blocks sidecar holds the
+    uncompressed and compressed offset of each block, which lets LogArchiveReader
+    seek to an uncompressed offset (the LogTimeIndex offsets stay valid) by
+    decompressing a single block. Its first record is the size and mtime of the
+    .logs file that was archived. A .logs file recreated by lines logged after that
+    is read as the continuation of the archive until the next compress() merges it.
+    """
+    SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+    BLOCKS_SUFFIX = '.blocks'
+    BLOCK_SIZE = 256 * 1024
+    
+    def __init__(self, log_path):
+        self.log_path = log_path
+        self.path = None
+        self.compression = None
+        for compression, suffix in self.SUFFIXES.items():
+            if os.path.exists(log_path + suffix):
+                self.path = log_path + suffix
+                self.compression = compression
+                break
+    
+    def exists(self):
+        return self.path is not None
+    
+    def has_tail(self):
+        """True if a .logs file holds lines logged after the archive was written"""
+        try:
+            stat = os.stat(self.log_path)
+        except FileNotFoundError:
+            return False
+        source = self._load_sidecar()[0]
+        # Same file as archived: compress() has not removed it yet
+        return (int(source[0]), int(source[1])) != (stat.st_size, stat.st_mtime_ns)
+    
+    @classmethod
+    def open_log(cls, log_path):
+        """Binary reader for a daily log file, whether it is plain, archived or both"""
+        archive = cls(log_path)
+        if not archive.exists():
+            return open(log_path, 'rb')
+        if os.path.exists(log_path) and not archive.has_tail():
+            return open(log_path, 'rb')
+        return io.BufferedReader(LogArchiveReader(archive, archive.has_tail()), buffer_size=64 * 1024)
+    
+    @classmethod
+    def log_exists(cls, log_path):
+        return os.path.exists(log_path) or cls(log_path).exists()
+    
+    @classmethod
+    def log_stat(cls, log_path):
+        """os.stat of the plain file, or of its archive"""
+        try:
+            return os.stat(log_path)
+        except FileNotFoundError:
+            archive = cls(log_path)
+            if not archive.exists():
+                raise
+            return os.stat(archive.path)
+    
+    @classmethod
+    def log_size(cls, log_path):
+        """Uncompressed size of a daily log file"""
+        archive = cls(log_path)
+        if not archive.exists():
+            return os.path.getsize(log_path)
+        if not archive.has_tail():
+            return archive.load_blocks()[0][-1]
+        return archive.load_blocks()[0][-1] + os.path.getsize(log_path)
+    
+    def _load_sidecar(self):
+        records = np.fromfile(self.path + self.BLOCKS_SUFFIX, dtype='<i8')
+        return records[:len(records) // 2 * 2].reshape(-1, 2)
+    
+    def load_blocks(self):
+        """(uncompressed offsets, compressed offsets) of every block plus the end of the last one"""
+        records = self._load_sidecar()[1:]
+        return records[:, 0].tolist(), records[:, 1].tolist()
+    
+    def compress(self, compression='gzip'):
+        """Archive the plain .logs file and remove it; returns (plain bytes, archived bytes) or None.
+        
+        Lines logged for the day after it was archived (a clock change, a late queued
+        line) recreate the .logs file; the next run appends them to the archive.
+        """
+        if compression == 'zstd' and zstandard is None:
+            raise RuntimeError("zstd compression needs the zstandard package (pip install zstandard)")
+        stat = os.stat(self.log_path)
+        if self.exists():
+            source = self._load_sidecar()[0]
+            if (source[0], source[1]) == (stat.st_size, stat.st_mtime_ns):
+                os.remove(self.log_path)  # Archived before, but removing it failed then
+                return None
+        
+        if compression == 'gzip':
+            compress_block = lambda data: gzip.compress(data, compresslevel=6, mtime=0)
+        else:
+            compress_block = zstandard.ZstdCompressor(level=9).compress
+        path = self.log_path + self.SUFFIXES[compression]
+        
+        offsets = [(stat.st_size, stat.st_mtime_ns), (0, 0)]
+        uncompressed = compressed = 0
+        with open(path + '.tmp', 'wb') as out:
+            readers = [open(self.log_path, 'rb')]
+            if self.exists():
+                # Lines archived earlier come first
+                readers.insert(0, io.BufferedReader(LogArchiveReader(self)))
+            try:
+                for reader in readers:
+                    while True:
+                        block = reader.read(self.BLOCK_SIZE)
+                        if not block:
+                            break
+                        block += reader.readline()  # Blocks end at a line end
+                        data = compress_block(block)
+                        out.write(data)
+                        uncompressed += len(block)
+                        compressed += len(data)
+                        offsets.append((uncompressed, compressed))
+            finally:
+                for reader in readers:
+                    reader.close()
+        
+        current = os.stat(self.log_path)
+        if (current.st_size, current.st_mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+            os.remove(path + '.tmp')  # Still being written; try again later
+            return None
+        
+        # Readers keep using the plain file until it is removed below
+        np.array(offsets, dtype='<i8').tofile(path + self.BLOCKS_SUFFIX + '.tmp')
+        os.replace(path + self.BLOCKS_SUFFIX + '.tmp', path + self.BLOCKS_SUFFIX)
+        os.replace(path + '.tmp', path)
+        merged = self.exists()
+        if merged and self.path != path:
+            for old in (self.path, self.path + self.BLOCKS_SUFFIX):
+                os.remove(old)
+        self.path, self.compression = path, compression
+        
+        os.remove(self.log_path)
+        if merged or not LogTimeIndex(self.log_path).exists():
+            LogTimeIndex.rebuild(self.log_path)
+        return uncompressed, compressed
+
+class LogArchiveReader(io.RawIOBase):
+    """Seekable raw stream over the uncompressed bytes of a LogArchive, optionally followed by its .logs tail"""
+    def __init__(self, archive, tail=False):
+        super().__init__()
+        self.starts, self.offsets = archive.load_blocks()
+        self.tail = open(archive.log_path, 'rb') if tail else None
+        if archive.compression == 'zstd':
+            if zstandard is None:
+                raise OSError(f"{os.path.basename(archive.path)} needs the zstandard package")
+            self.decompress = zstandard.ZstdDecompressor().decompress
+        else:
+            self.decompress = gzip.decompress
+        self.file = open(archive.path, 'rb')
+        self.position = 0
+        self.block = None
+        self.data = b''
+    
+    def readable(self):
+        return True
+    
+    def seekable(self):
+        return True
+    
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += self.starts[-1]
+            if self.tail is not None:
+                offset += os.fstat(self.tail.fileno()).st_size
+        self.position = max(0, offset)
+        return self.position
+    
+    def tell(self):
+        return self.position
+    
+    def readinto(self, buffer):
+        block = bisect.bisect_right(self.starts, self.position) - 1
+        if block >= len(self.starts) - 1:
+            if self.tail is None:
+                return 0
+            self.tail.seek(self.position - self.starts[-1])
+            count = self.tail.readinto(buffer)
+            self.position += count
+            return count
+        if block != self.block:
+            self.file.seek(self.offsets[block])
+            self.data = memoryview(self.decompress(self.file.read(self.offsets[block + 1] - self.offsets[block])))
+            self.block = block
+        start = self.position - self.starts[block]
+        chunk = self.data[start:start + len(buffer)]
+        buffer[:len(chunk)] = chunk
+        self.position += len(chunk)
+        return len(chunk)
+    
+    def close(self):
+        if not self.closed:
+            self.file.close()
+            if self.tail is not None:
+                self.tail.close()
+        super().close()
+
+class LogCompactor:
+    """Background thread that archives closed daily logs and applies the retention policy.
+    
+    The first pass runs a minute after start-up and then every `interval` seconds.
+    """
+    def __init__(self, log_manager, interval=3600, first_delay=60):
+        self.log_manager = log_manager
+        self.interval = interval
+        self.first_delay = first_delay
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="LogCompactor", daemon=True)
+        self._thread.start()
+    
+    def _run(self):
+        delay = self.first_delay
+        while not self._stop.wait(delay):
+            try:
+                self.log_manager.compact_logs()
+                self.log_manager.apply_retention()
+            except Exception as e:
+                print(f"⚠️ Log compaction failed: {e}")
+            delay = self.interval
+    
+    def close(self, timeout=5.0):
+        self._stop.set()
+        self._thread.join(timeout)
+
+class LogWriter:
+    """One long-lived thread that appends log lines to the daily .logs files.
+    
+    Callers only put (timestamp, line) on a bounded queue and never block. The
+    writer drains the queue in batches through a single open handle, flushes every
+    flush_interval seconds (0 flushes after every batch), optionally fsyncs on
+    flush, and switches to the next file when a line belongs to a new day. It also
+    keeps each file's LogTimeIndex up to date (index_interval=None disables it).
+    """
+    BATCH_SIZE = 512
+    
+    def __init__(self, path_for_day, flush_interval=1.0, fsync=False, max_queue=10000, index_interval=60):
+        self.path_for_day = path_for_day
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.index_interval = index_interval
+        self._index_handle = None
+        self._next_index_time = None
+        self._offset = 0
+        self._newline_bytes = len(os.linesep)  # Text mode writes "\n" as os.linesep
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.lines_written = 0
+        self.dropped = 0
+        self.current_path = None
+        self._handle = None
+        self._day = None
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="LogWriter", daemon=True)
+        self._thread.start()
+    
+    def write(self, line, timestamp=None):
+        """Queue a line for writing; returns False (and counts a drop) if the queue is full"""
+        try:
+            self.queue.put_nowait((time.time() if timestamp is None else timestamp, line))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                print(f"⚠️ Log writer queue full, {self.dropped} lines dropped")
+            return False
+    
+    def flush(self, timeout=5.0):
+        """Block until every line queued so far is written and flushed"""
+        done = threading.Event()
+        self.queue.put(('flush', done))
+        return done.wait(timeout)
+    
+    def close(self, timeout=5.0):
+        """Write out the queue, close the file and stop the thread"""
+        if self._thread.is_alive():
+            self.queue.put(('close', None))
+            self._thread.join(timeout)
+    
+    def _run(self):
+        running = True
+        while running:
+            # Sleep until the next line arrives or a pending flush is due
+            timeout = None
+            if self._dirty:
+                timeout = max(0.0, self.flush_interval - (time.monotonic() - self._last_flush))
+            try:
+                batch = [self.queue.get(timeout=timeout)]
+            except queue.Empty:
+                batch = []
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            waiters = []
+            force_flush = False
+            for timestamp, line in batch:
+                if timestamp == 'flush':
+                    waiters.append(line)
+                    force_flush = True
+                elif timestamp == 'close':
+                    running = False
+                    force_flush = True
+                else:
+                    self._write_line(timestamp, line)
+            
+            if self._dirty and (force_flush or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._flush()
+            for done in waiters:
+                done.set()
+        
+        self._close_handle()
     
-    def show_time_search_modal(self):
-        """Show the time range search and export modal window"""
-        TimeRangeSearchWindow(self.window, self.log_manager, self.theme_manager, self.responsive_design)
+    def _write_line(self, timestamp, line):
+        try:
+            day = datetime.date.fromtimestamp(timestamp)
+            if day != self._day:
+                self._open(day)
+            if self._index_handle is not None:
+                if timestamp >= self._next_index_time:
+                    self._index_handle.write(LogTimeIndex.RECORD.pack(int(timestamp), self._offset))
+                    self._next_index_time = int(timestamp) + self.index_interval
+                self._offset += len(line.encode('utf-8', errors='replace')) + self._newline_bytes
+            self._handle.write(line + "\n")
+            self._dirty = True
+            self.lines_written += 1
+        except Exception as e:
+            print(f"Error writing to log file: {e}")
     
-    def refresh_log_display(self):
-        """Refresh the log display with current logs"""
-        logs = self.log_manager.get_all_logs()
-        
-        # Enable text widget for update
-        self.log_text.config(state='normal')
-        self.log_text.delete(1.0, tk.END)
+    def _open(self, day):
+        """Rotate to the file for `day`"""
+        self._close_handle()
+        self.current_path = self.path_for_day(day)
+        # Use UTF-8 encoding with error handling
+        self._handle = open(self.current_path, 'a', encoding='utf-8', errors='replace')
+        self._day = day
+    
+        if self.index_interval:
+            try:
+                index = LogTimeIndex(self.current_path)
+                last_time = index.last_time()
+                self._next_index_time = 0 if last_time is None else last_time + self.index_interval
+                self._offset = LogArchive.log_size(self.current_path)  # Continues an archived day
+                self._index_handle = open(index.path, 'ab')
+            except Exception as e:
+                print(f"⚠️ Time index disabled for {os.path.basename(self.current_path)}: {e}")
+                self._index_handle = None
+    
+    def _flush(self):
+        try:
+            self._handle.flush()
+            if self._index_handle is not None:
+                self._index_handle.flush()
+            if self.fsync:
+                os.fsync(self._handle.fileno())
+        except Exception as e:
+            print(f"Error flushing log file: {e}")
+        self._dirty = False
+        self._last_flush = time.monotonic()
+    
+    def _close_handle(self):
+        if self._handle is not None:
+            if self._dirty:
+                self._flush()
+            for handle in (self._handle, self._index_handle):
+                try:
+                    if handle is not None:
+                        handle.close()
+                except Exception:
+                    pass
+            self._handle = None
+            self._index_handle = None
+            self._day = None
+
+class InotifyWatch:
+    """Minimal ctypes inotify watch on a directory (Linux only)"""
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    
+    def __init__(self, directory):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+    
+    def wait(self, timeout):
+        """True if something in the directory changed within timeout seconds"""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return False
+        try:
+            while os.read(self.fd, 4096):  # Drain the queued events
+                pass
+        except BlockingIOError:
+            pass
+        return True
+    
+    def close(self):
+        os.close(self.fd)
+
+class LogFileTailer:
+    """Follows the daily .logs file and returns only the lines appended since the last read.
+    
+    The position is remembered as (file identity, byte offset), so a replaced or
+    truncated file is reread from the start and a new day's file is picked up at
+    midnight after draining the rest of the old one. wait() sleeps on inotify where
+    available and falls back to polling the file size.
+    """
+    def __init__(self, path_for_day, directory, poll_interval=1.0, encoding='utf-8'):
+        self.path_for_day = path_for_day
+        self.directory = directory
+        self.poll_interval = poll_interval
+        self.encoding = encoding
+        self.path = None
+        self.file_id = None
+        self.offset = 0
+        self._partial = b''
+        self._watch = None
+        self._watch_failed = False
+    
+    def read_new(self):
+        """Complete lines appended since the last call, oldest first"""
+        current = self.path_for_day(datetime.date.today())
+        lines = []
+        if self.path != current:
+            if self.path is not None:
+                lines.extend(self._read_appended())  # Finish the previous day first
+            self.path = current
+            self.file_id = None
+            self.offset = 0
+            self._partial = b''
+        lines.extend(self._read_appended())
+        return lines
+    
+    def _read_appended(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return []
+        
+        file_id = (stat.st_dev, stat.st_ino)
+        if file_id != self.file_id or stat.st_size < self.offset:
+            # New, replaced or truncated file: start over
+            self.file_id = file_id
+            self.offset = 0
+            self._partial = b''
+        if stat.st_size == self.offset:
+            return []
         
-        if logs:
-            for log_entry in logs[-1000:]:  # Show last 1000 entries to prevent UI lag
-                self.log_text.insert(tk.END, log_entry + "\n")
-            
-            # Scroll to bottom
-            self.log_text.see(tk.END)
-        else:
-            self.log_text.insert(tk.END, "No logs available yet...\n")
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(self.offset)
+                data = f.read(stat.st_size - self.offset)
+        except OSError as e:
+            print(f"⚠️ Error tailing {os.path.basename(self.path)}: {e}")
+            return []
+        self.offset += len(data)
+        
+        # Keep a trailing partial line for the next read
+        complete, _, self._partial = (self._partial + data).rpartition(b'\n')
+        text = complete.decode(self.encoding, errors='replace')
+        return [line.strip() for line in text.splitlines() if line.strip()]
+    
+    def wait(self, timeout=None):
+        """Block until the log directory may have changed or timeout seconds pass"""
+        if self._watch is None and not self._watch_failed:
+            try:
+                self._watch = InotifyWatch(self.directory)
+            except Exception:
+                self._watch_failed = True  # Not Linux, or no inotify: poll instead
+        if self._watch is not None:
+            return self._watch.wait(timeout)
+        
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while deadline is None or time.monotonic() < deadline:
+            path = self.path_for_day(datetime.date.today())
+            try:
+                stat = os.stat(path)
+                if path != self.path or (stat.st_dev, stat.st_ino) != self.file_id or stat.st_size != self.offset:
+                    return True
+            except OSError:
+                if path != self.path:
+                    return True
+            pause = self.poll_interval if deadline is None else min(self.poll_interval, deadline - time.monotonic())
+            time.sleep(max(pause, 0))
+        return False
+    
+    def close(self):
+        if self._watch is not None:
+            self._watch.close()
+            self._watch = None
+
+class ExportResult(namedtuple('ExportResult', ['path', 'entries', 'cancelled', 'error'])):
+    """Outcome of an export: file path (None if nothing was kept), entries written, cancelled flag, error text"""
+    __slots__ = ()
+
+class LogExporter:
+    """Streams log lines into an export file.
+    
+    Lines go straight from the log reader to the (optionally compressed) output, so
+    memory use does not depend on the size of the range. 'logs' keeps the text lines
+    under a comment header; 'csv', 'jsonl' and 'parquet' get one row per sample with
+    the columns in FIELDS (lines that are not samples only fill in 'message').
+    """
+    FORMATS = ('logs', 'csv', 'jsonl', 'parquet')
+    COMPRESSIONS = (None, 'gzip', 'zstd')
+    EXTENSIONS = {'gzip': '.gz', 'zstd': '.zst'}
+    FIELDS = ('timestamp', 'metric', 'device', 'value', 'message')
+    PROGRESS_LINES = 5000  # Lines between progress callbacks
+    PARQUET_ROWS = 65536  # Rows per parquet row group
+    
+    def __init__(self, parse_line, fmt='logs', compression=None):
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown export format: {fmt}")
+        if compression not in self.COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {compression}")
+        if compression == 'zstd' and zstandard is None and fmt != 'parquet':
+            raise ValueError("zstd compression needs the 'zstandard' package")
+        if fmt == 'parquet' and pq is None:
+            raise ValueError("Parquet export needs the 'pyarrow' package")
+        self.parse_line = parse_line  # SampleStore.parse_text_line
+        self.fmt = fmt
+        self.compression = compression
+    
+    def extension(self):
+        """File extension for the format; parquet compresses its pages instead of the file"""
+        if self.fmt == 'parquet':
+            return '.parquet'
+        return f".{self.fmt}{self.EXTENSIONS.get(self.compression, '')}"
+    
+    def rows(self, lines):
+        """(timestamp, metric, device, value, message) rows for log lines"""
+        for line in lines:
+            parsed = self.parse_line(line)
+            if parsed:
+                stamp, samples = parsed
+                for metric, device, value in samples:
+                    yield stamp, metric, device, value, ''
+            elif line[:1] == '[' and line[20:21] == ']':
+                yield line[1:20], '', '', None, line[22:]
+            else:
+                yield None, '', '', None, line
+    
+    def write(self, lines, path, header=(), progress=None, cancel_event=None):
+        """Write lines to path and return an ExportResult.
+        
+        progress(entries, line) is called every PROGRESS_LINES lines from the calling
+        thread. cancel_event is checked before the file is created and before every
+        line; once it is set the partial file is removed, as is a file without any
+        entries.
+        """
+        entries = 0
+        cancelled = False
+        if cancel_event is not None and cancel_event.is_set():
+            return ExportResult(None, entries, True, None)
+        
+        def counted(lines):
+            nonlocal entries, cancelled
+            for line in lines:
+                if cancel_event is not None and cancel_event.is_set():
+                    cancelled = True
+                    return
+                entries += 1
+                if progress is not None and entries % self.PROGRESS_LINES == 0:
+                    progress(entries, line)
+                yield line
         
-        # Set back to read-only after updating content
-        self.log_text.config(state='disabled')
+        try:
+            if self.fmt == 'parquet':
+                self._write_parquet(counted(lines), path)
+            else:
+                with self._open_text(path) as f:
+                    if self.fmt == 'logs':
+                        for line in header:
+                            f.write(f"# {line}\n")
+                        f.write("=" * 60 + "\n")
+                        f.writelines(line + "\n" for line in counted(lines))
+                    elif self.fmt == 'csv':
+                        writer = csv.writer(f)
+                        writer.writerow(self.FIELDS)
+                        writer.writerows(self.rows(counted(lines)))
+                    else:
+                        encoder = json.JSONEncoder(ensure_ascii=False)
+                        f.writelines(encoder.encode(dict(zip(self.FIELDS, row))) + "\n"
+                                     for row in self.rows(counted(lines)))
+        except BaseException:
+            self._remove(path)
+            raise
+        
+        # A cancel that arrives while the last lines are written still discards the file
+        cancelled = cancelled or (cancel_event is not None and cancel_event.is_set())
+        if cancelled or not entries:
+            self._remove(path)
+            return ExportResult(None, entries, cancelled, None)
+        return ExportResult(path, entries, False, None)
     
-    def update_live_log(self):
-        """Update the log display with new entries"""
-        if self.is_running and self.window.winfo_exists():
-            # Get only new logs since last update
-            new_logs = self.log_manager.get_new_logs()
-            
-            if new_logs:
-                # Enable text widget for update
-                self.log_text.config(state='normal')
-                
-                for log_entry in new_logs:
-                    self.log_text.insert(tk.END, log_entry + "\n")
-                
-                # Auto-scroll to bottom
-                self.log_text.see(tk.END)
-                
-                # Set back to read-only after updating content
-                self.log_text.config(state='disabled')
+    def _open_text(self, path):
+        """Text handle for the export file, through the compressor if one is set"""
+        newline = '' if self.fmt == 'csv' else None  # csv writes its own line endings
+        if self.compression == 'gzip':
+            return gzip.open(path, 'wt', encoding='utf-8', newline=newline)
+        if self.compression == 'zstd':
+            stream = zstandard.ZstdCompressor().stream_writer(open(path, 'wb'))
+            return io.TextIOWrapper(stream, encoding='utf-8', newline=newline)
+        return open(path, 'w', encoding='utf-8', newline=newline)
+    
+    def _write_parquet(self, lines, path):
+        schema = pa.schema([('timestamp', pa.timestamp('s')), ('metric', pa.string()),
+                            ('device', pa.string()), ('value', pa.float64()), ('message', pa.string())])
+        columns = [[] for _ in self.FIELDS]
+        
+        with pq.ParquetWriter(path, schema, compression=self.compression or 'snappy') as writer:
+            def flush():
+                arrays = [pa.array(columns[0], pa.string()).cast(pa.timestamp('s'))]
+                arrays += [pa.array(values, field.type) for values, field in zip(columns[1:], list(schema)[1:])]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+                for values in columns:
+                    values.clear()
             
-            # Schedule next update
-            self.window.after(1000, self.update_live_log)
+            for row in self.rows(lines):
+                for values, value in zip(columns, row):
+                    values.append(value)
+                if len(columns[0]) >= self.PARQUET_ROWS:
+                    flush()
+            if columns[0]:
+                flush()
     
-    def on_close(self):
-        """Handle window close"""
-        self.is_running = False
-        self.window.destroy()
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
 
 class LogManager:
     """Manages persistent logging of temperature data with .logs files"""
-    def __init__(self):
+    SNIFF_BYTES = 64 * 1024  # Enough to tell UTF-8 from legacy 8-bit encodings
+    SAMPLE_BACKENDS = {'binary': SampleStore, 'sqlite': SQLiteSampleStore}
+    LOG_FILE_RE = re.compile(r'temperature_logs_(\d{4}-\d{2}-\d{2})\.logs(?:\.gz|\.zst)?')
+    
+    def __init__(self, sample_backend='binary'):
         # Condition 1: Daily logs in "Daily logs" folder
         self.daily_logs_dir = "Daily logs"
         self.current_log_file = None
-        self.log_buffer = []
-        self.last_log_index = 0
+        self.log_buffer = LogRingBuffer()  # Recent lines for live views, bounded
+        # Numeric samples are stored as binary records; writing them to the .logs
+        # files as text too is optional ("text_logs" setting)
+        self.sample_store = self.SAMPLE_BACKENDS[sample_backend](self.daily_logs_dir)
+        self._recover_rollups()
+        self.text_logs = True
+        self.encodings = {}  # path -> (size, mtime_ns, encoding) of the last sniff
         self.setup_logging()
+        self.writer = LogWriter(self.get_log_file)
+        # Alerts, emails and system events are also kept typed, outside the text logs
+        self.events = EventLog(self.daily_logs_dir)
+        self.event_writer = LogWriter(self.events.path, index_interval=None)
+        # Closed days are archived in the background; retention is off until configured
+        self.log_compression = 'gzip'
+        self.retention_days = {}
+        self.compactor = LogCompactor(self)
     
     def setup_logging(self):
         """Setup logging infrastructure with Daily logs folder"""
@@ -1316,44 +4650,161 @@ class LogManager:
         self.current_log_file = self.get_current_log_file()
         print(f"✅ Logging to: {self.current_log_file}")
     
+    def set_sample_backend(self, name):
+        """Switch the sample store to another backend ('binary' or 'sqlite')"""
+        backend = self.SAMPLE_BACKENDS.get(name)
+        if backend is None:
+            print(f"⚠️ Unknown sample backend {name!r}, keeping {type(self.sample_store).__name__}")
+            return
+        if type(self.sample_store) is backend:
+            return
+        self.sample_store.close()
+        self.sample_store = backend(self.daily_logs_dir)
+        self._recover_rollups()
+        print(f"✅ Storing samples with {backend.__name__}")
+    
+    def _recover_rollups(self):
+        try:
+            self.sample_store.recover_rollups()
+        except Exception as e:
+            print(f"⚠️ Could not rebuild the latest rollups: {e}")
+    
     def get_current_log_file(self):
         """Get the current log file path based on current date"""
-        current_date = datetime.datetime.now().strftime("%Y-%m-%d")
-        return os.path.join(self.daily_logs_dir, f"temperature_logs_{current_date}.logs")
+        return self.get_log_file(datetime.date.today())
+    
+    def get_log_file(self, day):
+        """Get the log file path for a date"""
+        return os.path.join(self.daily_logs_dir, f"temperature_logs_{day.strftime('%Y-%m-%d')}.logs")
+    
+    def list_log_files(self):
+        """Paths of the daily .logs files, oldest first; archived days are listed by their .logs path"""
+        days = set()
+        for name in os.listdir(self.daily_logs_dir):
+            match = self.LOG_FILE_RE.fullmatch(name)
+            if match:
+                days.add(match.group(1))
+        return [os.path.join(self.daily_logs_dir, f"temperature_logs_{day}.logs") for day in sorted(days)]
+    
+    def compact_logs(self, compression=None, min_age=600):
+        """Archive the .logs files of closed days (see LogArchive); returns the number archived.
+        
+        Today's file, the file the writer has open and files written to in the last
+        min_age seconds are left alone.
+        """
+        compression = compression or self.log_compression
+        if not compression:
+            return 0
+        today = self.get_current_log_file()
+        archived = 0
+        for log_path in self.list_log_files():
+            if log_path in (today, self.writer.current_path) or not os.path.exists(log_path):
+                continue
+            try:
+                if time.time() - os.path.getmtime(log_path) < min_age:
+                    continue
+                sizes = LogArchive(log_path).compress(compression)
+            except Exception as e:
+                print(f"⚠️ Could not archive {os.path.basename(log_path)}: {e}")
+                continue
+            if sizes:
+                plain, packed = sizes
+                print(f"🗜️ Archived {os.path.basename(log_path)}: {plain / 1e6:.1f} MB -> {packed / 1e6:.1f} MB")
+                archived += 1
+        return archived
+    
+    def apply_retention(self, policy=None):
+        """Delete data older than the retention policy allows; returns the number of files removed.
+        
+        policy maps 'raw' (daily .logs files, archives, sample segments and event files) and the
+        rollup tiers ('1m', '1h', '1d') to a number of days to keep. Missing or
+        None entries keep that data forever.
+        """
+        policy = self.retention_days if policy is None else policy
+        today = datetime.date.today()
+        removed = 0
+        
+        raw_days = policy.get('raw')
+        if raw_days:
+            cutoff = today - datetime.timedelta(days=raw_days)
+            for name in os.listdir(self.daily_logs_dir):
+                match = re.match(r'temperature_logs_(\d{4}-\d{2}-\d{2})\.logs', name)
+                if match and datetime.datetime.strptime(match.group(1), "%Y-%m-%d").date() < cutoff:
+                    try:
+                        os.remove(os.path.join(self.daily_logs_dir, name))
+                        removed += 1
+                    except OSError as e:
+                        print(f"⚠️ Could not remove {name}: {e}")
+            removed += self.sample_store.drop_before(cutoff)
+            removed += self.events.drop_before(cutoff)
+        
+        for tier in SampleRollups.TIERS:
+            if policy.get(tier.name):
+                removed += self.sample_store.rollups.drop_before(tier, today - datetime.timedelta(days=policy[tier.name]))
+        if removed:
+            print(f"🧹 Retention removed {removed} old files from {self.daily_logs_dir}/")
+        return removed
     
     def log_temperature(self, temp_type, value, message=""):
-        """Log temperature data with timestamp"""
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        """Log a reading, or a free-text message as a SystemEvent (see log_event)"""
+        now = time.time()
+        if not message and isinstance(value, numbers.Real):
+            self.log_event(SampleEvent(now, temp_type, value))
+        else:
+            self.log_event(SystemEvent(now, message or f"{temp_type}: {value}°C", temp_type == "Error"))
         
-        # Create log entry
-        if message:
-            log_entry = f"[{timestamp}] {message}"
+    def log_event(self, event):
+        """Record a typed event (SampleEvent, AlertEvent, EmailEvent or SystemEvent).
+        
+        Samples go to the sample store and the other events to the event log. Every
+        event is also shown as a .logs line, and written to the .logs file unless it
+        is a sample and text_logs is off.
+        """
+        if isinstance(event, SampleEvent):
+            try:
+                self.sample_store.append(event.metric, event.value, device=event.device, timestamp=event.timestamp)
+            except Exception as e:
+                print(f"Error writing sample: {e}")
+            persist = self.text_logs
         else:
-            log_entry = f"[{timestamp}] {temp_type}: {value}°C"
+            self.event_writer.write(EventLog.encode(event), event.timestamp)
+            persist = True
+        
+        timestamp = datetime.datetime.fromtimestamp(event.timestamp).strftime("%Y-%m-%d %H:%M:%S")
+        self._add_entry(f"[{timestamp}] {event.text()}", event.timestamp, persist=persist)
+    
+    def log_storage_temperatures(self, storage_temps):
+        """Log one sample per storage device and a combined text line"""
+        now = time.time()
+        try:
+            self.sample_store.append_many([(SampleStore.STORAGE_METRIC, device, temp)
+                                           for device, temp in storage_temps.items()], timestamp=now)
+        except Exception as e:
+            print(f"Error writing samples: {e}")
         
+        timestamp = datetime.datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S")
+        storage_details = ", ".join([f"{device}: {temp:.1f}°C" for device, temp in storage_temps.items()])
+        self._add_entry(f"[{timestamp}] Storage temperatures: {storage_details}", now, persist=self.text_logs)
+    
+    def _add_entry(self, log_entry, timestamp, persist=True):
         # Add to buffer for live display
-        self.log_buffer.append(log_entry)
+        self.log_buffer.push(log_entry)
         
-        # Persist to file (non-blocking)
-        threading.Thread(target=self._write_to_file, 
-                        args=(log_entry,),
-                        daemon=True).start()
+        # Persist to file through the writer thread (never blocks the caller)
+        if persist:
+            self.writer.write(log_entry, timestamp)
         
         print(log_entry)  # Also print to console
     
-    def _write_to_file(self, log_entry):
-        """Write log entry to file in a separate thread"""
+    def close(self):
+        """Flush and close the log file"""
+        self.compactor.close()
+        self.writer.close()
+        self.event_writer.close()
         try:
-            # Check if we need to rotate to a new daily file
-            current_file = self.get_current_log_file()
-            if current_file != self.current_log_file:
-                self.current_log_file = current_file
-            
-            # Use UTF-8 encoding with error handling
-            with open(self.current_log_file, 'a', encoding='utf-8', errors='replace') as f:
-                f.write(log_entry + "\n")
+            self.sample_store.close()
         except Exception as e:
-            print(f"Error writing to log file: {e}")
+            print(f"Error writing rollups: {e}")
     
     def get_all_logs(self):
         """Get all logs from all .logs files"""
@@ -1365,11 +4816,10 @@ class LogManager:
                 print(f"⚠️ Daily logs directory '{self.daily_logs_dir}' not found")
                 return all_logs
             
-            # Get all temperature_logs_*.logs files in the Daily logs directory
+            # Get all temperature_logs_*.logs files in the Daily logs directory (archived ones too)
             log_files = []
             try:
-                log_files = [f for f in os.listdir(self.daily_logs_dir) 
-                           if f.startswith('temperature_logs_') and f.endswith('.logs')]
+                log_files = [os.path.basename(path) for path in self.list_log_files()]
             except FileNotFoundError:
                 print(f"❌ Directory '{self.daily_logs_dir}' not found")
                 return all_logs
@@ -1399,32 +4849,287 @@ class LogManager:
         return all_logs
     
     def _read_log_file_with_encoding(self, file_path):
-        """Read log file trying multiple encodings to handle encoding issues"""
-        encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1', 'utf-16']
-        
-        for encoding in encodings:
+        """Read log file as a list of stripped, non-empty lines"""
+        return list(self.iter_log_lines(file_path))
+        
+    def _sniff_encoding(self, file_path, stat=None):
+        """Encoding of a log file, sniffed from its first bytes and cached while the file is unchanged"""
+        stat = stat or LogArchive.log_stat(file_path)
+        cached = self.encodings.get(file_path)
+        if cached and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+            return cached[2]
+        
+        with LogArchive.open_log(file_path) as f:
+            head = f.read(self.SNIFF_BYTES)
+        if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            encoding = 'utf-16'
+        elif head.startswith(codecs.BOM_UTF8):
+            encoding = 'utf-8-sig'
+        else:
             try:
-                with open(file_path, 'r', encoding=encoding, errors='replace') as f:
-                    logs = f.readlines()
-                    # Filter out empty lines and clean the logs
-                    cleaned_logs = [log.strip() for log in logs if log.strip()]
-                    return cleaned_logs
+                # Not final: the sample may end in the middle of a multi-byte character
+                codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+                encoding = 'utf-8'
             except UnicodeDecodeError:
-                print(f"⚠️ Encoding {encoding} failed for {os.path.basename(file_path)}, trying next...")
+                encoding = 'cp1252'
+                print(f"⚠️ {os.path.basename(file_path)} is not UTF-8, reading it as {encoding}")
+        
+        self.encodings[file_path] = (stat.st_size, stat.st_mtime_ns, encoding)
+        return encoding
+    
+    def iter_log_lines(self, file_path, offset=0):
+        """Yield the stripped, non-empty lines of a log file from a byte offset.
+        
+        Lines are decoded one at a time from a binary reader, so a file is never
+        held in memory as a whole.
+        """
+        try:
+            encoding = self._sniff_encoding(file_path)
+            with LogArchive.open_log(file_path) as f:
+                f.seek(offset)
+                # The text layer decodes the buffered chunks, not one line at a time
+                for line in io.TextIOWrapper(f, encoding=encoding, errors='replace'):
+                    line = line.strip()
+                    if line:
+                        yield line
+        except OSError as e:
+            print(f"⚠️ Error reading {os.path.basename(file_path)}: {e}")
+    
+    def get_recent_logs(self, limit=1000):
+        """The last `limit` log lines, reading only as many daily files as needed"""
+        logs = []
+        try:
+            days = set()
+            for name in os.listdir(self.daily_logs_dir):
+                match = re.fullmatch(r'temperature_(?:logs|samples)_(\d{4}-\d{2}-\d{2})\.(?:logs(?:\.gz|\.zst)?|bin)', name)
+                if match:
+                    days.add(match.group(1))
+        except OSError as e:
+            print(f"❌ Error reading Daily logs directory: {e}")
+            return logs
+        
+        for day in sorted(days, reverse=True):
+            day_logs = deque(self._iter_day_logs(datetime.datetime.strptime(day, "%Y-%m-%d").date()),
+                             maxlen=limit - len(logs))
+            logs = list(day_logs) + logs
+            if len(logs) >= limit:
+                break
+        return logs
+    
+    def _read_day_logs(self, day, start_datetime=None, end_datetime=None):
+        """Text lines for one day as a list (see _iter_day_logs)"""
+        return list(self._iter_day_logs(day, start_datetime, end_datetime))
+    
+    def _iter_day_logs(self, day, start_datetime=None, end_datetime=None):
+        """Text lines for one day; sample lines come from the sample store when text_logs is off.
+        
+        With a time range only the indexed span of the file around it is read; the
+        caller still filters the lines at the edges. Lines are streamed from the
+        file unless they have to be merged with the sample store.
+        """
+        log_file = self.get_log_file(day)
+        if not LogArchive.log_exists(log_file):
+            logs = iter(())
+        elif start_datetime is not None and LogTimeIndex(log_file).exists():
+            logs = self._read_log_span(log_file, start_datetime, end_datetime)
+        else:
+            logs = self.iter_log_lines(log_file)
+        
+        if not self.text_logs:
+            if start_datetime is not None:
+                day_start = datetime.datetime.combine(day, datetime.time.min)
+                day_end = datetime.datetime.combine(day, datetime.time.max)
+                records = self.sample_store.query(max(start_datetime, day_start), min(end_datetime, day_end))
+            else:
+                records = self.sample_store.read_day(day)
+            if len(records):
+                # Text sample lines from before the store took over for this day are kept
+                first = datetime.datetime.fromtimestamp(records['ts'][0] / 1000).strftime("[%Y-%m-%d %H:%M:%S]")
+                logs = [line for line in logs
+                        if line[:21] < first or not self.sample_store.parse_text_line(line)]
+                logs = sorted(logs + self.sample_store.render_lines(records), key=lambda line: line[:21])
+        yield from logs
+    
+    def _read_log_span(self, log_file, start_datetime, end_datetime):
+        """Lines of a log file from the indexed offset before start_datetime to just past end_datetime"""
+        offset = LogTimeIndex(log_file).offset_for(start_datetime)
+        # Stop a few seconds late: lines from concurrent loggers can be slightly out of order
+        stop = (end_datetime + datetime.timedelta(seconds=5)).strftime("[%Y-%m-%d %H:%M:%S]")
+        
+        for line in self.iter_log_lines(log_file, offset):
+            if line[20:21] == ']' and line[:21] > stop:
+                break
+            yield line
+    
+    def rebuild_time_indexes(self, interval=60):
+        """Write time index sidecars for every daily .logs file (for files from older versions)"""
+        try:
+            log_files = self.list_log_files()
+        except OSError as e:
+            print(f"❌ Cannot read '{self.daily_logs_dir}': {e}")
+            return 0
+        
+        # Today's file is indexed by the running writer; rebuild it only if that index is missing
+        current = self.get_current_log_file()
+        rebuilt = 0
+        for log_path in log_files:
+            name = os.path.basename(log_path)
+            if log_path == current and LogTimeIndex(log_path).exists():
                 continue
+            records = LogTimeIndex.rebuild(log_path, interval)
+            print(f"🗂️ {name}: {records} index entries")
+            rebuilt += 1
+        print(f"✅ Rebuilt {rebuilt} time indexes in {self.daily_logs_dir}/")
+        return rebuilt
+    
+    def get_samples_for_time_range(self, start_datetime, end_datetime, metric='Max Temperature', device=None,
+                                   max_points=None, statistic='max'):
+        """(epoch_ms, values) arrays of one metric from the sample store.
+        
+        With max_points, ranges too long to plot every sample read the coarsest rollup
+        tier whose buckets are no longer than range / max_points; statistic picks the
+        bucket value ('min', 'max', 'avg' or 'p95') and timestamps are bucket starts.
+        That can still be up to 60 times max_points, so the result is then min/max
+        decimated (minmax_downsample) to at most max_points, keeping every peak. History
+        the store does not have (text logs never converted) is read from the .logs files.
+        """
+        timestamps, values = self._read_samples(start_datetime, end_datetime, metric, device, max_points, statistic)
+        if max_points and len(timestamps) > max_points:
+            picked = minmax_downsample(timestamps, values, max(max_points // 4, 1))
+            timestamps, values = timestamps[picked], values[picked]
+        return timestamps, values
+    
+    def _read_samples(self, start_datetime, end_datetime, metric, device, max_points, statistic):
+        try:
+            tier = None
+            if max_points:
+                resolution = (end_datetime - start_datetime).total_seconds() / max_points
+                tier = self.sample_store.rollups.tier_for(resolution)
+            if tier is not None:
+                buckets = self.sample_store.query_rollups(tier, start_datetime, end_datetime, metric=metric, device=device)
+                if statistic == 'avg':
+                    values = buckets['sum'] / np.maximum(buckets['count'], 1)
+                else:
+                    values = buckets[statistic].astype(float)
+                if len(buckets):
+                    return buckets['ts'], values
+            records = self.sample_store.query(start_datetime, end_datetime, metric=metric, device=device)
+        except Exception as e:
+            print(f"❌ Error reading samples for time range: {e}")
+            records = np.empty(0, dtype=SampleStore.DTYPE)
+        if not len(records) and device is None and metric != SampleStore.STORAGE_METRIC:
+            return self.get_text_samples_for_time_range(start_datetime, end_datetime, metric)
+        return records['ts'], records['value'].astype(float)
+    
+    def get_events(self, start_datetime, end_datetime, kinds=None):
+        """Typed events between two datetimes, oldest first.
+        
+        kinds is an optional iterable of event types, e.g. (AlertEvent, EmailEvent);
+        types that are not asked for are never read. Samples come from the sample
+        store. Days before the first event file are classified from their .logs lines
+        (see EventLog.parse_lines); a later day without an event file had no events.
+        """
+        letters = {kind.KIND for kind in (kinds or EventLog.TYPES.values())}
+        events = []
+        
+        if SampleEvent.KIND in letters:
+            try:
+                records = self.sample_store.query(start_datetime, end_datetime)
+                metrics, devices = self.sample_store.metrics, self.sample_store.devices
+                events.extend(SampleEvent(ts_ms / 1000, metrics[metric], value, devices[device])
+                              for ts_ms, metric, device, value in records.tolist())
             except Exception as e:
-                print(f"⚠️ Error reading {os.path.basename(file_path)} with {encoding}: {e}")
-                continue
+                print(f"❌ Error reading samples for events: {e}")
+        
+        letters.discard(SampleEvent.KIND)
+        if letters:
+            first, last = start_datetime.timestamp(), end_datetime.timestamp()
+            event_days = self.events.days()
+            log_start = event_days[0] if event_days else None  # Day the event log began
+            current_date = start_datetime.date()
+            while current_date <= end_datetime.date():
+                if log_start is not None and current_date >= log_start:
+                    day_events = self.events.read_day(current_date, letters)
+                else:
+                    day_events = [event for event in
+                                  EventLog.parse_lines(self._iter_day_time_range(current_date, start_datetime, end_datetime))
+                                  if event.KIND in letters]
+                events.extend(event for event in day_events if first <= event.timestamp <= last)
+                current_date += datetime.timedelta(days=1)
         
-        print(f"❌ All encoding attempts failed for {os.path.basename(file_path)}")
-        return []
+        events.sort(key=lambda event: event.timestamp)
+        return events
+    
+    def get_text_samples_for_time_range(self, start_datetime, end_datetime, metric='Max Temperature'):
+        """(epoch_ms, values) arrays of one metric scanned from the .logs files (see LogSampleScanner)"""
+        scanner = LogSampleScanner(metric)
+        timestamps, values = [], []
+        current_date = start_datetime.date()
+        while current_date <= end_datetime.date():
+            log_file = self.get_log_file(current_date)
+            current_date += datetime.timedelta(days=1)
+            try:
+                if not LogArchive.log_exists(log_file) or self._sniff_encoding(log_file) == 'utf-16':
+                    continue
+                day_timestamps, day_values = scanner.scan_file(log_file, start_datetime, end_datetime)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Error scanning {os.path.basename(log_file)}: {e}")
+                continue
+            timestamps.append(day_timestamps)
+            values.append(day_values)
+        if not timestamps:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        return np.concatenate(timestamps), np.concatenate(values)
+    
+    def get_sample_summary(self, start_datetime, end_datetime, metric='Max Temperature', by_device=False):
+        """count/min/max/avg/p95 of a metric over a range, from the rollups.
+        
+        Returns one summary dict (or None without data), or {device: summary} with
+        by_device. Uses the coarsest tier whose buckets are no longer than range / 1500.
+        """
+        store = self.sample_store
+        span = (end_datetime - start_datetime).total_seconds()
+        tier = store.rollups.tier_for(span / 1500) or SampleRollups.TIERS[0]
+        try:
+            buckets = store.query_rollups(tier, start_datetime, end_datetime, metric=metric)
+        except Exception as e:
+            print(f"❌ Error reading rollups: {e}")
+            buckets = np.empty(0, dtype=SampleRollups.DTYPE)
+        if not by_device:
+            return SampleRollups.summary(buckets)
+        return {store.devices[device]: SampleRollups.summary(buckets[buckets['device'] == device])
+                for device in np.unique(buckets['device']).tolist()}
+    
+    def rebuild_rollups(self):
+        """Recompute the rollup tiers from every day in the sample store (for samples from older versions)"""
+        rebuilt = 0
+        for day in self.sample_store.days():
+            records = self.sample_store.read_day(day)
+            self.sample_store.rollups.rebuild_day(day, records)
+            print(f"📊 {day}: {len(records)} samples")
+            rebuilt += 1
+        print(f"✅ Rebuilt rollups for {rebuilt} days in {self.daily_logs_dir}/")
+        return rebuilt
     
-    def get_new_logs(self):
-        """Get new logs since last check"""
-        current_logs = self.get_all_logs()
-        new_logs = current_logs[self.last_log_index:]
-        self.last_log_index = len(current_logs)
-        return new_logs
+    def convert_text_logs(self):
+        """Import the sample lines of existing .logs files into the sample store"""
+        total = 0
+        try:
+            log_files = self.list_log_files()
+        except OSError as e:
+            print(f"❌ Cannot read '{self.daily_logs_dir}': {e}")
+            return total
+        
+        for log_path in log_files:
+            log_file = os.path.basename(log_path)
+            day = datetime.datetime.strptime(log_file[len('temperature_logs_'):-len('.logs')], "%Y-%m-%d").date()
+            lines = self.iter_log_lines(log_path)
+            added = self.sample_store.import_text_lines(day, lines)
+            print(f"📦 {log_file}: imported {added} samples")
+            total += added
+        
+        print(f"✅ Converted {total} samples into {self.daily_logs_dir}/")
+        return total
     
     def get_logs_for_date_range(self, start_date, end_date):
         """Get logs for a specific date range"""
@@ -1439,17 +5144,12 @@ class LogManager:
             # Generate all dates in the range
             current_date = start_date
             while current_date <= end_date:
-                log_file = os.path.join(self.daily_logs_dir, f"temperature_logs_{current_date.strftime('%Y-%m-%d')}.logs")
-                
-                if os.path.exists(log_file):
-                    file_logs = self._read_log_file_with_encoding(log_file)
-                    if file_logs:
-                        logs.extend(file_logs)
-                        print(f"📖 Read {len(file_logs)} entries from {os.path.basename(log_file)}")
-                    else:
-                        print(f"⚠️ No readable content in: {os.path.basename(log_file)}")
+                count = len(logs)
+                logs.extend(self._iter_day_logs(current_date))
+                if len(logs) > count:
+                    print(f"📖 Read {len(logs) - count} entries for {current_date}")
                 else:
-                    print(f"ℹ️ No log file for date: {current_date}")
+                    print(f"ℹ️ No log entries for date: {current_date}")
                 
                 current_date += datetime.timedelta(days=1)
                 
@@ -1475,30 +5175,12 @@ class LogManager:
             end_date = end_datetime.date()
             
             while current_date <= end_date:
-                log_file = os.path.join(self.daily_logs_dir, f"temperature_logs_{current_date.strftime('%Y-%m-%d')}.logs")
-                
-                if os.path.exists(log_file):
-                    file_logs = self._read_log_file_with_encoding(log_file)
-                    if file_logs:
-                        # Filter logs by time range
-                        for log_entry in file_logs:
-                            try:
-                                # Extract timestamp from log entry
-                                timestamp_str = log_entry.split(']')[0][1:]
-                                log_datetime = datetime.datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
-                                
-                                # Check if log datetime is within the specified range
-                                if start_datetime <= log_datetime <= end_datetime:
-                                    logs.append(log_entry)
-                            except ValueError:
-                                # Skip entries with invalid timestamps
-                                continue
-                        
-                        print(f"📖 Filtered entries from {os.path.basename(log_file)}")
-                    else:
-                        print(f"⚠️ No readable content in: {os.path.basename(log_file)}")
+                count = len(logs)
+                logs.extend(self._iter_day_time_range(current_date, start_datetime, end_datetime))
+                if len(logs) > count:
+                    print(f"📖 Filtered {len(logs) - count} entries for {current_date}")
                 else:
-                    print(f"ℹ️ No log file for date: {current_date}")
+                    print(f"ℹ️ No log entries for date: {current_date}")
                 
                 current_date += datetime.timedelta(days=1)
                 
@@ -1509,88 +5191,311 @@ class LogManager:
         
         return logs
     
-    def export_logs_to_file(self, start_date, end_date):
-        """Export logs to .logs file in Downloads folder only"""
-        logs = self.get_logs_for_date_range(start_date, end_date)
-        
-        if not logs:
-            print("❌ No logs to export")
-            messagebox.showinfo("No Data", "No logs found to export for the specified date range.")
-            return False
-        
+    def _iter_day_time_range(self, day, start_datetime, end_datetime, cancel_event=None):
+        """Lines of one day with a timestamp between start_datetime and end_datetime.
+        
+        cancel_event is checked for every line read, including the ones filtered out.
+        """
+        # Timestamps sort as strings, so lines are filtered without parsing them
+        start_stamp, end_stamp = LogTimestampParser.range_stamps(start_datetime, end_datetime)
+        # Entries without a timestamp are skipped
+        for log_entry in self._iter_day_logs(day, start_datetime, end_datetime):
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            if log_entry[:1] == '[' and log_entry[20:21] == ']' and start_stamp <= log_entry[1:20] <= end_stamp:
+                yield log_entry
+        
+    def iter_logs_for_time_range(self, start_datetime, end_datetime, cancel_event=None):
+        """Stream the log lines between start_datetime and end_datetime until cancel_event is set"""
+        current_date = start_datetime.date()
+        while current_date <= end_datetime.date():
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            yield from self._iter_day_time_range(current_date, start_datetime, end_datetime, cancel_event)
+            current_date += datetime.timedelta(days=1)
+    
+    def get_log_rows_for_time_range(self, start_datetime, end_datetime):
+        """Rows for a log view of a time range, read from the .logs files on demand.
+        
+        Lines that only exist merged in memory (text_logs off) or in UTF-16 files
+        are collected in a LogListRows instead.
+        """
+        paths = []
+        current_date = start_datetime.date()
+        while current_date <= end_datetime.date():
+            log_file = self.get_log_file(current_date)
+            if LogArchive.log_exists(log_file):
+                paths.append(log_file)
+            current_date += datetime.timedelta(days=1)
+        
+        if not self.text_logs or any(self._sniff_encoding(path) == 'utf-16' for path in paths):
+            return LogListRows(self.iter_logs_for_time_range(start_datetime, end_datetime))
+        return LogFileRows(paths, start_datetime, end_datetime, encoding_for=self._sniff_encoding)
+    
+    def get_live_log_rows(self, limit=100000):
+        """Rows for the live log view: yesterday's and today's logs, following new days"""
+        today = datetime.date.today()
+        days = (today - datetime.timedelta(days=1), today)
+        paths = [self.get_log_file(day) for day in days]
+        
+        if not self.text_logs or any(LogArchive.log_exists(path) and self._sniff_encoding(path) == 'utf-16'
+                                     for path in paths):
+            return LogListRows(self.get_recent_logs(limit), limit=limit)
+        return LogFileRows([path for path in paths[:1] if LogArchive.log_exists(path)] + paths[1:],
+                           path_for_today=self.get_current_log_file, encoding_for=self._sniff_encoding)
+    
+    def export_logs_to_file_with_time_range(self, start_datetime, end_datetime, fmt='logs', compression=None,
+                                            progress=None, cancel_event=None):
+        """Export logs for a time range to the Downloads folder (see _export)"""
+        start_str = start_datetime.strftime("%Y-%m-%d_%H-%M")
+        end_str = end_datetime.strftime("%Y-%m-%d_%H-%M")
+        
+        return self._export(self.iter_logs_for_time_range(start_datetime, end_datetime, cancel_event),
+                            f"temperature_export_{start_str}_to_{end_str}",
+                            f"Time Range: {start_datetime.strftime('%Y-%m-%d %H:%M')} to {end_datetime.strftime('%Y-%m-%d %H:%M')}",
+                            start_datetime, end_datetime, fmt, compression, progress, cancel_event)
+    
+    def _export(self, lines, export_name, range_text, start_datetime, end_datetime,
+                fmt, compression, progress, cancel_event):
+        """Stream lines into an export file and return an ExportResult.
+        
+        Safe to run on a worker thread: nothing here touches Tk. progress(fraction,
+        entries) gets the share of the time range written so far; setting
+        cancel_event stops the export and removes the partial file.
+        """
         try:
-            # Create filename with date range for EXPORT file
-            start_str = start_date.strftime("%Y-%m-%d")
-            end_str = end_date.strftime("%Y-%m-%d")
-            
-            if start_str == end_str:
-                export_filename = f"temperature_export_{start_str}.logs"
-            else:
-                export_filename = f"temperature_export_{start_str}_to_{end_str}.logs"
-            
+            exporter = LogExporter(self.sample_store.parse_text_line, fmt, compression)
             # Export only to Downloads folder
-            downloads_path = os.path.join(os.path.expanduser("~"), "Downloads", export_filename)
-            
-            # Use UTF-8 encoding for export
-            with open(downloads_path, 'w', encoding='utf-8') as f:
-                f.write("# Temperature Logs Export\n")
-                f.write(f"# Date Range: {start_str} to {end_str}\n")
-                f.write(f"# Exported on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("# Format: [TIMESTAMP] LOG_ENTRY\n")
-                f.write("# Source: Storage Temperature Monitor\n")
-                f.write("=" * 60 + "\n")
-                for log_entry in logs:
-                    f.write(log_entry + "\n")
+            downloads_path = os.path.join(os.path.expanduser("~"), "Downloads", export_name + exporter.extension())
+            header = ("Temperature Logs Export",
+                      range_text,
+                      f"Exported on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                      "Format: [TIMESTAMP] LOG_ENTRY",
+                      "Source: Storage Temperature Monitor")
             
-            print(f"✅ Daily logs stored in: {self.daily_logs_dir}/")
-            print(f"✅ Export file created: {downloads_path}")
-            print(f"✅ Exported {len(logs)} log entries")
-            return True
+            line_progress = None
+            if progress is not None:
+                span = max((end_datetime - start_datetime).total_seconds(), 1)
             
+                def line_progress(entries, line):
+                    line_time = LogTimestampParser.parse_line(line)
+                    fraction = (line_time - start_datetime).total_seconds() / span if line_time else None
+                    progress(fraction, entries)
+            
+            result = exporter.write(lines, downloads_path, header, line_progress, cancel_event)
         except Exception as e:
             print(f"❌ Error exporting logs: {e}")
-            messagebox.showerror("Export Error", f"Failed to export logs: {str(e)}")
-            return False
+            return ExportResult(None, 0, False, str(e))
 
-    def export_logs_to_file_with_time_range(self, start_datetime, end_datetime):
-        """Export logs with time range to .logs file in Downloads folder"""
-        logs = self.get_logs_for_time_range(start_datetime, end_datetime)
-        
-        if not logs:
+        if result.cancelled:
+            print(f"⚠️ Export cancelled after {result.entries} log entries")
+        elif not result.entries:
             print("❌ No logs to export")
-            messagebox.showinfo("No Data", "No logs found to export for the specified time range.")
+        else:
+            print(f"✅ Daily logs stored in: {self.daily_logs_dir}/")
+            print(f"✅ Export file created: {result.path}")
+            print(f"✅ Exported {result.entries} log entries")
+        return result
+
+class LiveTemperatureGraph:
+    """Retained-mode temperature history graph for the main window.
+    
+    The hottest reading is drawn colored by threshold; with more than one storage
+    device each device also gets a thin line of its own, so the drive that is
+    heating up is visible. Artists are created once and updated in place. Each tick only the data artists
+    are redrawn over a cached background (blitting); a full draw happens only when
+    the axis limits move, the window is resized or the theme changes.
+    """
+    THRESHOLD_COLORS = THRESHOLD_COLORS
+    DEVICE_COLORS = ('#8b5cf6', '#10b981', '#06b6d4', '#ec4899', '#f97316', '#64748b')
+    NOTE_TEXT = "Note: Temperatures shown are adjusted for room temperature (not actual device readings)"
+    LAYOUT_RECT = [0, 0.12, 1, 0.95]
+    
+    def __init__(self, fig, ax, canvas, colors, warning_temp=27, critical_temp=30):
+        self.fig = fig
+        self.ax = ax
+        self.canvas = canvas
+        self.colors = colors
+        self.warning_temp = warning_temp
+        self.critical_temp = critical_temp
+        self._background = None
+        self._has_data = None
+        self._rgba = np.array([to_rgba(color) for color in self.THRESHOLD_COLORS])
+        self.device_lines = {}  # device name -> Line2D, only with several devices
+        self.full_draws = 0
+        self.blits = 0
+        
+        self._create_artists()
+        self.apply_theme(colors)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('resize_event', self._on_resize)
+    
+    def _create_artists(self):
+        """Create every artist of the graph once"""
+        ax = self.ax
+        
+        self.segments = LineCollection([], linewidths=2.5, alpha=0.9, animated=True)
+        ax.add_collection(self.segments)
+        self.markers = ax.scatter([], [], s=9, alpha=0.9, zorder=3, animated=True)
+        
+        self.no_data_text = ax.text(0.5, 0.5, 'Collecting temperature data...',
+                                    horizontalalignment='center', verticalalignment='center',
+                                    transform=ax.transAxes, fontsize=11, animated=True,
+                                    bbox=dict(boxstyle="round,pad=0.3"))
+        
+        self.legend_handles = [Line2D([0], [0], color=color, lw=3) for color in self.THRESHOLD_COLORS]
+        self.legend = None
+        self._create_legend()
+        
+        ax.set_ylabel('Temperature (°C)', fontsize=10, fontweight='bold')
+        ax.set_xlabel('Time (Minutes)', fontsize=10, fontweight='bold')
+        ax.set_title('Temperature', fontsize=12, fontweight='bold', pad=20)
+        ax.grid(True, alpha=0.2, linestyle='-')
+        
+        self.note_text = ax.text(0.5, -0.35, self.NOTE_TEXT, transform=ax.transAxes,
+                                 fontsize=8, horizontalalignment='center',
+                                 verticalalignment='top', style='italic')
+    
+    def _create_legend(self):
+        """(Re)build the legend: threshold colors, then one entry per device line"""
+        if self.legend is not None:
+            self.legend.remove()
+        self.legend = self.ax.legend(handles=self.legend_handles + list(self.device_lines.values()),
+                                     labels=self._legend_labels() + list(self.device_lines),
+                                     loc='upper right', fontsize=9, framealpha=0.95)
+    
+    def _sync_device_lines(self, devices):
+        """Add and remove per-device lines; True if the set of lines changed"""
+        names = sorted(devices) if len(devices) > 1 else []
+        if names == list(self.device_lines):
             return False
-        
+        for name in list(self.device_lines):
+            self.device_lines.pop(name).remove()
+        for index, name in enumerate(names):
+            line = Line2D([], [], color=self.DEVICE_COLORS[index % len(self.DEVICE_COLORS)],
+                          lw=1.2, alpha=0.85, linestyle='--', animated=True)
+            self.device_lines[name] = self.ax.add_line(line)
+        self._create_legend()
+        return True
+    
+    def _legend_labels(self):
+        return [f'Normal Temperature (<{self.warning_temp:g}°C)',
+                f'Warning ({self.warning_temp:g}-{self.critical_temp:g}°C)',
+                f'Critical (>{self.critical_temp:g}°C)']
+    
+    def apply_theme(self, colors):
+        """Restyle the retained artists and schedule a new layout"""
+        self.colors = colors
+        for spine in self.ax.spines.values():
+            spine.set_color(colors['border'])
+            spine.set_linewidth(1)
+        self.note_text.set_color(colors['text_secondary'])
+        self.no_data_text.get_bbox_patch().set_facecolor(colors['hover'])
+        self.relayout()
+    
+    def set_thresholds(self, warning_temp, critical_temp):
+        """Change the thresholds used to color the line"""
+        if (warning_temp, critical_temp) == (self.warning_temp, self.critical_temp):
+            return
+        self.warning_temp = warning_temp
+        self.critical_temp = critical_temp
+        for text, label in zip(self.legend.get_texts(), self._legend_labels()):
+            text.set_text(label)
+        self._background = None
+    
+    def relayout(self):
+        """Recompute the figure layout; only needed after a resize or theme change"""
         try:
-            # Create filename with time range for EXPORT file
-            start_str = start_datetime.strftime("%Y-%m-%d_%H-%M")
-            end_str = end_datetime.strftime("%Y-%m-%d_%H-%M")
-            
-            export_filename = f"temperature_export_{start_str}_to_{end_str}.logs"
-            
-            # Export only to Downloads folder
-            downloads_path = os.path.join(os.path.expanduser("~"), "Downloads", export_filename)
-            
-            # Use UTF-8 encoding for export
-            with open(downloads_path, 'w', encoding='utf-8') as f:
-                f.write("# Temperature Logs Export\n")
-                f.write(f"# Time Range: {start_datetime.strftime('%Y-%m-%d %H:%M')} to {end_datetime.strftime('%Y-%m-%d %H:%M')}\n")
-                f.write(f"# Exported on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("# Format: [TIMESTAMP] LOG_ENTRY\n")
-                f.write("# Source: Storage Temperature Monitor\n")
-                f.write("=" * 60 + "\n")
-                for log_entry in logs:
-                    f.write(log_entry + "\n")
-            
-            print(f"✅ Daily logs stored in: {self.daily_logs_dir}/")
-            print(f"✅ Export file created: {downloads_path}")
-            print(f"✅ Exported {len(logs)} log entries")
-            return True
-            
+            self.fig.tight_layout(rect=self.LAYOUT_RECT)
         except Exception as e:
-            print(f"❌ Error exporting logs: {e}")
-            messagebox.showerror("Export Error", f"Failed to export logs: {str(e)}")
-            return False
+            print(f"⚠️ Graph layout error: {e}")
+        self._background = None
+    
+    def update(self, time_history, temp_history, devices=None):
+        """Show the given history, blitting when the axes did not change.
+        
+        time_history is in seconds, temp_history the hottest reading of each sweep and
+        devices an optional {device: temperatures} mapping aligned with time_history.
+        """
+        times = np.fromiter(time_history, dtype=float, count=len(time_history)) / 60
+        temps = np.fromiter(temp_history, dtype=float, count=len(temp_history))
+        devices = devices or {}
+        
+        lines_changed = self._sync_device_lines(devices)
+        for name, line in self.device_lines.items():
+            line.set_data(times, devices[name])
+        
+        has_data = len(temps) > 0
+        self.no_data_text.set_visible(not has_data)
+        
+        runs = threshold_segments(times, temps, self.warning_temp, self.critical_temp)
+        self.segments.set_segments(runs.segments)
+        self.segments.set_color(self._rgba[runs.run_levels])
+        self.markers.set_offsets(np.column_stack([times, temps]))
+        self.markers.set_facecolors(self._rgba[runs.levels])
+        self.markers.set_edgecolors(self._rgba[runs.levels])
+        
+        # The coolest device sets the bottom of the y axis
+        low = min([temps.min()] + [np.nanmin(values) for values in devices.values()]) if has_data else None
+        limits_changed = self._update_limits(times, temps, low)
+        if limits_changed or lines_changed or self._background is None:
+            self.full_draws += 1
+            self.canvas.draw()
+        else:
+            self.blits += 1
+            self.canvas.restore_region(self._background)
+            self._draw_animated()
+            self.canvas.blit(self.fig.bbox)
+    
+    def _update_limits(self, times, temps, low=None):
+        """Move the axis limits only when the data leaves them; True if they changed"""
+        ax = self.ax
+        has_data = len(temps) > 0
+        changed = has_data != self._has_data
+        if changed:
+            self._has_data = has_data
+            if has_data:
+                ax.xaxis.set_major_locator(AutoLocator())
+                ax.yaxis.set_major_locator(AutoLocator())
+            else:
+                ax.set_xticks([])
+                ax.set_yticks([])
+        
+        if not has_data:
+            if changed:
+                ax.set_xlim(0, 1)
+                ax.set_ylim(0, 1)
+            return changed
+        
+        # X: leave headroom on the right so the limits move in steps, not every tick
+        x_min, x_max = ax.get_xlim()
+        first, last = times[0], times[-1]
+        span = max(last - first, 0.5)
+        if changed or last > x_max or first < x_min or first - x_min > span * 0.25:
+            ax.set_xlim(first, last + span * 0.25)
+            changed = True
+        
+        # Y: same padding as before, with hysteresis against shrinking ranges
+        y_min, y_max = ax.get_ylim()
+        low, high = temps.min() if low is None else low, temps.max()
+        padding = max(2, (high - low) * 0.1)
+        target = (max(0, low - padding), high + padding)
+        if changed or low < y_min or high > y_max or (y_max - y_min) > 2 * (target[1] - target[0]):
+            ax.set_ylim(*target)
+            changed = True
+        return changed
+    
+    def _draw_animated(self):
+        for artist in (*self.device_lines.values(), self.segments, self.markers, self.no_data_text):
+            self.ax.draw_artist(artist)
+    
+    def _on_draw(self, event):
+        """Cache the static background after every full draw"""
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+    
+    def _on_resize(self, event):
+        self.relayout()
 
 class TemperatureMonitor:
     def __init__(self, root):
@@ -1621,9 +5526,19 @@ class TemperatureMonitor:
         self.critical_temp = 30  
         self.warning_temp = 27   
         
-        # Temperature history for graphing
-        self.temp_history = deque(maxlen=50)
-        self.time_history = deque(maxlen=50)
+        # Per-device temperature history for the graph and reports; the Tk thread
+        # appends, the email thread reads ("live_history_seconds" setting)
+        self.device_history = DeviceSeriesBuffer()
+        self.monitor_start_time = time.time()
+        
+        # Sampler -> UI pipeline: the monitor thread publishes readings, the Tk
+        # thread renders the newest one at most once per frame
+        self.reading_buffer = ReadingRingBuffer()
+        self.frame_interval_ms = 250
+        self.rendered_seq = 0
+        self.ui_frame_stats = {'rendered': 0, 'coalesced': 0, 'dropped': 0}
+        self.refresh_delay = 2.0
+        self.refresh_requested = threading.Event()
         
         # For email statistics
         self.min_temp = float('inf')
@@ -1631,9 +5546,13 @@ class TemperatureMonitor:
         
         # Storage temperatures storage
         self.storage_temperatures = {}
+        self.latest_snapshot = StorageSnapshot.from_temperatures({})
         
         # Storage temperature reader
         self.temp_reader = StorageTemperatureReader()
+        # Sensor Info queries WMI and the iDRAC, which can take seconds: one reused worker
+        self.sensor_info_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="SensorInfo")
+        self.extra_settings = {}
         
         # Email configuration
         self.email_config = {
@@ -1656,7 +5575,7 @@ class TemperatureMonitor:
         self.start_email_scheduler()
         
         # Start automatic logging when program runs
-        self.log_manager.log_temperature("System", "N/A", "Storage Temperature Monitor started - logging initialized")
+        self.log_manager.log_event(SystemEvent(time.time(), "Storage Temperature Monitor started - logging initialized"))
         
     def setup_background(self):
         """Setup the responsive gradient background"""
@@ -1833,6 +5752,34 @@ class TemperatureMonitor:
                     settings = json.load(f)
                     self.critical_temp = settings.get('critical_temp', 30)
                     self.warning_temp = settings.get('warning_temp', 27)
+                    self.extra_settings = {key: value for key, value in settings.items()
+                                           if key not in ('critical_temp', 'warning_temp')}
+                    
+                    # Optional custom storage keyword list for sensor classification
+                    if settings.get('storage_keywords'):
+                        self.temp_reader.set_storage_keywords(settings['storage_keywords'])
+                    
+                    # Optional iDRAC/Redfish BMC as an extra sensor source
+                    if settings.get('redfish'):
+                        self.temp_reader.sensor_registry.register(RedfishSensorBackend(**settings['redfish']))
+                    
+                    # Samples always go to the sample store (binary segments or SQLite);
+                    # the .logs copy is optional
+                    self.log_manager.set_sample_backend(settings.get('sample_backend', 'binary'))
+                    self.log_manager.text_logs = settings.get('text_logs', True)
+                    
+                    # Log file durability: flush interval in seconds, fsync on every flush
+                    self.log_manager.writer.flush_interval = settings.get('log_flush_interval', 1.0)
+                    self.log_manager.writer.fsync = settings.get('log_fsync', False)
+                    
+                    # Closed days are compressed ("gzip", "zstd" or null to keep them plain);
+                    # retention_days maps "raw", "1m", "1h" and "1d" to days to keep
+                    self.log_manager.log_compression = settings.get('log_compression', 'gzip')
+                    self.log_manager.retention_days = settings.get('retention_days', {})
+                    
+                    # How much per-device history the live graph and reports keep in memory
+                    if settings.get('live_history_seconds'):
+                        self.device_history = DeviceSeriesBuffer(settings['live_history_seconds'])
         except Exception as e:
             print(f"Error loading settings: {e}")
     
@@ -1843,6 +5790,8 @@ class TemperatureMonitor:
                 'critical_temp': self.critical_temp,
                 'warning_temp': self.warning_temp
             }
+            # Keep optional keys (sensor keywords, Redfish, ...) we don't edit in the UI
+            settings.update(self.extra_settings)
             with open('temperature_monitor_settings.json', 'w') as f:
                 json.dump(settings, f, indent=4)
         except Exception as e:
@@ -1996,9 +5945,12 @@ class TemperatureMonitor:
         self.update_graph_theme()
         
         self.fig, self.ax = plt.subplots(figsize=(10, 6))
-        self.fig.tight_layout(pad=4.0)
         self.canvas = FigureCanvasTkAgg(self.fig, master=graph_frame)
         self.canvas.get_tk_widget().grid(row=0, column=0, sticky='nsew')
+        self.live_graph = LiveTemperatureGraph(self.fig, self.ax, self.canvas, self.colors,
+                                               warning_temp=self.warning_temp,
+                                               critical_temp=self.critical_temp)
+        self.update_graph()
         
         # Right column - Controls and Settings (30% width)
         right_column = ttk.Frame(content_frame, style='Modern.TFrame')
@@ -2057,7 +6009,8 @@ class TemperatureMonitor:
                  foreground=self.colors['text_primary'],
                  font=('Segoe UI', 10, 'bold')).grid(row=0, column=0, sticky='w', pady=(0, 8))
         
-        self.refresh_rate_var = tk.StringVar(value="2")
+        self.refresh_rate_var = tk.StringVar(value=f"{self.refresh_delay:g}")
+        self.refresh_rate_var.trace_add('write', self.on_refresh_rate_change)
         refresh_combo = ttk.Combobox(refresh_frame, textvariable=self.refresh_rate_var,
                                 values=["1", "2", "5", "10"], 
                                 width=12,
@@ -2174,13 +6127,17 @@ class TemperatureMonitor:
     
     def show_live_log(self):
         """Show the Live Log window"""
-        LiveLogWindow(self.root, self.log_manager, self.theme_manager, self.responsive_design)
+        LiveLogWindow(self.root, self.log_manager, self.theme_manager, self.responsive_design,
+                      warning_temp=self.warning_temp, critical_temp=self.critical_temp)
     
     def update_sensor_status(self):
         """Update sensor status display"""
         if self.temp_reader.ohm_available:
             status = "✅ Connected"
             color = self.colors['success']
+        elif self.temp_reader.last_snapshot.source:
+            status = f"✅ {self.temp_reader.last_snapshot.source}"
+            color = self.colors['success']
         else:
             status = "❌ Not Available"
             color = self.colors['error']
@@ -2188,8 +6145,15 @@ class TemperatureMonitor:
         self.sensor_status_var.set(status)
     
     def show_sensor_info(self):
-        """Show detailed sensor information"""
-        info = self.temp_reader.get_detailed_sensor_info()
+        """Show detailed sensor information once the worker has gathered it"""
+        future = self.sensor_info_executor.submit(self.temp_reader.get_detailed_sensor_info)
+        future.add_done_callback(lambda done: self.root.after(0, self._show_sensor_info_result, done))
+    
+    def _show_sensor_info_result(self, future):
+        try:
+            info = future.result()
+        except Exception as e:
+            info = f"Error getting sensor info: {e}"
         messagebox.showinfo("Storage Sensor Information", info)
     
     def start_realtime_updates(self):
@@ -2198,6 +6162,40 @@ class TemperatureMonitor:
         self.update_time_display()
         self.monitor_thread = threading.Thread(target=self.monitor_temperature, daemon=True)
         self.monitor_thread.start()
+        self.root.after(self.frame_interval_ms, self.render_frame)
+    
+    def on_refresh_rate_change(self, *args):
+        """Copy the refresh rate out of Tk so the sampler thread never touches Tk variables"""
+        try:
+            self.refresh_delay = max(1, float(self.refresh_rate_var.get()))
+        except ValueError:
+            self.refresh_delay = 2.0
+    
+    def render_frame(self):
+        """Frame loop on the Tk thread: render the newest reading, coalescing any backlog"""
+        frame_start = time.perf_counter()
+        
+        last_seq, readings = self.reading_buffer.since(self.rendered_seq)
+        if readings:
+            # Every reading goes into the history, but only the newest is drawn
+            for reading in readings:
+                if reading.snapshot.has_data:
+                    self.device_history.append(reading.snapshot.timestamp, reading.snapshot.temperatures)
+            self.ui_frame_stats['coalesced'] += (last_seq - self.rendered_seq) - 1
+            
+            latest = readings[-1]
+            self.update_display(latest.snapshot.max_temp, latest.snapshot.avg_temp,
+                                latest.cpu_percent, latest.memory_percent, latest.elapsed)
+            self.rendered_seq = last_seq
+            self.ui_frame_stats['rendered'] += 1
+        
+        # A redraw that overran the budget costs the frames it covered
+        elapsed_ms = (time.perf_counter() - frame_start) * 1000
+        if elapsed_ms > self.frame_interval_ms:
+            self.ui_frame_stats['dropped'] += int(elapsed_ms // self.frame_interval_ms)
+        
+        if self.is_monitoring:
+            self.root.after(max(1, self.frame_interval_ms - int(elapsed_ms)), self.render_frame)
         
     def start_email_scheduler(self):
         """Start the email scheduler thread"""
@@ -2247,7 +6245,7 @@ class TemperatureMonitor:
             print(f"Desktop notification sent: {title}")
             
             # Log the notification
-            self.log_manager.log_temperature("Alert", temp, f"Alert: {title} - {message}")
+            self.log_manager.log_event(AlertEvent(time.time(), title, message, temp))
             
         except Exception as e:
             print(f"Error sending desktop notification: {e}")
@@ -2267,9 +6265,12 @@ class TemperatureMonitor:
             msg['To'] = self.email_config['receiver_email']
             msg['Subject'] = f"Storage Temperature Report - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
             
-            # Get current temperatures
-            current_temps = self.storage_temperatures
-            current_max = self.temp_reader.get_max_storage_temperature()
+            # Use the latest sweep from the monitoring loop instead of querying sensors again
+            snapshot = self.latest_snapshot
+            if not snapshot.has_data:
+                snapshot = self.temp_reader.read_snapshot()
+            current_temps = snapshot.temperatures
+            current_max = snapshot.max_temp
             
             # Prepare actions based on temperature
             actions = []
@@ -2301,6 +6302,37 @@ class TemperatureMonitor:
             # Build email body
             storage_details = "\n".join([f"  - {device}: {temp:.1f}°C" for device, temp in current_temps.items()]) if current_temps else "  No storage temperature data available"
             
+            # Period statistics come from the sample rollups; the in-memory min/max only
+            # cover the time since the app started
+            now = datetime.datetime.now()
+            period_start = now - datetime.timedelta(seconds=self.email_interval)
+            if self.last_email_time:
+                period_start = max(period_start, datetime.datetime.fromtimestamp(self.last_email_time))
+            period = self.log_manager.get_sample_summary(period_start, now)
+            if period:
+                min_temp, max_temp = period['min'], period['max']
+                period_details = f"• Average Temperature: {period['avg']:.1f}°C\n• 95th Percentile: {period['p95']:.1f}°C"
+            else:
+                min_temp = self.min_temp if self.min_temp != float('inf') else None
+                max_temp = self.max_temp if self.max_temp != float('-inf') else None
+                period_details = "• Average Temperature: N/A\n• 95th Percentile: N/A"
+            
+            alerts = self.log_manager.get_events(period_start, now, kinds=(AlertEvent,))
+            period_details += f"\n• Alerts Raised: {len(alerts)}"
+            if alerts:
+                period_details += f" (last: {alerts[-1].title} at {datetime.datetime.fromtimestamp(alerts[-1].timestamp):%H:%M:%S})"
+            
+            daily = self.log_manager.get_sample_summary(now - datetime.timedelta(days=1), now,
+                                                        metric=SampleStore.STORAGE_METRIC, by_device=True)
+            daily_details = "\n".join(f"  - {device}: min {stats['min']:.1f}°C, avg {stats['avg']:.1f}°C, "
+                                      f"p95 {stats['p95']:.1f}°C, max {stats['max']:.1f}°C ({stats['count']} samples)"
+                                      for device, stats in sorted(daily.items()) if stats) or "  No samples in the last 24 hours"
+            
+            # Which drive is heating up right now, from the in-memory per-device history
+            trend_minutes = self.device_history.window_seconds / 60
+            trend_details = "\n".join(f"  - {device}: {latest:.1f}°C ({change:+.1f}°C)"
+                                       for device, (latest, change) in self.device_history.trends().items()) or "  No recent readings"
+            
             body = f"""
 Temperature Monitoring Report
 =====================================
@@ -2312,8 +6344,15 @@ This automated report provides an overview of the current room temperature statu
 Temperature Statistics:
 • Current Temperature: {current_max if current_max else 'N/A':.1f}°C
 • Estimated IDRAC Temperature: {(current_max -2) if current_max else 'N/A':.1f}°C
-• Minimum Temperature: {self.min_temp if self.min_temp != float('inf') else 'N/A':.1f}°C
-• Maximum Temperature: {self.max_temp if self.max_temp != float('-inf') else 'N/A':.1f}°C
+• Minimum Temperature: {f'{min_temp:.1f}°C' if min_temp is not None else 'N/A'}
+• Maximum Temperature: {f'{max_temp:.1f}°C' if max_temp is not None else 'N/A'}
+{period_details}
+
+Storage Devices (last 24 hours):
+{daily_details}
+
+Device Trends (last {trend_minutes:g} minutes):
+{trend_details}
 
 System Status Overview:
 • Warning Threshold: {self.warning_temp}°C
@@ -2343,7 +6382,7 @@ No response is required unless immediate action is indicated above.
             print(f"✅ Email report sent successfully at {datetime.datetime.now().strftime('%H:%M:%S')}")
             
             # Log email sent
-            self.log_manager.log_temperature("Email", current_max if current_max else 0, "Scheduled email report sent")
+            self.log_manager.log_event(EmailEvent(time.time(), True, current_max))
             
             return True
             
@@ -2351,7 +6390,7 @@ No response is required unless immediate action is indicated above.
             print(f"❌ Error sending email: {e}")
             
             # Log email error
-            self.log_manager.log_temperature("Error", 0, f"Failed to send email: {e}")
+            self.log_manager.log_event(EmailEvent(time.time(), False, None, str(e)))
             
             return False
     
@@ -2394,147 +6433,46 @@ No response is required unless immediate action is indicated above.
         pass
     
     def update_graph(self):
-        """Update the temperature history graph with professional design"""
-        self.ax.clear()
-        
-        if len(self.temp_history) > 0:
-            time_minutes = [t/60 for t in self.time_history]
-            
-            # Create colored line segments based on temperature thresholds
-            critical_temp = 30
-            warning_temp = 27
-            
-            if len(time_minutes) > 1:
-                # Create segments for different temperature ranges
-                segments = []
-                current_segment = {'times': [time_minutes[0]], 'temps': [self.temp_history[0]], 'color': self.get_temperature_color(self.temp_history[0], critical_temp, warning_temp)}
-                
-                for i in range(1, len(time_minutes)):
-                    current_color = self.get_temperature_color(self.temp_history[i], critical_temp, warning_temp)
-                    
-                    if current_color == current_segment['color']:
-                        # Continue current segment
-                        current_segment['times'].append(time_minutes[i])
-                        current_segment['temps'].append(self.temp_history[i])
-                    else:
-                        # End current segment and start new one
-                        segments.append(current_segment)
-                        current_segment = {'times': [time_minutes[i]], 'temps': [self.temp_history[i]], 'color': current_color}
-                
-                segments.append(current_segment)
-                
-                # Plot each segment with its respective color
-                for segment in segments:
-                    if len(segment['times']) > 1:
-                        self.ax.plot(segment['times'], segment['temps'], 
-                                    color=segment['color'], 
-                                    linewidth=2.5, 
-                                    marker='o',
-                                    markersize=3,
-                                    alpha=0.9)
-            
-            # Add legend for temperature ranges
-            from matplotlib.lines import Line2D
-            legend_elements = [
-                Line2D([0], [0], color='blue', lw=3, label='Normal Temperature (<27°C)'),
-                Line2D([0], [0], color='yellow', lw=3, label='Warning (27-30°C)'),
-                Line2D([0], [0], color='red', lw=3, label='Critical (>30°C)')
-            ]
-            self.ax.legend(handles=legend_elements, loc='upper right', fontsize=9, framealpha=0.95)
-            
-            # Professional labels and title
-            self.ax.set_ylabel('Temperature (°C)', fontsize=10, fontweight='bold')
-            
-            # X-axis label now clearly visible
-            self.ax.set_xlabel('Time (Minutes)', fontsize=10, fontweight='bold')
-            
-            # Add "Temperature Trend" title
-            self.ax.set_title('Temperature', 
-                            fontsize=12, fontweight='bold', pad=20)
-            
-            # Professional grid
-            self.ax.grid(True, alpha=0.2, linestyle='-')
-            
-            # Set professional y-axis limits
-            if self.temp_history:
-                current_min = min(self.temp_history)
-                current_max = max(self.temp_history)
-                padding = max(2, (current_max - current_min) * 0.1)
-                self.ax.set_ylim(max(0, current_min - padding), current_max + padding)
-            
-            # Professional spine styling
-            for spine in self.ax.spines.values():
-                spine.set_color(self.colors['border'])
-                spine.set_linewidth(1)
-        
-        else:
-            # Professional no-data message
-            self.ax.text(0.5, 0.5, 'Collecting temperature data...', 
-                        horizontalalignment='center', verticalalignment='center',
-                        transform=self.ax.transAxes, fontsize=11,
-                        bbox=dict(boxstyle="round,pad=0.3", facecolor=self.colors['hover']))
-            self.ax.set_xlim(0, 1)
-            self.ax.set_ylim(0, 1)
-            self.ax.set_xticks([])
-            self.ax.set_yticks([])
-        
-        # Moved note further down with more spacing
-        note_text = "Note: Temperatures shown are adjusted for room temperature (not actual device readings)"
-        self.ax.text(0.5, -0.35, note_text, transform=self.ax.transAxes, 
-                    fontsize=8, color=self.colors['text_secondary'],
-                    horizontalalignment='center', verticalalignment='top',
-                    style='italic')
-        
-        # Adjust layout to make more room for the note
-        self.fig.tight_layout(rect=[0, 0.12, 1, 0.95])
-        
-        self.canvas.draw()
-    
-    def get_temperature_color(self, temperature, critical_temp, warning_temp):
-        """Get color based on temperature value"""
-        if temperature >= critical_temp:
-            return 'red'  # Critical
-        elif temperature >= warning_temp:
-            return 'yellow'  # Warning
-        else:
-            return 'blue'  # Normal
+        """Update the temperature history graph (retained artists, blitted)"""
+        if hasattr(self, 'live_graph'):
+            timestamps, devices = self.device_history.window()
+            self.live_graph.update(timestamps - self.monitor_start_time,
+                                   DeviceSeriesBuffer.maxima(devices, len(timestamps)), devices)
     
     def monitor_temperature(self):
         """Main monitoring loop"""
-        start_time = time.time()
+        start_time = self.monitor_start_time = time.time()
         
         while self.is_monitoring:
+            tick_start = time.monotonic()
             try:
-                # Get all storage temperatures
-                self.storage_temperatures = self.temp_reader.get_storage_temperatures()
-                max_temp = self.temp_reader.get_max_storage_temperature()
-                avg_temp = self.temp_reader.get_average_storage_temperature()
+                # Get all storage temperatures from a single sensor sweep
+                snapshot = self.temp_reader.read_snapshot()
+                self.latest_snapshot = snapshot
+                self.storage_temperatures = dict(snapshot.temperatures)
+                max_temp = snapshot.max_temp
+                avg_temp = snapshot.avg_temp
                 cpu_percent, memory_percent = self.get_system_info()
                 
+                current_time = time.time() - start_time
+                
+                # Publish for the UI frame loop; the sampler never waits on Tk
+                self.reading_buffer.push(MonitorReading(snapshot, cpu_percent, memory_percent, current_time))
+                
                 if max_temp is not None:
-                    current_time = time.time() - start_time
-                    
                     # Update min/max for email reports
                     if max_temp < self.min_temp:
                         self.min_temp = max_temp
                     if max_temp > self.max_temp:
                         self.max_temp = max_temp
                     
-                    # Update display immediately
-                    self.root.after(0, self.update_display, max_temp, avg_temp, cpu_percent, memory_percent, current_time)
-                    
-                    # Update history with max temperature
-                    self.temp_history.append(max_temp)
-                    self.time_history.append(current_time)
-                    
                     # Log temperature data persistently
                     if avg_temp is not None:
-                        self.log_manager.log_temperature("Average Temperature", avg_temp)
+                        self.log_manager.log_event(SampleEvent(time.time(), "Average Temperature", avg_temp))
                     if max_temp is not None:
-                        self.log_manager.log_temperature("Max Temperature", max_temp)
+                        self.log_manager.log_event(SampleEvent(time.time(), "Max Temperature", max_temp))
                     if self.storage_temperatures:
-                        storage_details = ", ".join([f"{device}: {temp:.1f}°C" for device, temp in self.storage_temperatures.items()])
-                        self.log_manager.log_temperature("Storage Details", 0, f"Storage temperatures: {storage_details}")
+                        self.log_manager.log_storage_temperatures(self.storage_temperatures)
                     
                     # Check for alerts only if alert monitoring is active
                     if self.alert_monitoring_active:
@@ -2558,26 +6496,19 @@ No response is required unless immediate action is indicated above.
                                               max_temp)
                                 self.last_warning_time = current_absolute_time
                 else:
-                    # No temperature data available
-                    current_time = time.time() - start_time
-                    self.root.after(0, self.update_display, None, None, None, None, current_time)
-                    
                     # Log sensor unavailability
-                    self.log_manager.log_temperature("Error", 0, "No temperature data available from sensors")
+                    self.log_manager.log_event(SystemEvent(time.time(), "No temperature data available from sensors", True))
                 
-                # Get refresh rate from UI
-                try:
-                    refresh_delay = max(1, float(self.refresh_rate_var.get()))
-                except:
-                    refresh_delay = 2
-                    
-                time.sleep(refresh_delay)
+                # Keep a steady cadence; "Refresh Now" wakes the sampler early
+                remaining = self.refresh_delay - (time.monotonic() - tick_start)
+                if self.refresh_requested.wait(max(0, remaining)):
+                    self.refresh_requested.clear()
                 
             except Exception as e:
                 print(f"Monitoring error: {e}")
                 
                 # Log monitoring errors
-                self.log_manager.log_temperature("Error", 0, f"Monitoring error: {e}")
+                self.log_manager.log_event(SystemEvent(time.time(), f"Monitoring error: {e}", True))
                 
                 time.sleep(5)
     
@@ -2621,7 +6552,11 @@ No response is required unless immediate action is indicated above.
         self.status_var.set(status_text)
         
         update_time = datetime.datetime.now().strftime("%H:%M:%S")
-        self.last_update_var.set(f"Updated: {update_time}")
+        stats = self.ui_frame_stats
+        if stats['coalesced'] or stats['dropped']:
+            self.last_update_var.set(f"Updated: {update_time} | UI frames coalesced: {stats['coalesced']}, dropped: {stats['dropped']}")
+        else:
+            self.last_update_var.set(f"Updated: {update_time}")
         
         self.update_graph()
     
@@ -2632,7 +6567,7 @@ No response is required unless immediate action is indicated above.
         self.stop_button.config(state="normal")
         
         # Log alert status change
-        self.log_manager.log_temperature("System", 0, "Alert monitoring enabled")
+        self.log_manager.log_event(SystemEvent(time.time(), "Alert monitoring enabled"))
         
         messagebox.showinfo("Alerts Enabled", "Storage temperature alert monitoring is now active!\n\nYou will receive notifications when storage temperatures exceed thresholds.")
     
@@ -2643,19 +6578,15 @@ No response is required unless immediate action is indicated above.
         self.stop_button.config(state="disabled")
         
         # Log alert status change
-        self.log_manager.log_temperature("System", 0, "Alert monitoring disabled")
+        self.log_manager.log_event(SystemEvent(time.time(), "Alert monitoring disabled"))
         
         messagebox.showinfo("Alerts Disabled", "Storage temperature alert monitoring is now inactive.")
     
     def manual_refresh(self):
         """Force an immediate temperature refresh"""
-        self.storage_temperatures = self.temp_reader.get_storage_temperatures()
-        max_temp = self.temp_reader.get_max_storage_temperature()
-        avg_temp = self.temp_reader.get_average_storage_temperature()
-        cpu_percent, memory_percent = self.get_system_info()
-        if max_temp is not None:
-            self.update_display(max_temp, avg_temp, cpu_percent, memory_percent, 
-                              len(self.time_history) * float(self.refresh_rate_var.get()))
+        # Wake the sampler instead of reading sensors on the Tk thread; the next
+        # frame picks the new reading up from the ring buffer
+        self.refresh_requested.set()
     
     def update_settings(self):
         """Update temperature threshold settings"""
@@ -2670,9 +6601,11 @@ No response is required unless immediate action is indicated above.
             self.warning_temp = new_warning
             self.critical_temp = new_critical
             self.save_settings()
+            self.live_graph.set_thresholds(new_warning, new_critical)
+            self.update_graph()
             
             # Log settings change
-            self.log_manager.log_temperature("System", 0, f"Settings updated: Warning={new_warning}°C, Critical={new_critical}°C")
+            self.log_manager.log_event(SystemEvent(time.time(), f"Settings updated: Warning={new_warning}°C, Critical={new_critical}°C"))
             
             messagebox.showinfo("Success", "Temperature settings updated successfully")
             
@@ -2684,24 +6617,83 @@ No response is required unless immediate action is indicated above.
         self.is_monitoring = False
         
         # Log application shutdown
-        self.log_manager.log_temperature("System", "N/A", "Storage Temperature Monitor shutting down")
+        self.log_manager.log_event(SystemEvent(time.time(), "Storage Temperature Monitor shutting down"))
+        self.log_manager.close()
+        self.sensor_info_executor.shutdown(wait=False)
         
         self.save_settings()
         self.root.destroy()
 
 def main():
+    parser = argparse.ArgumentParser(description="Storage Temperature Monitor")
+    parser.add_argument('--convert-logs', action='store_true',
+                        help='import the existing "Daily logs" .logs files into the binary sample store and exit')
+    parser.add_argument('--rebuild-index', action='store_true',
+                        help='write time index sidecars for existing .logs files and exit')
+    parser.add_argument('--rebuild-rollups', action='store_true',
+                        help='recompute the 1m/1h/1d sample rollups from the binary sample store and exit')
+    parser.add_argument('--compact-logs', choices=sorted(LogArchive.SUFFIXES), nargs='?', const='gzip',
+                        help='archive the .logs files of closed days now (gzip by default) and exit')
+    parser.add_argument('--sample-backend', choices=sorted(LogManager.SAMPLE_BACKENDS), default='binary',
+                        help='sample store used by --convert-logs and --rebuild-rollups (default: binary)')
+    parser.add_argument('--tail', action='store_true',
+                        help="follow today's log file in the console (like tail -f)")
+    args = parser.parse_args()
+    
+    if args.convert_logs:
+        log_manager = LogManager(args.sample_backend)
+        log_manager.convert_text_logs()
+        log_manager.close()
+        return
+    
+    if args.rebuild_index:
+        LogManager().rebuild_time_indexes()
+        return
+    
+    if args.compact_logs:
+        log_manager = LogManager(args.sample_backend)
+        log_manager.compact_logs(args.compact_logs, min_age=0)
+        log_manager.close()
+        return
+    
+    if args.rebuild_rollups:
+        log_manager = LogManager(args.sample_backend)
+        log_manager.rebuild_rollups()
+        log_manager.close()
+        return
+    
+    if args.tail:
+        # Follows the files another process writes; the app's own windows use log_buffer
+        log_manager = LogManager()
+        tailer = LogFileTailer(log_manager.get_log_file, log_manager.daily_logs_dir)
+        for line in tailer.read_new()[-20:]:
+            print(line)
+        try:
+            while True:
+                tailer.wait(5)
+                for line in tailer.read_new():
+                    print(line, flush=True)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            tailer.close()
+            log_manager.close()
+        return
+    
     # Check dependencies
     try:
         import psutil
         from plyer import notification
-        # Try to import WMI (required)
+        # Try to import WMI (required on Windows, Linux uses sysfs/psutil sensors)
         try:
             import wmi
             print("✅ WMI support available")
         except ImportError:
-            print("❌ WMI not available - install with: pip install wmi")
-            messagebox.showerror("Missing Dependency", "WMI is required for this application.\n\nPlease install it with: pip install wmi")
-            return
+            if os.name == 'nt':
+                print("❌ WMI not available - install with: pip install wmi")
+                messagebox.showerror("Missing Dependency", "WMI is required for this application.\n\nPlease install it with: pip install wmi")
+                return
+            print("ℹ️ WMI not available - using Linux sensor backends")
             
     except ImportError as e:
         print(f"Missing dependency: {e}")